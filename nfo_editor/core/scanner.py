@@ -8,6 +8,7 @@ Author: NFO Editor Team
 """
 
 import os
+import re
 import fnmatch
 from typing import List, Union, Iterator, Optional, Set, Callable
 from pathlib import Path
@@ -16,7 +17,11 @@ from dataclasses import dataclass, field
 from ..utils.exceptions import NFOAccessError
 
 
-@dataclass
+# Characters that make an exclude pattern a glob rather than a literal name
+_GLOB_CHARS = frozenset('*?[')
+
+
+@dataclass(slots=True)
 class ScanResult:
     """
     Result of a directory scan operation.
@@ -88,6 +93,52 @@ class NFOScanner:
             '.git',         # Git directory
             '.svn',         # SVN directory
         }
+        
+        # Matchers derived from default_extensions, exclude_patterns and
+        # case_sensitive
+        self._matcher_key: Optional[tuple] = None
+        self._extensions: frozenset[str] = frozenset()
+        self._extensions_lower: frozenset[str] = frozenset()
+        self._literal_excludes: frozenset[str] = frozenset()
+        self._glob_exclude_re: Optional[re.Pattern[str]] = None
+        self._refresh_matchers()
+    
+    def _refresh_matchers(self) -> None:
+        """
+        Rebuild the extension and exclude matchers if their settings changed.
+        
+        default_extensions, exclude_patterns and case_sensitive are public
+        and may be reassigned or modified in place, so each scan checks a
+        snapshot of them before it starts.
+        """
+        key = (
+            frozenset(self.default_extensions),
+            frozenset(self.exclude_patterns),
+            self.case_sensitive
+        )
+        if key == self._matcher_key:
+            return
+        
+        self._extensions = key[0]
+        self._extensions_lower = frozenset(ext.lower() for ext in key[0])
+        
+        # Split exclude patterns into plain names (set lookup) and globs
+        # (one combined regex) so the common case never touches fnmatch
+        literals = {p for p in self.exclude_patterns if not _GLOB_CHARS.intersection(p)}
+        globs = [p for p in self.exclude_patterns if p not in literals]
+        
+        if not self.case_sensitive:
+            literals = {p.lower() for p in literals}
+        
+        self._literal_excludes = frozenset(literals)
+        self._glob_exclude_re = (
+            re.compile(
+                '|'.join(fnmatch.translate(p) for p in globs),
+                0 if self.case_sensitive else re.IGNORECASE
+            )
+            if globs else None
+        )
+        self._matcher_key = key
     
     def scan_directories(
         self, 
@@ -114,6 +165,9 @@ class NFOScanner:
         start_time = time.time()
         result = ScanResult(filter_pattern=pattern)
         
+        # Pick up any changes to the matching settings since the last scan
+        self._refresh_matchers()
+        
         # Normalize input to list of Path objects
         if isinstance(directories, (str, Path)):
             directories = [directories]
@@ -169,23 +223,31 @@ class NFOScanner:
             
             result.directories_scanned += 1
             
+            # Hoist attribute lookups out of the per-entry loop
+            nfo_append = result.nfo_files.append
+            errors_append = result.errors.append
+            is_nfo = self._is_nfo_file
+            should_exclude = self._should_exclude
+            skip_symlinks = not self.follow_symlinks
+            files_scanned = 0
+            
             # Iterate through directory contents
             for entry in directory.iterdir():
                 try:
                     # Skip if matches exclude patterns
-                    if self._should_exclude(entry):
+                    if should_exclude(entry):
                         continue
                     
                     # Handle symbolic links
-                    if entry.is_symlink() and not self.follow_symlinks:
+                    if skip_symlinks and entry.is_symlink():
                         continue
                     
                     if entry.is_file():
-                        result.total_files_scanned += 1
+                        files_scanned += 1
                         
                         # Check if this is an NFO file
-                        if self._is_nfo_file(entry, pattern, custom_filter):
-                            result.nfo_files.append(entry)
+                        if is_nfo(entry, pattern, custom_filter):
+                            nfo_append(entry)
                     
                     elif entry.is_dir():
                         # Recursively scan subdirectory
@@ -194,9 +256,11 @@ class NFOScanner:
                         )
                 
                 except PermissionError:
-                    result.errors.append(f"Permission denied: {entry}")
+                    errors_append(f"Permission denied: {entry}")
                 except Exception as e:
-                    result.errors.append(f"Error processing {entry}: {str(e)}")
+                    errors_append(f"Error processing {entry}: {str(e)}")
+            
+            result.total_files_scanned += files_scanned
         
         except PermissionError:
             result.errors.append(f"Permission denied accessing directory: {directory}")
@@ -220,17 +284,20 @@ class NFOScanner:
         Returns:
             True if the file should be processed as an NFO file
         """
+        name = file_path.name
+        
         # Check file extension
-        if not self._has_nfo_extension(file_path):
+        if not self._has_nfo_extension(name):
             return False
         
         # Apply glob pattern if specified
         if pattern is not None:
-            if not fnmatch.fnmatch(
-                file_path.name, 
-                pattern, 
-                fnmatch.FNM_CASEFOLD if not self.case_sensitive else 0
-            ):
+            if self.case_sensitive:
+                matched = fnmatch.fnmatchcase(name, pattern)
+            else:
+                matched = fnmatch.fnmatchcase(name.lower(), pattern.lower())
+            
+            if not matched:
                 return False
         
         # Apply custom filter if specified
@@ -244,22 +311,27 @@ class NFOScanner:
         
         return True
     
-    def _has_nfo_extension(self, file_path: Path) -> bool:
+    def _has_nfo_extension(self, name: str) -> bool:
         """
-        Check if a file has an NFO-related extension.
+        Check if a file name has an NFO-related extension.
         
         Args:
-            file_path: Path to check
+            name: File name to check
             
         Returns:
             True if file has a relevant extension
         """
-        extension = file_path.suffix
+        # Same extension as PurePath.suffix: from the last dot, unless the
+        # name starts or ends with it (hidden files such as ".nfo" have none)
+        dot = name.rfind('.')
+        if dot <= 0 or dot == len(name) - 1:
+            return False
+        extension = name[dot:]
         
         if self.case_sensitive:
-            return extension in self.default_extensions
+            return extension in self._extensions
         else:
-            return extension.lower() in {ext.lower() for ext in self.default_extensions}
+            return extension.lower() in self._extensions_lower
     
     def _should_exclude(self, path: Path) -> bool:
         """
@@ -273,14 +345,13 @@ class NFOScanner:
         """
         name = path.name
         
-        for pattern in self.exclude_patterns:
-            # Handle glob patterns
-            if fnmatch.fnmatch(
-                name, 
-                pattern, 
-                fnmatch.FNM_CASEFOLD if not self.case_sensitive else 0
-            ):
-                return True
+        # Fast path for literal names such as .git or __pycache__
+        if (name if self.case_sensitive else name.lower()) in self._literal_excludes:
+            return True
+        
+        # Handle glob patterns
+        if self._glob_exclude_re is not None:
+            return self._glob_exclude_re.match(name) is not None
         
         return False
     
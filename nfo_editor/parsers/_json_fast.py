@@ -0,0 +1,138 @@
+"""
+Optional Numba-accelerated helpers for the JSON parser.
+
+The kernels in this module operate on UTF-8 byte buffers and are only
+compiled when numba and numpy are installed. Callers should use the
+``get_*`` accessors, which return None when acceleration is unavailable so
+that the pure-Python/regex path can be used instead.
+
+Author: NFO Editor Team
+"""
+
+from typing import Any, Callable, Optional, Union
+
+
+# Compiled kernel cache: None until first use, False if numba is unavailable
+_jit_strip_comments: Any = None
+
+
+def _strip_comments_kernel(buf: Any, out: Any) -> int:
+    """
+    Copy JSON bytes from buf to out with comments removed.
+    
+    String literals are copied verbatim, line comments are dropped up to
+    (not including) the newline, and block comments are replaced by spaces
+    with their newlines kept. Unterminated block comments are left as text.
+    
+    Args:
+        buf: Input uint8 array
+        out: Output uint8 array at least as long as buf
+    
+    Returns:
+        Number of bytes written to out
+    """
+    n = buf.shape[0]
+    i = 0
+    j = 0
+    block_end_found = True
+    
+    while i < n:
+        c = buf[i]
+        
+        if c == 34:  # '"' starts a string literal
+            out[j] = c
+            j += 1
+            i += 1
+            while i < n:
+                c = buf[i]
+                out[j] = c
+                j += 1
+                i += 1
+                if c == 92:  # backslash escapes the next byte
+                    if i < n and buf[i] != 10:
+                        out[j] = buf[i]
+                        j += 1
+                        i += 1
+                    else:
+                        # A backslash cannot escape a newline; the string
+                        # literal ends here, as it does for the regex path
+                        break
+                elif c == 34:
+                    break
+        
+        elif c == 47 and i + 1 < n and buf[i + 1] == 47:  # '//'
+            i += 2
+            while i < n and buf[i] != 10:
+                i += 1
+        
+        elif c == 47 and i + 1 < n and buf[i + 1] == 42 and block_end_found:  # '/*'
+            k = i + 2
+            while k + 1 < n and not (buf[k] == 42 and buf[k + 1] == 47):
+                k += 1
+            
+            if k + 1 >= n:
+                # Unterminated: no later '/*' can close either, so treat
+                # this and every following '/*' as plain text
+                block_end_found = False
+                out[j] = c
+                j += 1
+                i += 1
+            else:
+                end = k + 2
+                while i < end:
+                    out[j] = 10 if buf[i] == 10 else 32
+                    j += 1
+                    i += 1
+        
+        else:
+            out[j] = c
+            j += 1
+            i += 1
+    
+    return j
+
+
+def get_jit_strip_comments() -> Optional[Callable[[Union[str, bytes, memoryview]], Union[str, bytes]]]:
+    """
+    Get the Numba-compiled comment stripper, compiling it on first use.
+    
+    The returned function maps text to text and UTF-8 bytes/buffers to
+    bytes, so byte input is never decoded to str and re-encoded.
+    
+    Returns:
+        Function removing comments from JSON content, or None if
+        numba/numpy are not installed or compilation failed
+    """
+    global _jit_strip_comments
+    
+    if _jit_strip_comments is None:
+        try:
+            import numba
+            import numpy as np
+        except ImportError:
+            _jit_strip_comments = False
+            return None
+        
+        kernel = numba.njit(cache=True)(_strip_comments_kernel)
+        
+        def strip_comments(content: Union[str, bytes, memoryview]) -> Union[str, bytes]:
+            is_text = isinstance(content, str)
+            buf = np.frombuffer(
+                content.encode('utf-8') if is_text else content, dtype=np.uint8
+            )
+            # Comments only shrink the content, so one buffer of the input
+            # size holds the result
+            out = np.empty(buf.shape[0], dtype=np.uint8)
+            length = kernel(buf, out)
+            result = out[:length].tobytes()
+            return result.decode('utf-8') if is_text else result
+        
+        _jit_strip_comments = strip_comments
+    
+    return _jit_strip_comments or None
+
+
+def disable_jit_strip_comments() -> None:
+    """Stop using the compiled comment stripper (e.g. after a compile failure)."""
+    global _jit_strip_comments
+    _jit_strip_comments = False
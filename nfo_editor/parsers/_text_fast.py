@@ -0,0 +1,137 @@
+"""
+Optional Numba-accelerated helpers for the text parser.
+
+The kernels in this module operate on UTF-8 byte buffers and are only
+compiled when numba and numpy are installed. Callers should use the
+``get_*`` accessors, which return None when acceleration is unavailable so
+that the regex path can be used instead.
+
+Author: NFO Editor Team
+"""
+
+from typing import Any, Callable, Optional, Tuple
+
+
+# Compiled kernel cache: None until first use, False if numba is unavailable
+_jit_tally_structure: Any = None
+
+# Order of the counts produced by the structure tally kernel
+STRUCTURE_KINDS = ('ini', 'header', 'dash', 'colon', 'equals', 'pipe', 'tab')
+
+
+def _tally_structure_kernel(buf: Any, counts: Any) -> None:
+    """
+    Classify each line of buf the way the text parser's structure regex does.
+    
+    Every line is counted under the first matching kind, in STRUCTURE_KINDS
+    order: [ini] headers, === headers ===, --- headers ---, then lines whose
+    first ':', '=', '|' or tab delimiter is preceded by a key.
+    
+    Args:
+        buf: Input uint8 array
+        counts: int64 array of len(STRUCTURE_KINDS), incremented in place
+    """
+    n = buf.shape[0]
+    start = 0
+    
+    while start <= n:
+        end = start
+        while end < n and buf[end] != 10:
+            end += 1
+        
+        if end > start:
+            first = buf[start]
+            last = buf[end - 1]
+            kind = -1
+            
+            # [section]: no ']' before the closing bracket
+            if first == 91 and last == 93 and end - start >= 3:
+                kind = 0
+                for k in range(start + 1, end - 1):
+                    if buf[k] == 93:
+                        kind = -1
+                        break
+            
+            # === section === / --- section ---: a run of the marker on both
+            # ends around a non-empty middle that does not contain it
+            if kind < 0 and (first == 61 or first == 45) and last == first:
+                i = start
+                while i < end and buf[i] == first:
+                    i += 1
+                j = end
+                while j > i and buf[j - 1] == first:
+                    j -= 1
+                if j > i:
+                    kind = 1 if first == 61 else 2
+                    for k in range(i, j):
+                        if buf[k] == first:
+                            kind = -1
+                            break
+            
+            # key<delimiter>: the delimiter occurs, but not as the first byte
+            if kind < 0:
+                has_colon = False
+                has_equals = False
+                has_pipe = False
+                has_tab = False
+                for k in range(start, end):
+                    c = buf[k]
+                    if c == 58:
+                        has_colon = True
+                    elif c == 61:
+                        has_equals = True
+                    elif c == 124:
+                        has_pipe = True
+                    elif c == 9:
+                        has_tab = True
+                
+                if has_colon and first != 58:
+                    kind = 3
+                elif has_equals and first != 61:
+                    kind = 4
+                elif has_pipe and first != 124:
+                    kind = 5
+                elif has_tab and first != 9:
+                    kind = 6
+            
+            if kind >= 0:
+                counts[kind] += 1
+        
+        start = end + 1
+
+
+def get_jit_tally_structure() -> Optional[Callable[[str], Tuple[int, ...]]]:
+    """
+    Get the Numba-compiled structure tally, compiling it on first use.
+    
+    Returns:
+        Function mapping text to per-kind line counts in STRUCTURE_KINDS
+        order, or None if numba/numpy are not installed
+    """
+    global _jit_tally_structure
+    
+    if _jit_tally_structure is None:
+        try:
+            import numba
+            import numpy as np
+        except ImportError:
+            _jit_tally_structure = False
+            return None
+        
+        kernel = numba.njit(cache=True)(_tally_structure_kernel)
+        
+        def tally_structure(content: str) -> Tuple[int, ...]:
+            buf = np.frombuffer(content.encode('utf-8'), dtype=np.uint8)
+            counts = np.zeros(len(STRUCTURE_KINDS), dtype=np.int64)
+            kernel(buf, counts)
+            return tuple(int(count) for count in counts)
+        
+        _jit_tally_structure = tally_structure
+    
+    return _jit_tally_structure or None
+
+
+def disable_jit_tally_structure() -> None:
+    """Stop using the compiled structure tally (e.g. after a compile failure)."""
+    global _jit_tally_structure
+    _jit_tally_structure = False
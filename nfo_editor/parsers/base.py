@@ -7,15 +7,17 @@ along with the NFOData class that represents parsed NFO file content.
 Author: NFO Editor Team
 """
 
+import os
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Union, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Any, Optional, Union, List, Iterable
 from pathlib import Path
 from dataclasses import dataclass, field
 
 from ..utils.exceptions import NFOParseError, NFOFieldError
 
 
-@dataclass
+@dataclass(slots=True)
 class NFOData:
     """
     Data structure representing parsed NFO file content.
@@ -191,18 +193,22 @@ class NFOData:
         Returns:
             Dictionary with all fields using dot notation for nested keys
         """
-        def _flatten_dict(d: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
-            """Recursively flatten nested dictionaries."""
-            result = {}
-            for key, value in d.items():
+        flat: Dict[str, Any] = {}
+        stack = [("", iter(self.data.items()))]
+        
+        # Depth-first walk that keeps the original key order
+        while stack:
+            prefix, items = stack[-1]
+            for key, value in items:
                 new_key = f"{prefix}.{key}" if prefix else key
                 if isinstance(value, dict):
-                    result.update(_flatten_dict(value, new_key))
-                else:
-                    result[new_key] = value
-            return result
+                    stack.append((new_key, iter(value.items())))
+                    break
+                flat[new_key] = value
+            else:
+                stack.pop()
         
-        return _flatten_dict(self.data)
+        return flat
     
     def update_fields(self, field_updates: Dict[str, Any]) -> None:
         """
@@ -231,9 +237,19 @@ class BaseNFOParser(ABC):
         format_name (str): Human-readable name of the format
     """
     
+    # Empty so that subclasses may declare __slots__ of their own
+    __slots__ = ()
+    
     supported_extensions: List[str] = []
     format_name: str = "Unknown"
     
+    # Lowercased supported_extensions, rebuilt for every subclass
+    _supported_ext_set: frozenset = frozenset()
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._supported_ext_set = frozenset(ext.lower() for ext in cls.supported_extensions)
+    
     @abstractmethod
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """
@@ -264,6 +280,71 @@ class BaseNFOParser(ABC):
         """
         pass
     
+    def parse_many(
+        self,
+        file_paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+        chunksize: int = 32
+    ) -> List[NFOData]:
+        """
+        Parse many NFO files in parallel worker processes.
+        
+        The parser is pickled once per worker, so optional accelerators
+        (fast JSON decoders, compiled kernels) are loaded once per process
+        rather than once per file.
+        
+        Args:
+            file_paths: Paths of the NFO files to parse
+            workers: Number of worker processes (defaults to the CPU count)
+            chunksize: Number of files sent to a worker at a time
+            
+        Returns:
+            List of NFOData objects in the same order as file_paths
+            
+        Raises:
+            NFOParseError: If parsing any file fails
+            NFOAccessError: If any file cannot be read
+        """
+        paths = list(file_paths)
+        
+        # A pool is not worth starting for a single file
+        if len(paths) <= 1:
+            return [self.parse(path) for path in paths]
+        
+        max_workers = min(workers or os.cpu_count() or 1, len(paths))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.parse, paths, chunksize=chunksize))
+    
+    def parse_many_threaded(
+        self,
+        file_paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None
+    ) -> List[NFOData]:
+        """
+        Parse many NFO files in a thread pool within this process.
+        
+        Suited to many small files where reading dominates, since it avoids
+        process start-up and pickling of results.
+        
+        Args:
+            file_paths: Paths of the NFO files to parse
+            workers: Number of worker threads (defaults to the executor default)
+            
+        Returns:
+            List of NFOData objects in the same order as file_paths
+            
+        Raises:
+            NFOParseError: If parsing any file fails
+            NFOAccessError: If any file cannot be read
+        """
+        paths = list(file_paths)
+        
+        if len(paths) <= 1:
+            return [self.parse(path) for path in paths]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.parse, paths))
+    
     def _detect_encoding(self, file_path: Union[str, Path]) -> str:
         """
         Detect the character encoding of a file.
@@ -274,12 +355,29 @@ class BaseNFOParser(ABC):
         Returns:
             Detected encoding string
         """
-        import chardet
-        
         try:
             with open(file_path, 'rb') as f:
                 raw_data = f.read()
                 
+            return self._detect_bytes_encoding(raw_data)
+            
+        except Exception:
+            # Fall back to utf-8 if detection fails
+            return 'utf-8'
+    
+    def _detect_bytes_encoding(self, raw_data: bytes) -> str:
+        """
+        Detect the character encoding of raw file content.
+        
+        Args:
+            raw_data: Raw bytes to analyze
+            
+        Returns:
+            Detected encoding string
+        """
+        import chardet
+        
+        try:
             result = chardet.detect(raw_data)
             return result.get('encoding', 'utf-8') or 'utf-8'
             
@@ -287,6 +385,33 @@ class BaseNFOParser(ABC):
             # Fall back to utf-8 if detection fails
             return 'utf-8'
     
+    def _read_file_bytes(self, file_path: Union[str, Path]) -> bytes:
+        """
+        Read raw file content without decoding it.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            File content as bytes
+            
+        Raises:
+            NFOAccessError: If file cannot be read
+        """
+        from ..utils.exceptions import NFOAccessError
+        
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read()
+                
+        except IOError as e:
+            raise NFOAccessError(
+                f"Cannot read file: {str(e)}",
+                file_path=str(file_path),
+                access_mode="read",
+                system_error=str(e)
+            ) from e
+    
     def _read_file_content(self, file_path: Union[str, Path], encoding: str = None) -> str:
         """
         Read file content with proper encoding handling.
@@ -8,13 +8,85 @@ handles various JSON structures and converts them to the unified NFOData format.
 Author: NFO Editor Team
 """
 
+import re
+import sys
 import json
-from typing import Union, Dict, Any, Optional, List
+import mmap
+from collections import deque
+from typing import Union, Dict, Any, Optional, List, Tuple, Sequence
 from pathlib import Path
 
 from .base import BaseNFOParser, NFOData
+from ._json_fast import get_jit_strip_comments, disable_jit_strip_comments
 from ..utils.exceptions import NFOParseError, NFOAccessError
 
+# Prefer a faster C decoder when one is installed
+try:
+    import orjson
+    _fast_loads = orjson.loads
+    FAST_JSON_DECODER = "orjson"
+except ImportError:
+    try:
+        import ujson
+        _fast_loads = ujson.loads
+        FAST_JSON_DECODER = "ujson"
+    except ImportError:
+        _fast_loads = None
+        FAST_JSON_DECODER = None
+
+
+# Encodings whose bytes can be handed to the JSON decoder without decoding
+_UTF8_ENCODINGS = frozenset({'utf-8', 'utf8', 'utf-8-sig', 'ascii'})
+
+# Bytes inspected for encoding detection on memory-mapped files
+_ENCODING_SAMPLE_SIZE = 65536
+
+# Bytes read by can_parse to probe for JSON structure
+_PROBE_SIZE = 65536
+
+# Byte order marks, mapped to the codec used to decode the probe; the UTF-32
+# marks come first as the UTF-16-LE mark is a prefix of the UTF-32-LE one
+_BOM_CODECS = (
+    (b'\xef\xbb\xbf', 'utf-8'),
+    (b'\xff\xfe\x00\x00', 'utf-32-le'),
+    (b'\x00\x00\xfe\xff', 'utf-32-be'),
+    (b'\xff\xfe', 'utf-16-le'),
+    (b'\xfe\xff', 'utf-16-be'),
+)
+
+# Bytes a complete JSON object/array document can end with
+_JSON_END_BYTES = frozenset(b'}]')
+
+# Content length from which the Numba comment stripper is used if installed
+_JIT_STRIP_MIN_SIZE = 1_048_576
+
+
+def _json_loads(content: Union[str, bytes, memoryview]) -> Any:
+    """
+    Decode JSON using the fastest available decoder.
+    
+    If the fast decoder rejects the input, the stdlib decoder is tried so
+    that its extensions (NaN, big integers) keep working and any error is
+    raised as json.JSONDecodeError with line and column information.
+    
+    Args:
+        content: JSON document as text or UTF-8 bytes/buffer
+        
+    Returns:
+        Decoded JSON data
+        
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(content)
+        except ValueError:
+            pass
+    if isinstance(content, memoryview):
+        content = content.tobytes()
+    return json.loads(content)
+
 
 class JSONNFOParser(BaseNFOParser):
     """
@@ -29,15 +101,62 @@ class JSONNFOParser(BaseNFOParser):
         format_name (str): Human-readable name of the format
         strict_mode (bool): Whether to enforce strict JSON parsing
         allow_comments (bool): Whether to allow JSON with comments (JSON5 style)
+        mmap_threshold (int): File size in bytes above which files are memory-mapped
     """
     
     supported_extensions = ['.json', '.nfo']
     format_name = "JSON"
     
+    # String literal | line comment | block comment; strings are matched
+    # first so comment markers inside them are left untouched
+    _COMMENT_RE = re.compile(r'("(?:\\.|[^"\\])*"?)|(//[^\n]*)|(/\*[\s\S]*?\*/)')
+    _NON_NEWLINE_RE = re.compile(r'[^\n]')
+    
+    # Common field mappings for JSON structures, in priority order. Kept as
+    # nested tuples: built once, immutable and cheap to iterate.
+    _FIELD_MAPPINGS = (
+        # Movie/TV show fields
+        ('title', ('title', 'name', 'originalTitle', 'original_title')),
+        ('plot', ('plot', 'summary', 'description', 'overview', 'synopsis')),
+        ('year', ('year', 'releaseYear', 'release_year', 'premiered')),
+        ('genre', ('genre', 'genres')),
+        ('rating', ('rating', 'imdbRating', 'imdb_rating', 'tmdbRating', 'tmdb_rating')),
+        ('runtime', ('runtime', 'duration', 'length')),
+        ('director', ('director', 'directors')),
+        ('cast', ('cast', 'actors', 'actor')),
+        ('studio', ('studio', 'studios', 'distributor', 'production_company')),
+        ('tagline', ('tagline', 'slogan')),
+        
+        # Music fields
+        ('artist', ('artist', 'albumArtist', 'album_artist', 'performer')),
+        ('album', ('album', 'albumName', 'album_name')),
+        ('track', ('track', 'trackNumber', 'track_number')),
+        ('discnumber', ('discNumber', 'disc_number', 'disc')),
+        
+        # Episode fields
+        ('season', ('season', 'seasonNumber', 'season_number')),
+        ('episode', ('episode', 'episodeNumber', 'episode_number')),
+        ('showtitle', ('showTitle', 'show_title', 'seriesName', 'series_name')),
+        
+        # General metadata
+        ('dateadded', ('dateAdded', 'date_added', 'added', 'created')),
+        ('lastplayed', ('lastPlayed', 'last_played', 'viewed')),
+        ('playcount', ('playCount', 'play_count', 'timesViewed', 'times_viewed')),
+    )
+    
+    # Lowercased alias -> (common name, alias, priority within its mapping)
+    _ALIAS_TO_COMMON = {
+        alias.lower(): (common_name, alias, priority)
+        for common_name, aliases in _FIELD_MAPPINGS
+        for priority, alias in enumerate(aliases)
+    }
+    
     def __init__(
         self,
         strict_mode: bool = False,
-        allow_comments: bool = True
+        allow_comments: bool = True,
+        mmap_threshold: int = 1_048_576,
+        intern_keys: Optional[bool] = None
     ) -> None:
         """
         Initialize JSON parser.
@@ -45,9 +164,17 @@ class JSONNFOParser(BaseNFOParser):
         Args:
             strict_mode: Whether to enforce strict JSON parsing (no comments, trailing commas)
             allow_comments: Whether to allow JSON with comments and relaxed syntax
+            mmap_threshold: File size in bytes above which files are memory-mapped
+            intern_keys: Whether to intern object keys so repeated keys share one
+                string across parsed files (defaults to on unless orjson, which
+                caches keys itself, is the decoder)
         """
         self.strict_mode = strict_mode
         self.allow_comments = allow_comments
+        self.mmap_threshold = mmap_threshold
+        self.intern_keys = (
+            FAST_JSON_DECODER != "orjson" if intern_keys is None else intern_keys
+        )
     
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """
@@ -62,24 +189,37 @@ class JSONNFOParser(BaseNFOParser):
         file_path = Path(file_path)
         
         # Check file extension
-        if file_path.suffix.lower() not in [ext.lower() for ext in self.supported_extensions]:
+        if file_path.suffix.lower() not in self._supported_ext_set:
             return False
         
-        # Try to parse the content to check if it's valid JSON
+        # Cheap structural probe on the start of the file; full validation
+        # happens in parse(), where failures become NFOParseError
         try:
-            content = self._read_file_content(file_path, encoding=None)
-            
-            # Quick check for JSON-like content
-            content = content.strip()
-            if not (content.startswith('{') or content.startswith('[')):
-                return False
-            
-            # Try to parse as JSON
-            self._parse_json_content(content)
-            return True
-            
-        except Exception:
+            with open(file_path, 'rb') as f:
+                window = f.read(_PROBE_SIZE)
+                is_complete = not f.read(1)
+        except OSError:
             return False
+        
+        for bom, codec in _BOM_CODECS:
+            if window.startswith(bom):
+                window = window[len(bom):]
+                if codec != 'utf-8':
+                    window = window.decode(codec, 'ignore').encode('utf-8')
+                break
+        
+        window = window.strip()
+        if not window or window[0] not in b'{[':
+            return False
+        
+        # .nfo files are often plain text, so when the whole file fits in
+        # the window also require a plausible final JSON token
+        if is_complete and file_path.suffix.lower() == '.nfo':
+            has_comments = self.allow_comments and (b'//' in window or b'/*' in window)
+            if not has_comments and window[-1] not in _JSON_END_BYTES:
+                return False
+        
+        return True
     
     def parse(self, file_path: Union[str, Path]) -> NFOData:
         """
@@ -98,13 +238,9 @@ class JSONNFOParser(BaseNFOParser):
         file_path = Path(file_path)
         
         try:
-            # Read file content
-            encoding = self._detect_encoding(file_path)
-            content = self._read_file_content(file_path, encoding=encoding)
-            
-            # Parse JSON
+            # Read and decode JSON
             try:
-                data = self._parse_json_content(content)
+                data, encoding = self._load_json_file(file_path)
             except json.JSONDecodeError as e:
                 raise NFOParseError(
                     f"Invalid JSON structure: {str(e)}",
@@ -119,6 +255,8 @@ class JSONNFOParser(BaseNFOParser):
             elif not isinstance(data, dict):
                 data = {'value': data}
             
+            stats = self._analyze_structure(data, intern_keys=self.intern_keys)
+            
             # Create NFOData object
             nfo_data = NFOData(
                 file_path=file_path,
@@ -127,8 +265,8 @@ class JSONNFOParser(BaseNFOParser):
                 encoding=encoding,
                 metadata={
                     'original_structure': type(data).__name__,
-                    'total_keys': self._count_keys(data),
-                    'max_depth': self._calculate_depth(data),
+                    'total_keys': stats['total_keys'],
+                    'max_depth': stats['max_depth'],
                     'parser_config': {
                         'strict_mode': self.strict_mode,
                         'allow_comments': self.allow_comments
@@ -150,161 +288,250 @@ class JSONNFOParser(BaseNFOParser):
                 parse_details=str(e)
             ) from e
     
-    def _parse_json_content(self, content: str) -> Any:
+    def _load_json_file(self, file_path: Path) -> Tuple[Any, str]:
         """
-        Parse JSON content with support for relaxed syntax if configured.
+        Read a JSON file and decode its content.
+        
+        The file is read once as bytes; UTF-8 (and ASCII) bytes go straight
+        to the decoder, which decodes them in C. With orjson available,
+        files above ``mmap_threshold`` are memory-mapped and decoded in
+        place instead of being copied into a bytes object first.
         
         Args:
-            content: JSON content string to parse
+            file_path: Path to the JSON file
             
         Returns:
-            Parsed JSON data
+            Tuple of (decoded JSON data, detected encoding)
             
         Raises:
             json.JSONDecodeError: If JSON parsing fails
+            NFOAccessError: If file cannot be read or decoded
         """
-        if self.strict_mode:
-            # Use strict JSON parsing
-            return json.loads(content)
-        else:
-            # Try standard JSON first
+        try:
+            use_mmap = (
+                FAST_JSON_DECODER == "orjson"
+                and file_path.stat().st_size > self.mmap_threshold
+            )
+        except OSError:
+            use_mmap = False
+        
+        if use_mmap:
             try:
-                return json.loads(content)
+                with open(file_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    encoding = self._detect_bytes_encoding(mapped[:_ENCODING_SAMPLE_SIZE])
+                    if encoding.lower() in _UTF8_ENCODINGS:
+                        with memoryview(mapped) as view:
+                            return self._parse_json_content(view), encoding
+                    raw_content = mapped[:]
             except json.JSONDecodeError:
-                if self.allow_comments:
-                    # Try parsing with comment removal
-                    cleaned_content = self._remove_json_comments(content)
-                    return json.loads(cleaned_content)
-                else:
-                    raise
+                raise
+            except (OSError, ValueError) as e:
+                raise NFOAccessError(
+                    f"Cannot read file: {str(e)}",
+                    file_path=str(file_path),
+                    access_mode="read",
+                    system_error=str(e)
+                ) from e
+        else:
+            raw_content = self._read_file_bytes(file_path)
+            encoding = self._detect_bytes_encoding(raw_content)
+            if encoding.lower() in _UTF8_ENCODINGS:
+                return self._parse_json_content(raw_content), encoding
+        
+        try:
+            content = raw_content.decode(encoding)
+        except (UnicodeDecodeError, LookupError) as e:
+            raise NFOAccessError(
+                f"Cannot decode file with encoding {encoding}: {str(e)}",
+                file_path=str(file_path),
+                access_mode="read",
+                system_error=str(e)
+            ) from e
+        
+        return self._parse_json_content(content), encoding
     
-    def _remove_json_comments(self, content: str) -> str:
+    def _parse_json_content(self, content: Union[str, bytes, memoryview]) -> Any:
         """
-        Remove comments from JSON content to allow for relaxed parsing.
-        
-        This method removes single-line comments (//) and multi-line comments (/* */)
-        while preserving strings that might contain these patterns.
+        Parse JSON content with support for relaxed syntax if configured.
         
         Args:
-            content: JSON content with comments
+            content: JSON content as text or UTF-8 bytes/buffer
             
         Returns:
-            JSON content with comments removed
+            Parsed JSON data
+            
+        Raises:
+            json.JSONDecodeError: If JSON parsing fails
         """
-        import re
-        
-        # Pattern to match comments while avoiding strings
-        # This is a simplified approach - a more robust solution would use a proper lexer
-        
-        lines = content.split('\n')
-        cleaned_lines = []
-        
-        in_multiline_comment = False
+        # Strict settings skip the comment checks entirely
+        if self.strict_mode or not self.allow_comments:
+            return self._parse_strict(content)
+        return self._parse_lenient(content)
+    
+    def _parse_strict(self, content: Union[str, bytes, memoryview]) -> Any:
+        """
+        Parse JSON content with no relaxed syntax support.
         
-        for line in lines:
-            cleaned_line = ""
-            i = 0
-            in_string = False
-            escape_next = False
+        Args:
+            content: JSON content as text or UTF-8 bytes/buffer
             
-            while i < len(line):
-                char = line[i]
-                
-                if escape_next:
-                    cleaned_line += char
-                    escape_next = False
-                    i += 1
-                    continue
-                
-                if char == '\\' and in_string:
-                    cleaned_line += char
-                    escape_next = True
-                    i += 1
-                    continue
-                
-                if char == '"' and not in_multiline_comment:
-                    in_string = not in_string
-                    cleaned_line += char
-                elif in_string:
-                    cleaned_line += char
-                elif in_multiline_comment:
-                    if char == '*' and i + 1 < len(line) and line[i + 1] == '/':
-                        in_multiline_comment = False
-                        i += 1  # Skip the '/'
-                elif char == '/' and i + 1 < len(line):
-                    if line[i + 1] == '/':
-                        # Single-line comment - ignore rest of line
-                        break
-                    elif line[i + 1] == '*':
-                        # Multi-line comment start
-                        in_multiline_comment = True
-                        i += 1  # Skip the '*'
-                    else:
-                        cleaned_line += char
-                else:
-                    cleaned_line += char
-                
-                i += 1
+        Returns:
+            Parsed JSON data
             
-            if not in_multiline_comment:
-                cleaned_lines.append(cleaned_line.rstrip())
-        
-        return '\n'.join(cleaned_lines)
+        Raises:
+            json.JSONDecodeError: If JSON parsing fails
+        """
+        return _json_loads(content)
     
-    def _count_keys(self, data: Dict[str, Any]) -> int:
+    def _parse_lenient(self, content: Union[str, bytes, memoryview]) -> Any:
         """
-        Count total number of keys in a nested dictionary.
+        Parse JSON content, removing comments if the plain decode fails.
+        
+        Content without any comment marker is decoded exactly once with no
+        retry path. Content with markers is still decoded as-is first, since
+        the markers are usually inside strings such as URLs.
         
         Args:
-            data: Dictionary to count keys in
+            content: JSON content as text or UTF-8 bytes/buffer
             
         Returns:
-            Total number of keys
+            Parsed JSON data
+            
+        Raises:
+            json.JSONDecodeError: If JSON parsing fails
         """
-        if not isinstance(data, dict):
-            return 0
+        if isinstance(content, str):
+            has_markers = '//' in content or '/*' in content
+        else:
+            # memoryviews over mmaps search the underlying mapping
+            buffer = content.obj if isinstance(content, memoryview) else content
+            has_markers = buffer.find(b'//') != -1 or buffer.find(b'/*') != -1
+        
+        if not has_markers:
+            return _json_loads(content)
         
-        count = len(data)
+        try:
+            return _json_loads(content)
+        except json.JSONDecodeError:
+            return _json_loads(self._remove_json_comments(content))
+    
+    def _remove_json_comments(self, content: Union[str, bytes, memoryview]) -> Union[str, bytes]:
+        """
+        Remove comments from JSON content to allow for relaxed parsing.
         
-        for value in data.values():
-            if isinstance(value, dict):
-                count += self._count_keys(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        count += self._count_keys(item)
+        This method removes single-line comments (//) and multi-line comments (/* */)
+        while preserving strings that might contain these patterns.
         
-        return count
+        Args:
+            content: JSON content with comments, as text or UTF-8 bytes/buffer
+            
+        Returns:
+            JSON content with comments removed; byte input may come back as
+            UTF-8 bytes when the compiled stripper handles it
+        """
+        # Megabyte-scale content goes through the compiled state machine
+        # when numba is installed, staying in bytes for byte input
+        if len(content) >= _JIT_STRIP_MIN_SIZE:
+            strip_comments = get_jit_strip_comments()
+            if strip_comments is not None:
+                try:
+                    return strip_comments(content)
+                except Exception:
+                    disable_jit_strip_comments()
+        
+        if not isinstance(content, str):
+            content = bytes(content).decode('utf-8-sig')
+        
+        def _replace(match: re.Match) -> str:
+            if match.group(1) is not None:
+                return match.group(1)
+            if match.group(2) is not None:
+                return ''
+            # Blank out block comments but keep their newlines so that
+            # decoder error positions still point at the right line
+            return self._NON_NEWLINE_RE.sub(' ', match.group(0))
+        
+        return self._COMMENT_RE.sub(_replace, content)
     
-    def _calculate_depth(self, data: Any, current_depth: int = 0) -> int:
+    def _analyze_structure(self, data: Any, intern_keys: bool = False) -> Dict[str, Any]:
         """
-        Calculate the maximum depth of a nested data structure.
+        Analyze a nested data structure in a single traversal.
         
         Args:
             data: Data structure to analyze
-            current_depth: Current depth level
+            intern_keys: Whether to replace dict keys with interned strings
+                in place while walking
             
         Returns:
-            Maximum depth of the structure
+            Dictionary with total_keys, max_depth, has_arrays,
+            has_nested_objects and empty_values
         """
-        if isinstance(data, dict):
-            if not data:
-                return current_depth
-            return max(
-                self._calculate_depth(value, current_depth + 1)
-                for value in data.values()
-            )
-        elif isinstance(data, list):
-            if not data:
-                return current_depth
-            return max(
-                self._calculate_depth(item, current_depth + 1)
-                for item in data
-            )
-        else:
-            return current_depth
+        total_keys = 0
+        max_depth = 0
+        has_arrays = False
+        has_nested_objects = False
+        empty_values = 0
+        
+        if isinstance(data, list):
+            has_arrays = True
+        
+        # Iterative DFS with an explicit stack: no frame per node and no
+        # recursion limit on deeply nested documents. Only non-empty
+        # containers are pushed; the flags and leaf depths are settled at
+        # the parent so scalar leaves never become stack entries.
+        stack = [(data, 0)] if isinstance(data, (dict, list)) and data else []
+        pop = stack.pop
+        push = stack.append
+        intern = sys.intern
+        
+        while stack:
+            node, depth = pop()
+            
+            if isinstance(node, dict):
+                total_keys += len(node)
+                if intern_keys:
+                    # Rebuild in place so parents keep the same dict object
+                    items = [
+                        (intern(key) if type(key) is str else key, value)
+                        for key, value in node.items()
+                    ]
+                    node.clear()
+                    node.update(items)
+                children = node.values()
+            else:
+                children = node
+            
+            child_depth = depth + 1
+            for child in children:
+                if isinstance(child, dict):
+                    has_nested_objects = True
+                    if child:
+                        push((child, child_depth))
+                        continue
+                    empty_values += 1
+                elif isinstance(child, list):
+                    has_arrays = True
+                    if child:
+                        push((child, child_depth))
+                        continue
+                    empty_values += 1
+                elif child is None or (isinstance(child, str) and not child):
+                    empty_values += 1
+                
+                # Leaf or empty container
+                if child_depth > max_depth:
+                    max_depth = child_depth
+        
+        return {
+            'total_keys': total_keys,
+            'max_depth': max_depth,
+            'has_arrays': has_arrays,
+            'has_nested_objects': has_nested_objects,
+            'empty_values': empty_values
+        }
     
-    def get_common_fields(self, nfo_data: NFOData) -> Dict[str, Any]:
+    def get_common_fields(self, nfo_data: NFOData, deep: bool = False) -> Dict[str, Any]:
         """
         Extract commonly used fields from JSON NFO data.
         
@@ -313,6 +540,8 @@ class JSONNFOParser(BaseNFOParser):
         
         Args:
             nfo_data: Parsed NFO data
+            deep: Whether to search nested objects for fields that are not
+                found at the top level
             
         Returns:
             Dictionary with commonly used field mappings
@@ -320,82 +549,47 @@ class JSONNFOParser(BaseNFOParser):
         common_fields = {}
         data = nfo_data.data
         
-        # Common field mappings for JSON structures
-        field_mappings = [
-            # Movie/TV show fields
-            ('title', ['title', 'name', 'originalTitle', 'original_title']),
-            ('plot', ['plot', 'summary', 'description', 'overview', 'synopsis']),
-            ('year', ['year', 'releaseYear', 'release_year', 'premiered']),
-            ('genre', ['genre', 'genres']),
-            ('rating', ['rating', 'imdbRating', 'imdb_rating', 'tmdbRating', 'tmdb_rating']),
-            ('runtime', ['runtime', 'duration', 'length']),
-            ('director', ['director', 'directors']),
-            ('cast', ['cast', 'actors', 'actor']),
-            ('studio', ['studio', 'studios', 'distributor', 'production_company']),
-            ('tagline', ['tagline', 'slogan']),
-            
-            # Music fields
-            ('artist', ['artist', 'albumArtist', 'album_artist', 'performer']),
-            ('album', ['album', 'albumName', 'album_name']),
-            ('track', ['track', 'trackNumber', 'track_number']),
-            ('discnumber', ['discNumber', 'disc_number', 'disc']),
+        # Single pass over the top-level keys against the alias index. Exact
+        # matches beat case-insensitive ones, then earlier aliases win.
+        best_matches: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        alias_index = self._ALIAS_TO_COMMON
+        
+        for key, value in data.items():
+            if not isinstance(key, str):
+                continue
+            match = alias_index.get(key.lower())
+            if match is None:
+                continue
             
-            # Episode fields
-            ('season', ['season', 'seasonNumber', 'season_number']),
-            ('episode', ['episode', 'episodeNumber', 'episode_number']),
-            ('showtitle', ['showTitle', 'show_title', 'seriesName', 'series_name']),
+            common_name, alias, priority = match
+            rank = (0 if key == alias else 1, priority)
+            current = best_matches.get(common_name)
+            if current is None or rank <= current[0]:
+                best_matches[common_name] = (rank, value)
+        
+        for common_name, possible_keys in self._FIELD_MAPPINGS:
+            if common_name in best_matches:
+                value = best_matches[common_name][1]
+            elif deep:
+                # Not at the top level; try nested search for common patterns
+                value = self._deep_search_field(data, possible_keys)
+            else:
+                continue
             
-            # General metadata
-            ('dateadded', ['dateAdded', 'date_added', 'added', 'created']),
-            ('lastplayed', ['lastPlayed', 'last_played', 'viewed']),
-            ('playcount', ['playCount', 'play_count', 'timesViewed', 'times_viewed']),
-        ]
-        
-        for common_name, possible_keys in field_mappings:
-            value = self._find_field_value(data, possible_keys)
             if value is not None:
                 common_fields[common_name] = value
         
         return common_fields
     
-    def _find_field_value(self, data: Dict[str, Any], possible_keys: List[str]) -> Any:
-        """
-        Find a field value using multiple possible key names.
-        
-        This method searches through the data structure using various naming conventions
-        commonly found in JSON NFO files (camelCase, snake_case, etc.).
-        
-        Args:
-            data: Dictionary to search in
-            possible_keys: List of possible key names to try
-            
-        Returns:
-            Found value or None if not found
-        """
-        # First, try direct key matches
-        for key in possible_keys:
-            if key in data:
-                return data[key]
-        
-        # Then try case-insensitive matches
-        data_keys_lower = {k.lower(): k for k in data.keys() if isinstance(k, str)}
-        
-        for key in possible_keys:
-            key_lower = key.lower()
-            if key_lower in data_keys_lower:
-                actual_key = data_keys_lower[key_lower]
-                return data[actual_key]
-        
-        # Finally, try nested search for common patterns
-        return self._deep_search_field(data, possible_keys)
-    
-    def _deep_search_field(self, data: Any, possible_keys: List[str], max_depth: int = 2) -> Any:
+    def _deep_search_field(
+        self, data: Any, possible_keys: Sequence[str], max_depth: int = 2
+    ) -> Any:
         """
         Perform a deep search for field values in nested structures.
         
         Args:
             data: Data structure to search in
-            possible_keys: List of possible key names
+            possible_keys: Possible key names in priority order
             max_depth: Maximum depth to search
             
         Returns:
@@ -404,24 +598,28 @@ class JSONNFOParser(BaseNFOParser):
         if max_depth <= 0:
             return None
         
-        if isinstance(data, dict):
-            # Search in current level
-            for key in possible_keys:
-                if key in data:
-                    return data[key]
+        # Breadth-first over a bounded frontier so shallower matches win and
+        # the search stops at the first hit
+        frontier = deque([(data, 0)])
+        
+        while frontier:
+            node, depth = frontier.popleft()
             
-            # Search in nested dictionaries
-            for value in data.values():
-                result = self._deep_search_field(value, possible_keys, max_depth - 1)
-                if result is not None:
-                    return result
-        
-        elif isinstance(data, list):
-            # Search in list items
-            for item in data:
-                result = self._deep_search_field(item, possible_keys, max_depth - 1)
-                if result is not None:
-                    return result
+            if isinstance(node, dict):
+                # Search in current level
+                for key in possible_keys:
+                    if key in node:
+                        return node[key]
+                if depth + 1 < max_depth:
+                    frontier.extend(
+                        (value, depth + 1) for value in node.values()
+                        if isinstance(value, (dict, list))
+                    )
+            elif isinstance(node, list) and depth + 1 < max_depth:
+                frontier.extend(
+                    (item, depth + 1) for item in node
+                    if isinstance(item, (dict, list))
+                )
         
         return None
     
@@ -445,13 +643,7 @@ class JSONNFOParser(BaseNFOParser):
         }
         
         # Analyze structure
-        validation_result['structure_analysis'] = {
-            'total_keys': self._count_keys(data),
-            'max_depth': self._calculate_depth(data),
-            'has_arrays': self._contains_arrays(data),
-            'has_nested_objects': self._contains_nested_objects(data),
-            'empty_values': self._count_empty_values(data)
-        }
+        validation_result['structure_analysis'] = self._analyze_structure(data)
         
         # Check for potential issues
         if validation_result['structure_analysis']['max_depth'] > 5:
@@ -465,49 +657,10 @@ class JSONNFOParser(BaseNFOParser):
             )
         
         # Provide recommendations
-        common_fields = self.get_common_fields(nfo_data)
+        common_fields = self.get_common_fields(nfo_data, deep=True)
         if len(common_fields) < 3:
             validation_result['recommendations'].append(
                 "Consider adding more standard metadata fields (title, plot, year, etc.)"
             )
         
         return validation_result
-    
-    def _contains_arrays(self, data: Any) -> bool:
-        """Check if data structure contains arrays."""
-        if isinstance(data, list):
-            return True
-        elif isinstance(data, dict):
-            return any(self._contains_arrays(value) for value in data.values())
-        return False
-    
-    def _contains_nested_objects(self, data: Any) -> bool:
-        """Check if data structure contains nested objects."""
-        if isinstance(data, dict):
-            for value in data.values():
-                if isinstance(value, dict):
-                    return True
-                elif isinstance(value, list):
-                    for item in value:
-                        if isinstance(item, dict):
-                            return True
-        return False
-    
-    def _count_empty_values(self, data: Any) -> int:
-        """Count empty or null values in the data structure."""
-        count = 0
-        
-        if isinstance(data, dict):
-            for value in data.values():
-                if value is None or value == "" or value == []:
-                    count += 1
-                else:
-                    count += self._count_empty_values(value)
-        elif isinstance(data, list):
-            for item in data:
-                if item is None or item == "" or item == []:
-                    count += 1
-                else:
-                    count += self._count_empty_values(item)
-        
-        return count
@@ -9,15 +9,113 @@ Author: NFO Editor Team
 """
 
 import re
-import configparser
-from io import StringIO
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Union, Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 from .base import BaseNFOParser, NFOData
+from ._text_fast import STRUCTURE_KINDS, get_jit_tally_structure, disable_jit_tally_structure
 from ..utils.exceptions import NFOParseError, NFOAccessError
 
 
+# Maximum number of files whose can_parse content is kept for parse()
+_CONTENT_CACHE_SIZE = 64
+
+# Content length from which the Numba structure tally is used if installed
+_JIT_TALLY_MIN_SIZE = 1_048_576
+
+# Common field names and the keys they are looked up under (lowercase)
+_COMMON_FIELD_MAPPINGS = (
+    ('title', ('title', 'name', 'movie', 'film', 'show', 'album')),
+    ('plot', ('plot', 'summary', 'description', 'synopsis', 'desc')),
+    ('year', ('year', 'date', 'released', 'release_year')),
+    ('genre', ('genre', 'genres', 'category', 'type')),
+    ('rating', ('rating', 'score', 'imdb', 'stars')),
+    ('runtime', ('runtime', 'duration', 'length', 'time')),
+    ('director', ('director', 'directors', 'directed_by')),
+    ('cast', ('cast', 'actors', 'starring', 'stars')),
+    ('studio', ('studio', 'studios', 'producer', 'production')),
+    ('artist', ('artist', 'performer', 'musician')),
+    ('track', ('track', 'track_number', 'song')),
+    ('season', ('season', 'season_number')),
+    ('episode', ('episode', 'episode_number')),
+)
+
+# Key-value delimiters recognised when sniffing for structured text
+_KV_DELIMITERS = (':', '=', '|', '\t')
+
+# Delimiters that never sit at a line edge stripping could remove, making
+# files that use only them safe for the uniform key-value fast path
+_UNIFORM_DELIMITERS = frozenset({':', '=', '|'})
+
+# First characters of the [ini], === header === and --- dash --- section lines
+_SECTION_STARTS = ('[', '=', '-')
+_SECTION_LINE_STARTS = tuple('\n' + start for start in _SECTION_STARTS)
+
+# Lines with visible content, and lines that would still contain a
+# delimiter after stripping surrounding whitespace
+_NON_EMPTY_LINE_RE = re.compile(r'^[^\S\n]*\S', re.MULTILINE)
+_KV_LINE_RE = re.compile(r'^(?:[^\n]*[:=|]|[^\S\n]*\S[^\n\t]*\t[^\n]*\S)', re.MULTILINE)
+
+# Fallback key-value split: the first '=' wins, then '|', then a tab,
+# matching the priority order of the alternative delimiters
+_ALT_KV_RE = re.compile(r'([^=]*)=(.*)|([^|]*)\|(.*)|([^\t]*)\t(.*)', re.DOTALL)
+
+# Section headers in any supported style, matched against a stripped line
+_SECTION_HEADER_RE = re.compile(r'\[([^\]]+)\]|=+\s*([^=\n]+)\s*=+|-+\s*([^-\n]+)\s*-+')
+
+# INI header and option syntax, following configparser's defaults
+_INI_SECTION_RE = re.compile(r'\[(.+)\]')
+_INI_OPTION_RE = re.compile(r'(.*?)\s*[=:]\s*(.*)')
+_INI_COMMENT_PREFIXES = ('#', ';')
+
+# Runs of non-word characters and underscores, collapsed to one underscore
+_NON_WORD_RUN_RE = re.compile(r'[\W_]+')
+
+# Byte table mapping every ASCII non-word character to '_', for the
+# ASCII fast path of field name cleaning
+_ASCII_WORD_TABLE = bytes(
+    byte if chr(byte).isalnum() or byte == 0x5F else 0x5F
+    for byte in range(256)
+)
+_UNDERSCORE_RUN_RE = re.compile(r'_{2,}')
+
+
+@lru_cache(maxsize=4096)
+def _clean_field_name_cached(field_name: str, case_sensitive: bool) -> str:
+    """
+    Clean and normalize a field name, memoized across calls and files.
+    
+    Args:
+        field_name: Raw field name
+        case_sensitive: Whether to keep the original letter case
+        
+    Returns:
+        Cleaned field name
+    """
+    # Remove extra whitespace
+    clean_name = field_name.strip()
+    
+    # Convert to lowercase if not case-sensitive
+    if not case_sensitive:
+        clean_name = clean_name.lower()
+    
+    # Replace spaces and special characters with single underscores;
+    # ASCII names use a C-level byte translate instead of the regex
+    if clean_name.isascii():
+        clean_name = clean_name.encode('ascii').translate(_ASCII_WORD_TABLE).decode('ascii')
+        if '__' in clean_name:
+            clean_name = _UNDERSCORE_RUN_RE.sub('_', clean_name)
+    else:
+        clean_name = _NON_WORD_RUN_RE.sub('_', clean_name)
+    
+    # Remove leading/trailing underscores
+    clean_name = clean_name.strip('_')
+    
+    return clean_name if clean_name else 'unknown'
+
+
 class TextNFOParser(BaseNFOParser):
     """
     Parser for plain text NFO files.
@@ -37,9 +135,61 @@ class TextNFOParser(BaseNFOParser):
         case_sensitive (bool): Whether field names should be case-sensitive
     """
     
+    __slots__ = (
+        'auto_detect_format', 'default_delimiter', 'case_sensitive', 'strip_values',
+        '_content_cache'
+    )
+    
     supported_extensions = ['.nfo', '.txt', '.info', '.meta']
     format_name = "Text"
     
+    # Pre-compiled regex patterns for various text formats, compiled once
+    # at import and shared read-only by all instances
+    patterns = MappingProxyType({
+        # Key-value patterns with different delimiters
+        'colon_kv': re.compile(r'^([^:\n]+):\s*(.*)$', re.MULTILINE),
+        'equals_kv': re.compile(r'^([^=\n]+)=\s*(.*)$', re.MULTILINE),
+        'pipe_kv': re.compile(r'^([^|\n]+)\|\s*(.*)$', re.MULTILINE),
+        'tab_kv': re.compile(r'^([^\t\n]+)\t+(.*)$', re.MULTILINE),
+        
+        # Section headers
+        'ini_section': re.compile(r'^\[([^\]]+)\]$', re.MULTILINE),
+        'header_section': re.compile(r'^=+\s*([^=\n]+)\s*=+$', re.MULTILINE),
+        'dash_section': re.compile(r'^-+\s*([^-\n]+)\s*-+$', re.MULTILINE),
+        
+        # Multi-line value patterns
+        'indented_continuation': re.compile(r'^(\s{2,})(.+)$', re.MULTILINE),
+        
+        # Special patterns for common NFO fields
+        'title_pattern': re.compile(r'^(title|name|movie|film)\s*[:=]\s*(.+)$', re.IGNORECASE | re.MULTILINE),
+        'year_pattern': re.compile(r'^(year|date|released?)\s*[:=]\s*(\d{4}).*$', re.IGNORECASE | re.MULTILINE),
+        'rating_pattern': re.compile(r'^(rating|score)\s*[:=]\s*([\d.]+).*$', re.IGNORECASE | re.MULTILINE),
+    })
+    
+    # All structure patterns fused into one alternation so structure
+    # analysis is a single scan; each line is tallied under the first
+    # group that matches, with section headers taking precedence
+    _structure_re = re.compile(
+        r'(?P<ini>^\[[^\]\n]+\]$)'
+        r'|(?P<header>^=+[^\S\n]*[^=\n]+[^\S\n]*=+$)'
+        r'|(?P<dash>^-+[^\S\n]*[^-\n]+[^\S\n]*-+$)'
+        r'|(?P<colon>^[^:\n]+:)'
+        r'|(?P<equals>^[^=\n]+=)'
+        r'|(?P<pipe>^[^|\n]+\|)'
+        r'|(?P<tab>^[^\t\n]+\t)',
+        re.MULTILINE
+    )
+    
+    # The same alternation without the section branches, for content where
+    # no line can start a section header
+    _kv_structure_re = re.compile(
+        r'(?P<colon>^[^:\n]+:)'
+        r'|(?P<equals>^[^=\n]+=)'
+        r'|(?P<pipe>^[^|\n]+\|)'
+        r'|(?P<tab>^[^\t\n]+\t)',
+        re.MULTILINE
+    )
+    
     def __init__(
         self,
         auto_detect_format: bool = True,
@@ -61,27 +211,15 @@ class TextNFOParser(BaseNFOParser):
         self.case_sensitive = case_sensitive
         self.strip_values = strip_values
         
-        # Pre-compiled regex patterns for various text formats
-        self.patterns = {
-            # Key-value patterns with different delimiters
-            'colon_kv': re.compile(r'^([^:\n]+):\s*(.*)$', re.MULTILINE),
-            'equals_kv': re.compile(r'^([^=\n]+)=\s*(.*)$', re.MULTILINE),
-            'pipe_kv': re.compile(r'^([^|\n]+)\|\s*(.*)$', re.MULTILINE),
-            'tab_kv': re.compile(r'^([^\t\n]+)\t+(.*)$', re.MULTILINE),
-            
-            # Section headers
-            'ini_section': re.compile(r'^\[([^\]]+)\]$', re.MULTILINE),
-            'header_section': re.compile(r'^=+\s*([^=\n]+)\s*=+$', re.MULTILINE),
-            'dash_section': re.compile(r'^-+\s*([^-\n]+)\s*-+$', re.MULTILINE),
-            
-            # Multi-line value patterns
-            'indented_continuation': re.compile(r'^(\s{2,})(.+)$', re.MULTILINE),
-            
-            # Special patterns for common NFO fields
-            'title_pattern': re.compile(r'^(title|name|movie|film)\s*[:=]\s*(.+)$', re.IGNORECASE | re.MULTILINE),
-            'year_pattern': re.compile(r'^(year|date|released?)\s*[:=]\s*(\d{4}).*$', re.IGNORECASE | re.MULTILINE),
-            'rating_pattern': re.compile(r'^(rating|score)\s*[:=]\s*([\d.]+).*$', re.IGNORECASE | re.MULTILINE),
-        }
+        # Content read by can_parse, keyed by (path, mtime_ns, size) and
+        # handed over to the following parse() of the same unchanged file
+        self._content_cache: Dict[Tuple[str, int, int], Tuple[str, str]] = {}
+    
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        # Workers started by parse_many do not need the cached content
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['_content_cache'] = {}
+        return None, state
     
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """
@@ -96,19 +234,45 @@ class TextNFOParser(BaseNFOParser):
         file_path = Path(file_path)
         
         # Check file extension
-        if file_path.suffix.lower() not in [ext.lower() for ext in self.supported_extensions]:
+        if file_path.suffix.lower() not in self._supported_ext_set:
             return False
         
         # Try to read and analyze content structure
         try:
-            content = self._read_file_content(file_path, encoding=None)
+            cache_key = self._content_cache_key(file_path)
+            encoding = self._detect_encoding(file_path)
+            content = self._read_file_content(file_path, encoding=encoding)
             
             # Check if content looks like structured text
-            return self._is_structured_text(content)
+            if not self._is_structured_text(content):
+                return False
+            
+            # Keep the content for the parse() that usually follows
+            cache = self._content_cache
+            cache[cache_key] = (content, encoding)
+            while len(cache) > _CONTENT_CACHE_SIZE:
+                cache.pop(next(iter(cache)), None)
+            return True
             
         except Exception:
             return False
     
+    def _content_cache_key(self, file_path: Path) -> Tuple[str, int, int]:
+        """
+        Build the content cache key identifying the current file version.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Tuple of path string, modification time in nanoseconds and size
+            
+        Raises:
+            OSError: If the file cannot be accessed
+        """
+        stat_result = file_path.stat()
+        return str(file_path), stat_result.st_mtime_ns, stat_result.st_size
+    
     def parse(self, file_path: Union[str, Path]) -> NFOData:
         """
         Parse a plain text NFO file and return structured data.
@@ -126,9 +290,20 @@ class TextNFOParser(BaseNFOParser):
         file_path = Path(file_path)
         
         try:
-            # Read file content
-            encoding = self._detect_encoding(file_path)
-            content = self._read_file_content(file_path, encoding=encoding)
+            # Reuse content from can_parse if the file has not changed since
+            cached = None
+            if self._content_cache:
+                try:
+                    cached = self._content_cache.pop(self._content_cache_key(file_path), None)
+                except OSError:
+                    pass
+            
+            if cached is not None:
+                content, encoding = cached
+            else:
+                # Read file content
+                encoding = self._detect_encoding(file_path)
+                content = self._read_file_content(file_path, encoding=encoding)
             
             # Detect and parse structure
             structure_info = self._analyze_structure(content)
@@ -178,22 +353,21 @@ class TextNFOParser(BaseNFOParser):
         Returns:
             True if content appears structured
         """
-        if not content.strip():
+        # Cheap substring checks rule out content with no delimiter at all
+        if not any(delimiter in content for delimiter in _KV_DELIMITERS):
             return False
         
-        lines = [line.strip() for line in content.split('\n') if line.strip()]
+        # Count lines with whole-buffer regex scans instead of splitting
+        line_count = len(_NON_EMPTY_LINE_RE.findall(content))
         
-        if len(lines) < 2:
+        if line_count < 2:
             return False  # Need at least 2 lines for structure
         
         # Count lines that look like key-value pairs
-        kv_count = 0
-        for line in lines:
-            if any(delimiter in line for delimiter in [':', '=', '|', '\t']):
-                kv_count += 1
+        kv_count = len(_KV_LINE_RE.findall(content))
         
         # If at least 30% of lines look like key-value pairs, consider it structured
-        return (kv_count / len(lines)) >= 0.3
+        return (kv_count / line_count) >= 0.3
     
     def _analyze_structure(self, content: str) -> Dict[str, Any]:
         """
@@ -205,12 +379,13 @@ class TextNFOParser(BaseNFOParser):
         Returns:
             Dictionary with structure analysis results
         """
+        # Split once; the parse methods reuse these lines
         lines = content.split('\n')
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
         
         structure_info = {
+            'lines': lines,
             'line_count': len(lines),
-            'non_empty_lines': len(non_empty_lines),
+            'non_empty_lines': sum(1 for line in lines if line and not line.isspace()),
             'has_sections': False,
             'primary_format': 'key_value',
             'primary_delimiter': self.default_delimiter,
@@ -219,13 +394,42 @@ class TextNFOParser(BaseNFOParser):
             'indented_lines': 0
         }
         
-        # Analyze delimiters
-        for delimiter, pattern in [(':', self.patterns['colon_kv']), 
-                                   ('=', self.patterns['equals_kv']), 
-                                   ('|', self.patterns['pipe_kv']), 
-                                   ('\t', self.patterns['tab_kv'])]:
-            matches = pattern.findall(content)
-            structure_info['delimiter_counts'][delimiter] = len(matches)
+        # Tally delimiters and section headers in one pass
+        tallies = dict.fromkeys(STRUCTURE_KINDS, 0)
+        structure_re = None
+        
+        # Megabyte-scale content goes through the compiled line classifier
+        # when numba is installed
+        tally_structure = (
+            get_jit_tally_structure() if len(content) >= _JIT_TALLY_MIN_SIZE else None
+        )
+        if tally_structure is not None:
+            try:
+                tallies.update(zip(STRUCTURE_KINDS, tally_structure(content)))
+            except Exception:
+                disable_jit_tally_structure()
+                tally_structure = None
+        
+        # Literal pre-filters: section headers need a line starting with
+        # '[', '=' or '-', and key-value lines need a delimiter somewhere
+        if tally_structure is None:
+            if content.startswith(_SECTION_STARTS) or any(
+                start in content for start in _SECTION_LINE_STARTS
+            ):
+                structure_re = self._structure_re
+            elif any(delimiter in content for delimiter in _KV_DELIMITERS):
+                structure_re = self._kv_structure_re
+        
+        if structure_re is not None:
+            for match in structure_re.finditer(content):
+                tallies[match.lastgroup] += 1
+        
+        structure_info['delimiter_counts'] = {
+            ':': tallies['colon'],
+            '=': tallies['equals'],
+            '|': tallies['pipe'],
+            '\t': tallies['tab']
+        }
         
         # Find primary delimiter
         if structure_info['delimiter_counts']:
@@ -233,25 +437,19 @@ class TextNFOParser(BaseNFOParser):
             if structure_info['delimiter_counts'][primary_delim] > 0:
                 structure_info['primary_delimiter'] = primary_delim
         
-        # Check for sections
-        section_patterns = [
-            self.patterns['ini_section'],
-            self.patterns['header_section'], 
-            self.patterns['dash_section']
-        ]
-        
-        for pattern in section_patterns:
-            matches = pattern.findall(content)
-            if matches:
+        # Check for sections, counting the first header style present
+        for section_kind in ('ini', 'header', 'dash'):
+            if tallies[section_kind]:
                 structure_info['has_sections'] = True
-                structure_info['section_count'] += len(matches)
+                structure_info['section_count'] += tallies[section_kind]
                 structure_info['primary_format'] = 'sectioned'
                 break
         
-        # Count indented lines (for multi-line values)
-        for line in lines:
-            if re.match(r'^\s{2,}', line):
-                structure_info['indented_lines'] += 1
+        # Count indented lines (for multi-line values); a two-character
+        # slice test matches r'^\s{2,}' without a regex call per line
+        structure_info['indented_lines'] = sum(
+            1 for line in lines if len(line) >= 2 and line[:2].isspace()
+        )
         
         return structure_info
     
@@ -282,54 +480,39 @@ class TextNFOParser(BaseNFOParser):
         Returns:
             Parsed data dictionary with sections
         """
-        data = {}
+        lines = structure_info['lines']
         
-        # Try INI-style parsing first
-        try:
-            config = configparser.ConfigParser(allow_no_value=True)
-            config.read_string(content)
-            
-            for section_name in config.sections():
-                section_data = {}
-                for key, value in config[section_name].items():
-                    clean_key = self._clean_field_name(key)
-                    section_data[clean_key] = self._clean_value(value) if value else ""
-                data[self._clean_field_name(section_name)] = section_data
-            
-            if data:
-                return data
-        
-        except configparser.Error:
-            pass  # Fall back to manual parsing
+        # Files that open with an [ini] header get INI semantics
+        # (comments, ':'/'=' options, indented continuations)
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith(_INI_COMMENT_PREFIXES):
+                if _INI_SECTION_RE.match(line):
+                    return self._parse_ini_lines(lines)
+                break
         
         # Manual section parsing
-        lines = content.split('\n')
+        data = {}
         current_section = 'default'
         data[current_section] = {}
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check for section headers
-            section_match = None
-            for pattern in [self.patterns['ini_section'], 
-                           self.patterns['header_section'], 
-                           self.patterns['dash_section']]:
-                match = pattern.match(line)
-                if match:
-                    section_match = match
-                    break
+        # map() strips in C; blank lines are skipped without a branch body
+        for line in filter(None, map(str.strip, lines)):
+            # Check for section headers; only lines starting with a header
+            # marker need the regex
+            section_match = (
+                _SECTION_HEADER_RE.fullmatch(line)
+                if line.startswith(_SECTION_STARTS) else None
+            )
             
             if section_match:
-                current_section = self._clean_field_name(section_match.group(1))
+                current_section = self._clean_field_name(section_match.group(section_match.lastindex))
                 data[current_section] = {}
             else:
                 # Parse as key-value within current section
                 delimiter = structure_info['primary_delimiter']
-                if delimiter in line:
-                    key, value = line.split(delimiter, 1)
+                key, separator, value = line.partition(delimiter)
+                if separator:
                     clean_key = self._clean_field_name(key)
                     clean_value = self._clean_value(value)
                     data[current_section][clean_key] = clean_value
@@ -349,6 +532,79 @@ class TextNFOParser(BaseNFOParser):
         
         return {k: v for k, v in data.items() if v}  # Remove empty sections
     
+    def _parse_ini_lines(self, lines: List[str]) -> Dict[str, Any]:
+        """
+        Parse INI-style lines in a single pass.
+        
+        Follows configparser's default rules without its overhead: '#' and
+        ';' comment lines, options split at the first ':' or '=', options
+        without a value, and values continued on more-indented lines. Values
+        are taken literally (no interpolation) and a repeated option keeps
+        its last value. Options of a [DEFAULT] section are merged into every
+        other section that does not set them itself, and the [DEFAULT]
+        section is not part of the result.
+        
+        Args:
+            lines: Content lines, the first significant one a section header
+        
+        Returns:
+            Parsed data dictionary with sections
+        """
+        data: Dict[str, Dict[str, Any]] = {}
+        defaults: Dict[str, Any] = {}
+        section: Dict[str, Any] = {}
+        values: Optional[List[str]] = None  # Lines of the open option value
+        option_indent = 0
+        
+        for raw_line in lines:
+            line = raw_line.strip()
+            
+            if line.startswith(_INI_COMMENT_PREFIXES):
+                continue
+            
+            if not line:
+                if values is not None:
+                    values.append('')
+                continue
+            
+            indent = len(raw_line) - len(raw_line.lstrip())
+            if values is not None and indent > option_indent:
+                values.append(line)
+                continue
+            
+            values = None
+            
+            section_match = _INI_SECTION_RE.match(line)
+            if section_match:
+                section_name = self._clean_field_name(section_match.group(1))
+                if section_name.lower() == 'default':
+                    section = defaults
+                else:
+                    section = data.setdefault(section_name, {})
+                continue
+            
+            option_match = _INI_OPTION_RE.fullmatch(line)
+            if option_match:
+                key, value = option_match.groups()
+                values = [value]
+                option_indent = indent
+                section[self._clean_field_name(key.lower())] = values
+            else:
+                section[self._clean_field_name(line.lower())] = ""
+        
+        for section_data in (defaults, *data.values()):
+            for key, value in section_data.items():
+                if isinstance(value, list):
+                    value = '\n'.join(value).rstrip()
+                    section_data[key] = self._clean_value(value) if value else ""
+        
+        # Default options follow a section's own, as configparser lists them
+        for section_data in data.values():
+            for key, value in defaults.items():
+                section_data.setdefault(key, value)
+        
+        return data
+    
     def _parse_key_value_content(self, content: str, structure_info: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse content as key-value pairs.
@@ -360,11 +616,25 @@ class TextNFOParser(BaseNFOParser):
         Returns:
             Parsed data dictionary
         """
+        lines = structure_info['lines']
+        delimiter = structure_info['primary_delimiter']
+        
+        # Every non-empty line is a pair on the primary delimiter and none is
+        # indented, so no line needs the continuation or fallback handling.
+        # Tabs are excluded because stripping can remove a trailing one.
+        if (
+            delimiter in _UNIFORM_DELIMITERS
+            and structure_info['indented_lines'] == 0
+            and structure_info['delimiter_counts'].get(delimiter) == structure_info['non_empty_lines']
+        ):
+            return self._parse_uniform_key_value(lines, delimiter)
+        
         data = {}
-        lines = content.split('\n')
+        description_lines: Optional[List[str]] = None
+        line_total = len(lines)
         i = 0
         
-        while i < len(lines):
+        while i < line_total:
             line = lines[i].strip()
             
             if not line:
@@ -372,16 +642,14 @@ class TextNFOParser(BaseNFOParser):
                 continue
             
             # Try to parse as key-value pair
-            delimiter = structure_info['primary_delimiter']
-            
-            if delimiter in line:
-                key, value = line.split(delimiter, 1)
+            key, separator, value = line.partition(delimiter)
+            if separator:
                 clean_key = self._clean_field_name(key)
                 clean_value = self._clean_value(value)
                 
                 # Check for multi-line values (indented continuation)
                 i += 1
-                while i < len(lines) and lines[i].startswith('  '):
+                while i < line_total and lines[i].startswith('  '):
                     continuation = lines[i].strip()
                     if continuation:
                         clean_value += ' ' + continuation
@@ -390,32 +658,50 @@ class TextNFOParser(BaseNFOParser):
                 data[clean_key] = clean_value
             else:
                 # Try alternative delimiters or treat as free text
-                parsed = False
-                for alt_delimiter in ['=', '|', '\t']:
-                    if alt_delimiter in line:
-                        key, value = line.split(alt_delimiter, 1)
-                        clean_key = self._clean_field_name(key)
-                        clean_value = self._clean_value(value)
-                        data[clean_key] = clean_value
-                        parsed = True
-                        break
-                
-                if not parsed:
-                    # Add as free-form text
-                    if 'description' not in data:
-                        data['description'] = []
-                    data['description'].append(line)
+                match = _ALT_KV_RE.match(line)
+                if match is not None:
+                    # The matched branch's key/value are its last two groups
+                    value_group = match.lastindex
+                    clean_key = self._clean_field_name(match.group(value_group - 1))
+                    clean_value = self._clean_value(match.group(value_group))
+                    data[clean_key] = clean_value
+                else:
+                    # Add as free-form text; the list holds the key's
+                    # position until it is joined below
+                    if description_lines is None:
+                        description_lines = []
+                        data.setdefault('description', description_lines)
+                    description_lines.append(line)
                 
                 i += 1
         
-        # Convert single-item description lists to strings
-        if 'description' in data and isinstance(data['description'], list):
-            if len(data['description']) == 1:
-                data['description'] = data['description'][0]
-            elif len(data['description']) == 0:
-                del data['description']
+        # Join free-form lines unless a description field replaced them
+        if description_lines and data.get('description') is description_lines:
+            if len(description_lines) == 1:
+                data['description'] = description_lines[0]
             else:
-                data['description'] = '\n'.join(data['description'])
+                data['description'] = '\n'.join(description_lines)
+        
+        return data
+    
+    def _parse_uniform_key_value(self, lines: List[str], delimiter: str) -> Dict[str, Any]:
+        """
+        Parse lines that are all key-value pairs on a single delimiter.
+        
+        Args:
+            lines: Content lines
+            delimiter: Delimiter present in every non-empty line
+            
+        Returns:
+            Parsed data dictionary
+        """
+        data = {}
+        clean_field_name = self._clean_field_name
+        clean_value = self._clean_value
+        
+        for line in filter(None, map(str.strip, lines)):
+            key, _, value = line.partition(delimiter)
+            data[clean_field_name(key)] = clean_value(value)
         
         return data
     
@@ -432,23 +718,7 @@ class TextNFOParser(BaseNFOParser):
         if not field_name:
             return 'unknown'
         
-        # Remove extra whitespace
-        clean_name = field_name.strip()
-        
-        # Convert to lowercase if not case-sensitive
-        if not self.case_sensitive:
-            clean_name = clean_name.lower()
-        
-        # Replace spaces and special characters with underscores
-        clean_name = re.sub(r'[^\w]', '_', clean_name)
-        
-        # Remove multiple underscores
-        clean_name = re.sub(r'_+', '_', clean_name)
-        
-        # Remove leading/trailing underscores
-        clean_name = clean_name.strip('_')
-        
-        return clean_name if clean_name else 'unknown'
+        return _clean_field_name_cached(field_name, self.case_sensitive)
     
     def _clean_value(self, value: str) -> str:
         """
@@ -488,44 +758,45 @@ class TextNFOParser(BaseNFOParser):
         if nfo_data.metadata.get('has_sections', False):
             for section_name, section_data in data.items():
                 if isinstance(section_data, dict):
-                    flat_data.update(section_data)
-                    # Also add prefixed versions
+                    # Add plain and section-prefixed versions in one pass
                     for key, value in section_data.items():
+                        flat_data[key] = value
                         flat_data[f"{section_name}_{key}"] = value
         else:
             flat_data = data
         
-        # Common field mappings for text formats
-        field_mappings = [
-            ('title', ['title', 'name', 'movie', 'film', 'show', 'album']),
-            ('plot', ['plot', 'summary', 'description', 'synopsis', 'desc']),
-            ('year', ['year', 'date', 'released', 'release_year']),
-            ('genre', ['genre', 'genres', 'category', 'type']),
-            ('rating', ['rating', 'score', 'imdb', 'stars']),
-            ('runtime', ['runtime', 'duration', 'length', 'time']),
-            ('director', ['director', 'directors', 'directed_by']),
-            ('cast', ['cast', 'actors', 'starring', 'stars']),
-            ('studio', ['studio', 'studios', 'producer', 'production']),
-            ('artist', ['artist', 'performer', 'musician']),
-            ('track', ['track', 'track_number', 'song']),
-            ('season', ['season', 'season_number']),
-            ('episode', ['episode', 'episode_number']),
+        # Lowercase every key once instead of once per lookup
+        lower_keys = [
+            (data_key.lower(), data_key, value)
+            for data_key, value in flat_data.items()
+            if isinstance(data_key, str)
         ]
+        lower_index: Dict[str, Any] = {}
+        for lower_key, _, value in lower_keys:
+            lower_index.setdefault(lower_key, value)
         
-        for common_name, possible_keys in field_mappings:
-            value = self._find_field_value(flat_data, possible_keys)
+        for common_name, possible_keys in _COMMON_FIELD_MAPPINGS:
+            value = self._find_field_value(flat_data, possible_keys, lower_keys, lower_index)
             if value is not None and value != "":
                 common_fields[common_name] = value
         
         return common_fields
     
-    def _find_field_value(self, data: Dict[str, Any], possible_keys: List[str]) -> Any:
+    def _find_field_value(
+        self,
+        data: Dict[str, Any],
+        possible_keys: List[str],
+        lower_keys: Optional[List[Tuple[str, str, Any]]] = None,
+        lower_index: Optional[Dict[str, Any]] = None
+    ) -> Any:
         """
         Find a field value using multiple possible key names.
         
         Args:
             data: Dictionary to search in
             possible_keys: List of possible key names to try
+            lower_keys: Precomputed (lowercased key, key, value) entries of data
+            lower_index: Precomputed lowercased key to first value mapping
             
         Returns:
             Found value or None if not found
@@ -535,17 +806,29 @@ class TextNFOParser(BaseNFOParser):
             if key in data:
                 return data[key]
         
-        # Case-insensitive and fuzzy matches
-        for key in possible_keys:
-            for data_key, value in data.items():
-                if isinstance(data_key, str):
-                    # Exact case-insensitive match
-                    if data_key.lower() == key.lower():
-                        return value
-                    
-                    # Contains match (for compound keys)
-                    if key.lower() in data_key.lower() or data_key.lower() in key.lower():
-                        return value
+        if lower_keys is None:
+            lower_keys = [
+                (data_key.lower(), data_key, value)
+                for data_key, value in data.items()
+                if isinstance(data_key, str)
+            ]
+        if lower_index is None:
+            lower_index = {}
+            for lower_key, _, value in lower_keys:
+                lower_index.setdefault(lower_key, value)
+        
+        lowered = [key.lower() for key in possible_keys]
+        
+        # Exact case-insensitive matches
+        for key in lowered:
+            if key in lower_index:
+                return lower_index[key]
+        
+        # Contains matches (for compound keys)
+        for key in lowered:
+            for lower_key, _, value in lower_keys:
+                if key in lower_key or lower_key in key:
+                    return value
         
         return None
     
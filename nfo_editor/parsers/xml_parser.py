@@ -8,14 +8,129 @@ handles various XML structures and converts them to the unified NFOData format.
 Author: NFO Editor Team
 """
 
+import re
 import xml.etree.ElementTree as ET
-from typing import Union, Dict, Any, Optional, List
+from xml.parsers import expat
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Union, Dict, Any, Optional, List, Sequence, Tuple
 from pathlib import Path
 
 from .base import BaseNFOParser, NFOData
 from ..utils.exceptions import NFOParseError, NFOAccessError
 
 
+# Text values converted to booleans when convert_types is enabled
+_TRUE_VALUES = frozenset(('true', 'yes', '1'))
+_FALSE_VALUES = frozenset(('false', 'no', '0'))
+
+# Bytes inspected for encoding detection on streamed files
+_ENCODING_SAMPLE_SIZE = 65536
+
+# Maximum number of parsed files whose results parse() keeps for reuse
+_RESULT_CACHE_SIZE = 256
+
+# Bytes read by can_parse to probe for XML structure
+_PROBE_SIZE = 512
+
+# Start of an XML document: declaration, doctype, comment or root element
+_XML_PROLOG_RE = re.compile(rb'<(?:\?xml|!DOCTYPE|!--|[A-Za-z_:\x80-\xff])')
+
+# Byte order marks, mapped to the codec used to decode the probe
+_BOM_CODECS = (
+    (b'\xef\xbb\xbf', 'utf-8'),
+    (b'\xff\xfe', 'utf-16-le'),
+    (b'\xfe\xff', 'utf-16-be'),
+)
+
+# Common field names and the keys they are looked up under (lowercase)
+_COMMON_FIELD_MAPPINGS = (
+    # Movie/TV show fields
+    ('title', ('title', 'name', 'originaltitle')),
+    ('plot', ('plot', 'summary', 'description', 'overview')),
+    ('year', ('year', 'premiered', 'releasedate')),
+    ('genre', ('genre', 'genres')),
+    ('rating', ('rating', 'imdb_rating', 'tmdb_rating')),
+    ('runtime', ('runtime', 'duration')),
+    ('director', ('director', 'directors')),
+    ('cast', ('actor', 'actors', 'cast')),
+    ('studio', ('studio', 'studios', 'distributor')),
+    ('tagline', ('tagline', 'slogan')),
+    
+    # Music fields
+    ('artist', ('artist', 'albumartist', 'performer')),
+    ('album', ('album', 'title')),
+    ('track', ('track', 'tracknumber')),
+    ('discnumber', ('discnumber', 'disc')),
+    
+    # Episode fields
+    ('season', ('season', 'seasonnumber')),
+    ('episode', ('episode', 'episodenumber')),
+    ('showtitle', ('showtitle', 'seriesname')),
+    
+    # General metadata
+    ('dateadded', ('dateadded', 'added', 'created')),
+    ('lastplayed', ('lastplayed', 'viewed')),
+    ('playcount', ('playcount', 'timesviewed')),
+)
+
+# Prefer libxml2 through lxml for streamed parses when it is installed
+try:
+    from lxml import etree as LET
+    _XML_PARSE_ERRORS = (ET.ParseError, expat.ExpatError, LET.XMLSyntaxError)
+except ImportError:
+    LET = None
+    _XML_PARSE_ERRORS = (ET.ParseError, expat.ExpatError)
+
+# lxml iterparse settings: drop nodes the dict conversion ignores, skip the
+# xml:id table NFO files never use, and lift libxml2's size limits so huge
+# files behave as they do with expat (entities are still expanded)
+_LXML_ITERPARSE_OPTIONS = {
+    'remove_comments': True,
+    'remove_pis': True,
+    'remove_blank_text': True,
+    'collect_ids': False,
+    'huge_tree': True,
+}
+
+
+@lru_cache(maxsize=4096)
+def _strip_namespace(name: str) -> str:
+    """
+    Get the local part of a {uri}name tag or attribute name, memoized.
+    
+    NFO documents repeat a few dozen names many times, so caching returns
+    one shared string instead of re-splitting every occurrence.
+    
+    Args:
+        name: Tag or attribute name, possibly in Clark notation
+    
+    Returns:
+        Name without its namespace
+    """
+    return name.rpartition('}')[2] if '}' in name else name
+
+
+def _copy_data(value: Any) -> Any:
+    """
+    Copy parsed XML data, duplicating its dicts and lists.
+    
+    Parsed values are otherwise immutable scalars, so this is equivalent to
+    copy.deepcopy at a fraction of the cost.
+    
+    Args:
+        value: Parsed value (dict, list or scalar)
+        
+    Returns:
+        Independent copy of value
+    """
+    if isinstance(value, dict):
+        return {key: _copy_data(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_data(item) for item in value]
+    return value
+
+
 class XMLNFOParser(BaseNFOParser):
     """
     Parser for XML-formatted NFO files.
@@ -29,15 +144,30 @@ class XMLNFOParser(BaseNFOParser):
         format_name (str): Human-readable name of the format
         preserve_namespaces (bool): Whether to preserve XML namespaces
         convert_types (bool): Whether to convert string values to appropriate types
+        cache_results (bool): Whether parse() reuses results for unchanged files
     """
     
+    __slots__ = (
+        'preserve_namespaces', 'convert_types', 'stream_threshold', 'cache_results',
+        '_result_cache'
+    )
+    
     supported_extensions = ['.xml', '.nfo']
     format_name = "XML"
     
+    # Common XML namespace prefixes for NFO files, shared by all instances
+    common_namespaces = MappingProxyType({
+        'kodi': 'http://kodi.tv/nfo',
+        'xbmc': 'http://xbmc.org/nfo',
+        'media': 'http://mediainfo.tv/nfo',
+    })
+    
     def __init__(
         self,
         preserve_namespaces: bool = False,
-        convert_types: bool = True
+        convert_types: bool = True,
+        stream_threshold: Optional[int] = 1_048_576,
+        cache_results: bool = True
     ) -> None:
         """
         Initialize XML parser.
@@ -45,16 +175,32 @@ class XMLNFOParser(BaseNFOParser):
         Args:
             preserve_namespaces: Whether to preserve XML namespaces in field names
             convert_types: Whether to convert string values to appropriate types
+            stream_threshold: File size in bytes above which parse() streams the
+                file with iterparse (None to always build the full tree)
+            cache_results: Whether parse() keeps results for the most recently
+                parsed files and returns copies while a file is unchanged
         """
         self.preserve_namespaces = preserve_namespaces
         self.convert_types = convert_types
-        
-        # Common XML namespace prefixes for NFO files
-        self.common_namespaces = {
-            'kodi': 'http://kodi.tv/nfo',
-            'xbmc': 'http://xbmc.org/nfo',
-            'media': 'http://mediainfo.tv/nfo',
-        }
+        self.stream_threshold = stream_threshold
+        self.cache_results = cache_results
+        
+        # Parsed (data, encoding, metadata), keyed by (path, mtime_ns, size,
+        # preserve_namespaces, convert_types) and evicted least recently used
+        # first
+        self._result_cache: Dict[
+            Tuple[str, int, int, bool, bool], Tuple[Any, str, Dict[str, Any]]
+        ] = {}
+    
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        # Workers started by parse_many do not need the cached results
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state['_result_cache'] = {}
+        return None, state
+    
+    def clear_cache(self) -> None:
+        """Discard all results kept by parse()."""
+        self._result_cache.clear()
     
     def can_parse(self, file_path: Union[str, Path]) -> bool:
         """
@@ -66,35 +212,39 @@ class XMLNFOParser(BaseNFOParser):
         Returns:
             True if this parser can handle the file, False otherwise
         """
-        file_path = Path(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
         
         # Check file extension
-        if file_path.suffix.lower() not in [ext.lower() for ext in self.supported_extensions]:
+        if file_path.suffix.lower() not in self._supported_ext_set:
             return False
         
-        # Try to parse the first few lines to check if it's valid XML
+        # Cheap prolog probe on the start of the file; full validation
+        # happens in parse(), where failures become NFOParseError
         try:
-            content = self._read_file_content(file_path, encoding=None)
-            
-            # Quick check for XML-like content
-            if not content.strip().startswith('<'):
-                return False
-            
-            # Try to parse first element to verify XML structure
-            # Only read first 1000 characters for quick validation
-            sample = content[:1000]
-            if '<' in sample and '>' in sample:
-                # Try to find the first complete tag
-                try:
-                    ET.fromstring(content)
-                    return True
-                except ET.ParseError:
-                    return False
-            
+            with open(file_path, 'rb') as f:
+                window = f.read(_PROBE_SIZE)
+                is_complete = not f.read(1)
+        except OSError:
             return False
-            
-        except Exception:
+        
+        for bom, codec in _BOM_CODECS:
+            if window.startswith(bom):
+                window = window[len(bom):]
+                if codec != 'utf-8':
+                    window = window.decode(codec, 'ignore').encode('utf-8')
+                break
+        
+        window = window.strip()
+        if not _XML_PROLOG_RE.match(window):
             return False
+        
+        # .nfo files are often plain text, so when the whole file fits in
+        # the window also require the document to end with a tag
+        if is_complete and file_path.suffix.lower() == '.nfo':
+            return window.endswith(b'>')
+        
+        return True
     
     def parse(self, file_path: Union[str, Path]) -> NFOData:
         """
@@ -110,17 +260,51 @@ class XMLNFOParser(BaseNFOParser):
             NFOParseError: If parsing fails
             NFOAccessError: If file cannot be read
         """
-        file_path = Path(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+        
+        cache_key = None
+        if self.stream_threshold is not None or self.cache_results:
+            try:
+                stat_result = file_path.stat()
+            except OSError:
+                stat_result = None  # Let the regular path report the access error
+            
+            if stat_result is not None:
+                # Large files are streamed so the whole tree is never resident
+                file_size = stat_result.st_size
+                if self.stream_threshold is not None and file_size > self.stream_threshold:
+                    return self.parse_streaming(file_path)
+                
+                if self.cache_results:
+                    # The settings are part of the key since they are public
+                    # and may change between calls
+                    cache_key = (
+                        str(file_path), stat_result.st_mtime_ns, file_size,
+                        self.preserve_namespaces, self.convert_types
+                    )
+                    cached = self._result_cache.pop(cache_key, None)
+                    if cached is not None:
+                        # Re-insert so the entry becomes the most recently used
+                        self._result_cache[cache_key] = cached
+                        data, encoding, metadata = cached
+                        return NFOData(
+                            file_path=file_path,
+                            format_type="xml",
+                            data=_copy_data(data),
+                            encoding=encoding,
+                            metadata=_copy_data(metadata)
+                        )
         
         try:
             # Read file content
             encoding = self._detect_encoding(file_path)
             content = self._read_file_content(file_path, encoding=encoding)
             
-            # Parse XML
+            # Parse XML straight into the dictionary structure
             try:
-                root = ET.fromstring(content)
-            except ET.ParseError as e:
+                data, root_tag, root_attrib, element_count = self._parse_with_expat(content)
+            except _XML_PARSE_ERRORS as e:
                 raise NFOParseError(
                     f"Invalid XML structure: {str(e)}",
                     file_path=str(file_path),
@@ -128,9 +312,6 @@ class XMLNFOParser(BaseNFOParser):
                     parse_details=str(e)
                 ) from e
             
-            # Convert XML to dictionary structure
-            data = self._xml_to_dict(root)
-            
             # Create NFOData object
             nfo_data = NFOData(
                 file_path=file_path,
@@ -138,9 +319,9 @@ class XMLNFOParser(BaseNFOParser):
                 data=data,
                 encoding=encoding,
                 metadata={
-                    'root_element': root.tag,
-                    'xml_namespaces': self._extract_namespaces(root),
-                    'element_count': self._count_elements(root),
+                    'root_element': root_tag,
+                    'xml_namespaces': self._extract_namespaces(root_attrib),
+                    'element_count': element_count,
                     'parser_config': {
                         'preserve_namespaces': self.preserve_namespaces,
                         'convert_types': self.convert_types
@@ -148,6 +329,13 @@ class XMLNFOParser(BaseNFOParser):
                 }
             )
             
+            if cache_key is not None:
+                # Keep a private copy so edits to the result do not leak
+                cache = self._result_cache
+                cache[cache_key] = (_copy_data(data), encoding, _copy_data(nfo_data.metadata))
+                while len(cache) > _RESULT_CACHE_SIZE:
+                    cache.pop(next(iter(cache)), None)
+            
             return nfo_data
             
         except NFOParseError:
@@ -162,80 +350,323 @@ class XMLNFOParser(BaseNFOParser):
                 parse_details=str(e)
             ) from e
     
-    def _xml_to_dict(self, element: ET.Element) -> Dict[str, Any]:
+    def parse_streaming(self, file_path: Union[str, Path]) -> NFOData:
         """
-        Convert XML element tree to dictionary structure.
+        Parse an XML NFO file incrementally with bounded memory.
+        
+        Each direct child of the root element is converted to a dictionary
+        as soon as it is complete and then removed from the tree, so only
+        one top-level subtree is held at a time. The result is the same as
+        parse() would produce.
         
         Args:
-            element: XML element to convert
+            file_path: Path to the XML NFO file to parse
             
         Returns:
-            Dictionary representation of the XML structure
+            NFOData object containing the parsed information
+            
+        Raises:
+            NFOParseError: If parsing fails
+            NFOAccessError: If file cannot be read
         """
-        result = {}
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
         
-        # Handle element tag name (remove namespace if configured)
-        tag = element.tag
-        if not self.preserve_namespaces and '}' in tag:
-            tag = tag.split('}', 1)[1]  # Remove namespace
+        try:
+            with open(file_path, 'rb') as f:
+                encoding = self._detect_bytes_encoding(f.read(_ENCODING_SAMPLE_SIZE))
+                f.seek(0)
+                
+                if LET is not None:
+                    events = LET.iterparse(f, events=('start', 'end'), **_LXML_ITERPARSE_OPTIONS)
+                else:
+                    events = ET.iterparse(f, events=('start', 'end'))
+                
+                root = None
+                children: Dict[str, Any] = {}
+                element_count = 1  # Count root element
+                depth = 0
+                
+                try:
+                    for event, element in events:
+                        if event == 'start':
+                            if root is None:
+                                root = element
+                            depth += 1
+                            continue
+                        
+                        depth -= 1
+                        if depth == 1:
+                            # A top-level child is complete: convert and drop it
+                            self._add_child(
+                                children, self._clean_name(element.tag), self._xml_to_dict(element)
+                            )
+                            element_count += self._count_elements(element)
+                            root.remove(element)
+                except _XML_PARSE_ERRORS as e:
+                    raise NFOParseError(
+                        f"Invalid XML structure: {str(e)}",
+                        file_path=str(file_path),
+                        format_attempted="XML",
+                        parse_details=str(e)
+                    ) from e
+            
+            data = self._assemble_element(root, children)
+            
+            return NFOData(
+                file_path=file_path,
+                format_type="xml",
+                data=data,
+                encoding=encoding,
+                metadata={
+                    'root_element': root.tag,
+                    'xml_namespaces': self._extract_namespaces(root.attrib),
+                    'element_count': element_count,
+                    'parser_config': {
+                        'preserve_namespaces': self.preserve_namespaces,
+                        'convert_types': self.convert_types
+                    }
+                }
+            )
+            
+        except NFOParseError:
+            raise
+        except OSError as e:
+            raise NFOAccessError(
+                f"Cannot read file: {str(e)}",
+                file_path=str(file_path),
+                access_mode="read",
+                system_error=str(e)
+            ) from e
+        except Exception as e:
+            raise NFOParseError(
+                f"Unexpected error during XML parsing: {str(e)}",
+                file_path=str(file_path),
+                format_attempted="XML",
+                parse_details=str(e)
+            ) from e
+    
+    def _parse_with_expat(self, content: str) -> Tuple[Any, str, Dict[str, str], int]:
+        """
+        Parse a complete XML document directly into its dictionary form.
         
-        # Handle element text content
-        text = element.text.strip() if element.text else ""
+        Expat events drive an explicit stack of open elements, and each
+        element is converted as soon as its end tag is seen, so no element
+        tree is built. Names and text are reported exactly as ElementTree
+        would: {uri}name tags, and an element's text is the character data
+        before its first child.
         
-        # Handle element attributes
-        attributes = {}
-        for attr_name, attr_value in element.attrib.items():
-            # Remove namespace from attribute names if configured
-            clean_attr_name = attr_name
-            if not self.preserve_namespaces and '}' in attr_name:
-                clean_attr_name = attr_name.split('}', 1)[1]
-            
-            attributes[f"@{clean_attr_name}"] = self._convert_value(attr_value)
+        Args:
+            content: Decoded XML document
         
-        # Handle child elements
-        children = {}
-        child_groups = {}  # Track multiple children with same tag
+        Returns:
+            Tuple of (converted root, root tag, root attributes, element count)
         
-        for child in element:
-            child_tag = child.tag
-            if not self.preserve_namespaces and '}' in child_tag:
-                child_tag = child_tag.split('}', 1)[1]
+        Raises:
+            xml.parsers.expat.ExpatError: If the XML is malformed
+        """
+        # Each open element is [tag, attributes, text, children], where text
+        # is a list of data chunks until the first child joins it into a str
+        stack: List[List[Any]] = []
+        root: List[Any] = []
+        element_count = 0
+        assemble_value = self._assemble_value
+        strip_namespaces = not self.preserve_namespaces
+        
+        def start_element(name: str, attrs: Dict[str, str]) -> None:
+            nonlocal element_count
+            element_count += 1
+            if stack:
+                parent = stack[-1]
+                if parent[2].__class__ is list:
+                    parent[2] = ''.join(parent[2])
+            
+            # Expat reports uri}name; ElementTree's form is {uri}name
+            if '}' in name:
+                name = '{' + name
+            if attrs and any('}' in attr_name for attr_name in attrs):
+                attrs = {
+                    '{' + attr_name if '}' in attr_name else attr_name: value
+                    for attr_name, value in attrs.items()
+                }
+            stack.append([name, attrs, [], {}])
+        
+        def end_element(name: str) -> None:
+            tag, attrs, text, children = stack.pop()
+            if text.__class__ is list:
+                text = ''.join(text)
+            value = assemble_value(text, attrs, children)
+            if not stack:
+                root.extend((value, tag, attrs))
+                return
             
-            child_data = self._xml_to_dict(child)
+            if strip_namespaces:
+                tag = _strip_namespace(tag)
             
             # Handle multiple children with the same tag
-            if child_tag in children:
-                # We've seen this tag before
-                existing_value = children[child_tag]
+            siblings = stack[-1][3]
+            if tag in siblings:
+                existing_value = siblings[tag]
                 if isinstance(existing_value, list):
-                    # Already a list, just append
-                    existing_value.append(child_data)
+                    existing_value.append(value)
                 else:
-                    # Convert to list with both old and new values
-                    children[child_tag] = [existing_value, child_data]
-                child_groups[child_tag] = child_groups.get(child_tag, 1) + 1
+                    siblings[tag] = [existing_value, value]
+            else:
+                siblings[tag] = value
+        
+        def character_data(data: str) -> None:
+            if stack:
+                text = stack[-1][2]
+                if text.__class__ is list:
+                    text.append(data)
+        
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.buffer_text = True
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+        parser.Parse(content, True)
+        
+        value, root_tag, root_attrib = root
+        return value, root_tag, root_attrib, element_count
+    
+    def _xml_to_dict(self, element: ET.Element) -> Dict[str, Any]:
+        """
+        Convert XML element tree to dictionary structure.
+        
+        Args:
+            element: XML element to convert
+            
+        Returns:
+            Dictionary representation of the XML structure
+        """
+        strip_namespaces = not self.preserve_namespaces
+        assemble_element = self._assemble_element
+        
+        # Iterative post-order walk: each stack entry holds an element, the
+        # converted children collected so far and its child iterator, so
+        # deep documents need no Python frame per element
+        stack = [(element, {}, iter(element))]
+        
+        while True:
+            node, children, child_iter = stack[-1]
+            for child in child_iter:
+                stack.append((child, {}, iter(child)))
+                break
             else:
-                # First occurrence of this tag
-                children[child_tag] = child_data
-                child_groups[child_tag] = 1
-        
-        # Build final result
-        if text and not children and not attributes:
-            # Simple text element
-            return self._convert_value(text)
-        elif not text and not attributes and len(children) == 1:
-            # Single child element - flatten structure
-            child_key, child_value = next(iter(children.items()))
-            if isinstance(child_value, dict) and len(child_value) == 1:
-                return child_value
-        
-        # Complex element - build dictionary
-        if text:
-            result['#text'] = self._convert_value(text)
-        
-        if attributes:
-            result.update(attributes)
+                stack.pop()
+                value = assemble_element(node, children)
+                if not stack:
+                    return value
+                
+                # Strip the namespace once, when attaching to the parent
+                tag = node.tag
+                if strip_namespaces:
+                    tag = _strip_namespace(tag)
+                
+                # Handle multiple children with the same tag
+                siblings = stack[-1][1]
+                if tag in siblings:
+                    existing_value = siblings[tag]
+                    if isinstance(existing_value, list):
+                        existing_value.append(value)
+                    else:
+                        siblings[tag] = [existing_value, value]
+                else:
+                    siblings[tag] = value
+    
+    def _clean_name(self, name: str) -> str:
+        """
+        Remove the namespace from a tag or attribute name if configured.
         
+        Args:
+            name: Tag or attribute name, possibly in {uri}name form
+            
+        Returns:
+            Name to use as a dictionary key
+        """
+        if not self.preserve_namespaces:
+            return _strip_namespace(name)  # Remove namespace
+        return name
+    
+    def _add_child(self, children: Dict[str, Any], child_tag: str, child_data: Any) -> None:
+        """
+        Add a converted child element, grouping repeated tags into lists.
+        
+        Args:
+            children: Children collected so far, updated in place
+            child_tag: Cleaned tag of the child
+            child_data: Converted child value
+        """
+        # Handle multiple children with the same tag
+        if child_tag in children:
+            # We've seen this tag before
+            existing_value = children[child_tag]
+            if isinstance(existing_value, list):
+                # Already a list, just append
+                existing_value.append(child_data)
+            else:
+                # Convert to list with both old and new values
+                children[child_tag] = [existing_value, child_data]
+        else:
+            # First occurrence of this tag
+            children[child_tag] = child_data
+    
+    def _assemble_element(self, element: ET.Element, children: Dict[str, Any]) -> Any:
+        """
+        Combine an element's text and attributes with its converted children.
+        
+        Args:
+            element: XML element being converted
+            children: Its converted children by cleaned tag
+        
+        Returns:
+            Dictionary representation, or a plain value for simple elements
+        """
+        return self._assemble_value(element.text, element.attrib, children)
+    
+    def _assemble_value(
+        self,
+        text: Optional[str],
+        attrib: Dict[str, str],
+        children: Dict[str, Any]
+    ) -> Any:
+        """
+        Combine an element's text, attributes and converted children.
+        
+        Args:
+            text: Text before the element's first child, if any
+            attrib: Element attributes by qualified name
+            children: Converted children by cleaned tag
+        
+        Returns:
+            Dictionary representation, or a plain value for simple elements
+        """
+        # Handle element text content
+        text = text.strip() if text else ""
+        
+        if not attrib:
+            if not children:
+                # Simple text element
+                return self._convert_value(text) if text else {}
+            if not text:
+                if len(children) == 1:
+                    # Single child element - flatten structure
+                    child_value = next(iter(children.values()))
+                    if isinstance(child_value, dict) and len(child_value) == 1:
+                        return child_value
+                return children
+            result = {'#text': self._convert_value(text)}
+            result.update(children)
+            return result
+        
+        # Complex element - text, then attributes, then children
+        convert_value = self._convert_value
+        clean_name = self._clean_name
+        result = {'#text': convert_value(text)} if text else {}
+        for attr_name, attr_value in attrib.items():
+            # Remove namespace from attribute names if configured
+            result['@' + clean_name(attr_name)] = convert_value(attr_value)
         if children:
             result.update(children)
         
@@ -254,19 +685,26 @@ class XMLNFOParser(BaseNFOParser):
         if not self.convert_types:
             return value
         
-        # Try to convert to appropriate types
+        # Try to convert to appropriate types. strip() returns the same
+        # object when there is nothing to remove, which is cheaper than
+        # testing the end characters first (and covers Unicode whitespace)
         value = value.strip()
         
         if not value:
             return value
         
         # Boolean values
-        if value.lower() in ('true', 'yes', '1'):
+        lowered = value.lower()
+        if lowered in _TRUE_VALUES:
             return True
-        elif value.lower() in ('false', 'no', '0'):
+        elif lowered in _FALSE_VALUES:
             return False
         
-        # Numeric values
+        # Numeric values; anything not starting like a number is a string
+        first = value[0]
+        if not (first.isdigit() or first in '+-.'):
+            return value
+        
         try:
             # Try integer first
             if '.' not in value:
@@ -279,20 +717,20 @@ class XMLNFOParser(BaseNFOParser):
         # Return as string if no conversion applies
         return value
     
-    def _extract_namespaces(self, root: ET.Element) -> Dict[str, str]:
+    def _extract_namespaces(self, root_attrib: Dict[str, str]) -> Dict[str, str]:
         """
         Extract XML namespaces from the root element.
         
         Args:
-            root: Root XML element
-            
+            root_attrib: Attributes of the root XML element
+        
         Returns:
             Dictionary mapping namespace prefixes to URIs
         """
         namespaces = {}
         
         # Extract from root element attributes
-        for attr_name, attr_value in root.attrib.items():
+        for attr_name, attr_value in root_attrib.items():
             if attr_name.startswith('xmlns'):
                 if ':' in attr_name:
                     prefix = attr_name.split(':', 1)[1]
@@ -312,12 +750,8 @@ class XMLNFOParser(BaseNFOParser):
         Returns:
             Total count of elements
         """
-        count = 1  # Count root element
-        
-        for child in root:
-            count += self._count_elements(child)
-        
-        return count
+        # iter() walks the tree in C and includes the root element itself
+        return sum(1 for _ in root.iter())
     
     def get_common_fields(self, nfo_data: NFOData) -> Dict[str, Any]:
         """
@@ -335,63 +769,59 @@ class XMLNFOParser(BaseNFOParser):
         common_fields = {}
         data = nfo_data.data
         
-        # Common field mappings for different XML structures
-        field_mappings = [
-            # Movie/TV show fields
-            ('title', ['title', 'name', 'originaltitle']),
-            ('plot', ['plot', 'summary', 'description', 'overview']),
-            ('year', ['year', 'premiered', 'releasedate']),
-            ('genre', ['genre', 'genres']),
-            ('rating', ['rating', 'imdb_rating', 'tmdb_rating']),
-            ('runtime', ['runtime', 'duration']),
-            ('director', ['director', 'directors']),
-            ('cast', ['actor', 'actors', 'cast']),
-            ('studio', ['studio', 'studios', 'distributor']),
-            ('tagline', ['tagline', 'slogan']),
-            
-            # Music fields
-            ('artist', ['artist', 'albumartist', 'performer']),
-            ('album', ['album', 'title']),
-            ('track', ['track', 'tracknumber']),
-            ('discnumber', ['discnumber', 'disc']),
-            
-            # Episode fields
-            ('season', ['season', 'seasonnumber']),
-            ('episode', ['episode', 'episodenumber']),
-            ('showtitle', ['showtitle', 'seriesname']),
-            
-            # General metadata
-            ('dateadded', ['dateadded', 'added', 'created']),
-            ('lastplayed', ['lastplayed', 'viewed']),
-            ('playcount', ['playcount', 'timesviewed']),
-        ]
-        
-        for common_name, possible_keys in field_mappings:
-            value = self._find_field_value(data, possible_keys)
+        lower_index = self._lower_key_index(data)
+        for common_name, possible_keys in _COMMON_FIELD_MAPPINGS:
+            value = self._find_field_value(data, possible_keys, lower_index)
             if value is not None:
                 common_fields[common_name] = value
         
         return common_fields
     
-    def _find_field_value(self, data: Dict[str, Any], possible_keys: List[str]) -> Any:
+    @staticmethod
+    def _lower_key_index(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map lowercased string keys of data to their values.
+        
+        The first key wins when several differ only in case, matching a
+        linear case-insensitive scan in insertion order.
+        
+        Args:
+            data: Dictionary to index
+        
+        Returns:
+            Lowercased key to value mapping
+        """
+        lower_index = {}
+        for key, value in data.items():
+            if isinstance(key, str):
+                lower_index.setdefault(key.lower(), value)
+        return lower_index
+    
+    def _find_field_value(
+        self,
+        data: Dict[str, Any],
+        possible_keys: Sequence[str],
+        lower_index: Optional[Dict[str, Any]] = None
+    ) -> Any:
         """
         Find a field value using multiple possible key names.
         
         Args:
             data: Dictionary to search in
-            possible_keys: List of possible key names to try
-            
+            possible_keys: Lowercase key names to try, in order
+            lower_index: Precomputed result of _lower_key_index(data)
+        
         Returns:
             Found value or None if not found
         """
+        if lower_index is None:
+            lower_index = self._lower_key_index(data)
+        
         for key in possible_keys:
-            # Try exact match
+            # Try exact match, then case-insensitive match
             if key in data:
                 return data[key]
-            
-            # Try case-insensitive match
-            for actual_key, value in data.items():
-                if isinstance(actual_key, str) and actual_key.lower() == key.lower():
-                    return value
+            if key in lower_index:
+                return lower_index[key]
         
         return None
@@ -23,6 +23,8 @@ class NFOError(Exception):
         details (Optional[dict]): Additional error context information
     """
 
+    __slots__ = ('message', 'file_path', 'details')
+
     def __init__(
         self, 
         message: str, 
@@ -48,6 +50,24 @@ class NFOError(Exception):
         if self.file_path:
             base_msg += f" (file: {self.file_path})"
         return base_msg
+    
+    def __reduce__(self) -> tuple:
+        """
+        Support pickling, e.g. when errors cross process pool boundaries.
+        
+        BaseException only pickles args and __dict__, so the slot
+        attributes are added to the state restored by __setstate__.
+        
+        Returns:
+            Tuple of (class, args, state)
+        """
+        reduced = super().__reduce__()
+        state = dict(reduced[2]) if len(reduced) > 2 and reduced[2] else {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return reduced[0], reduced[1], state
 
 
 class NFOParseError(NFOError):
@@ -62,6 +82,8 @@ class NFOParseError(NFOError):
         parse_details (Optional[str]): Additional parsing error information
     """
 
+    __slots__ = ('format_attempted', 'parse_details')
+
     def __init__(
         self,
         message: str,
@@ -99,6 +121,8 @@ class NFOFieldError(NFOError):
         operation (Optional[str]): The operation that failed (get, set, validate, etc.)
     """
 
+    __slots__ = ('field_name', 'field_value', 'operation')
+
     def __init__(
         self,
         message: str,
@@ -137,6 +161,8 @@ class NFOAccessError(NFOError):
         system_error (Optional[str]): The underlying system error message
     """
 
+    __slots__ = ('access_mode', 'system_error')
+
     def __init__(
         self,
         message: str,
@@ -172,6 +198,8 @@ class NFOFormatError(NFOError):
         supported_formats (Optional[list]): List of supported formats
     """
 
+    __slots__ = ('detected_format', 'supported_formats')
+
     def __init__(
         self,
         message: str,
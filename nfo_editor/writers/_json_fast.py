@@ -0,0 +1,154 @@
+"""
+Optional Numba-accelerated helpers for the JSON writer.
+
+The kernels in this module operate on UTF-8 byte buffers and are only
+compiled when numba and numpy are installed. Callers should use the
+``get_*`` accessors, which return None when acceleration is unavailable so
+that the pure-Python path can be used instead.
+
+Author: NFO Editor Team
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+
+# Compiled kernel cache: None until first use, False if numba is unavailable
+_jit_analyze_structure: Any = None
+
+
+def _analyze_structure_kernel(buf: Any, stats: Any) -> None:
+    """
+    Compute JSON structure statistics by scanning the document text.
+    
+    buf must hold a document json.loads accepts. The statistics match the
+    writer's _analyze_structure on the parsed value as long as no object
+    repeats a key (the text is scanned, so repeated keys are all counted).
+    
+    Args:
+        buf: Input uint8 array
+        stats: int64 array of 4 receiving total_keys, max_depth, has_arrays
+            and empty_values
+    """
+    n = buf.shape[0]
+    total_keys = 0
+    max_depth = 0
+    has_arrays = 0
+    empty_values = 0
+    level = 0
+    i = 0
+    
+    while i < n:
+        c = buf[i]
+        
+        # Whitespace and separators
+        if c == 32 or c == 10 or c == 13 or c == 9 or c == 44:
+            i += 1
+            continue
+        
+        if c == 125 or c == 93:  # '}' / ']' closes a non-empty container
+            level -= 1
+            i += 1
+            continue
+        
+        if c == 123 or c == 91:  # '{' / '['
+            if c == 91:
+                has_arrays = 1
+            j = i + 1
+            while j < n and (buf[j] == 32 or buf[j] == 10 or buf[j] == 13 or buf[j] == 9):
+                j += 1
+            if j < n and (buf[j] == 125 or buf[j] == 93):
+                # Empty container: a leaf counted at its parent's level
+                if level > 0:
+                    empty_values += 1
+                    if level > max_depth:
+                        max_depth = level
+                i = j + 1
+            else:
+                level += 1
+                i = j
+            continue
+        
+        if c == 34:  # '"' starts a key or a string value
+            start = i + 1
+            i = start
+            while buf[i] != 34:
+                if buf[i] == 92:  # backslash escapes the next byte
+                    i += 1
+                i += 1
+            is_empty = i == start
+            i += 1
+            
+            j = i
+            while j < n and (buf[j] == 32 or buf[j] == 10 or buf[j] == 13 or buf[j] == 9):
+                j += 1
+            if j < n and buf[j] == 58:  # ':' follows a key
+                total_keys += 1
+                i = j + 1
+                continue
+            
+            if level > 0:
+                if is_empty:
+                    empty_values += 1
+                if level > max_depth:
+                    max_depth = level
+            continue
+        
+        # Other scalars: null, true, false, numbers, NaN, Infinity
+        if level > 0:
+            if c == 110:  # 'n' of null
+                empty_values += 1
+            if level > max_depth:
+                max_depth = level
+        while i < n:
+            c = buf[i]
+            if c == 44 or c == 125 or c == 93 or c == 32 or c == 10 or c == 13 or c == 9:
+                break
+            i += 1
+    
+    stats[0] = total_keys
+    stats[1] = max_depth
+    stats[2] = has_arrays
+    stats[3] = empty_values
+
+
+def get_jit_analyze_structure() -> Optional[Callable[[str], Dict[str, Any]]]:
+    """
+    Get the Numba-compiled structure analyzer, compiling it on first use.
+    
+    Returns:
+        Function mapping valid JSON text to a dictionary with total_keys,
+        max_depth, has_arrays and empty_values, or None if numba/numpy are
+        not installed
+    """
+    global _jit_analyze_structure
+    
+    if _jit_analyze_structure is None:
+        try:
+            import numba
+            import numpy as np
+        except ImportError:
+            _jit_analyze_structure = False
+            return None
+        
+        kernel = numba.njit(cache=True)(_analyze_structure_kernel)
+        
+        def analyze_structure(content: str) -> Dict[str, Any]:
+            buf = np.frombuffer(content.encode('utf-8'), dtype=np.uint8)
+            stats = np.zeros(4, dtype=np.int64)
+            kernel(buf, stats)
+            return {
+                'total_keys': int(stats[0]),
+                'max_depth': int(stats[1]),
+                'has_arrays': bool(stats[2]),
+                'empty_values': int(stats[3])
+            }
+        
+        _jit_analyze_structure = analyze_structure
+    
+    return _jit_analyze_structure or None
+
+
+def disable_jit_analyze_structure() -> None:
+    """Stop using the compiled structure analyzer (e.g. after a compile failure)."""
+    global _jit_analyze_structure
+    _jit_analyze_structure = False
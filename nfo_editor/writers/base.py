@@ -8,14 +8,26 @@ respective formats.
 Author: NFO Editor Team
 """
 
+import os
+import shutil
+import time
 from abc import ABC, abstractmethod
-from typing import Union, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Union, Optional, Iterable, Iterator, List, Sequence, Tuple, IO
 from pathlib import Path
 
 from ..parsers.base import NFOData
 from ..utils.exceptions import NFOAccessError, NFOFormatError
 
 
+# Flags for replacing a file's content through a raw file descriptor
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# Flags for creating the temporary file that replaces a streamed file
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+
 class BaseNFOWriter(ABC):
     """
     Abstract base class for all NFO file writers.
@@ -30,6 +42,9 @@ class BaseNFOWriter(ABC):
         preserve_formatting (bool): Whether to preserve original formatting when possible
     """
     
+    # No per-instance __dict__ here, so writers declaring __slots__ get none
+    __slots__ = ()
+    
     format_name: str = "Unknown"
     default_extension: str = ".nfo"
     preserve_formatting: bool = True
@@ -71,6 +86,42 @@ class BaseNFOWriter(ABC):
         """
         pass
     
+    def write_many_threaded(
+        self,
+        items: Iterable[Tuple[NFOData, Optional[Union[str, Path]]]],
+        workers: Optional[int] = None,
+        create_backup: bool = True
+    ) -> List[Path]:
+        """
+        Write many NFO files in a thread pool within this process.
+        
+        File writes release the GIL, so the latency of opening, writing and
+        closing each file overlaps with the formatting of the others.
+        
+        Args:
+            items: (nfo_data, output_path) pairs; a None output path writes
+                back to the data's original file
+            workers: Number of worker threads (defaults to the executor default)
+            create_backup: Whether to create a backup of each existing file
+            
+        Returns:
+            List of written file paths in the same order as items
+            
+        Raises:
+            NFOAccessError: If any file cannot be written
+            NFOFormatError: If any data format is not supported by this writer
+        """
+        pairs = list(items)
+        
+        # A pool is not worth starting for a single file
+        if len(pairs) <= 1:
+            return [self.write(nfo_data, path, create_backup) for nfo_data, path in pairs]
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda pair: self.write(pair[0], pair[1], create_backup), pairs
+            ))
+    
     def _create_backup(self, file_path: Union[str, Path]) -> Optional[Path]:
         """
         Create a backup copy of an existing file.
@@ -84,9 +135,6 @@ class BaseNFOWriter(ABC):
         Raises:
             NFOAccessError: If backup creation fails
         """
-        import shutil
-        from datetime import datetime
-        
         file_path = Path(file_path)
         
         if not file_path.exists():
@@ -94,7 +142,7 @@ class BaseNFOWriter(ABC):
             
         try:
             # Create backup with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             backup_name = f"{file_path.stem}.{timestamp}.backup{file_path.suffix}"
             backup_path = file_path.parent / backup_name
             
@@ -127,22 +175,60 @@ class BaseNFOWriter(ABC):
             NFOAccessError: If file cannot be written
         """
         try:
-            # Ensure parent directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(file_path, 'w', encoding=encoding) as f:
-                f.write(content)
-                
-        except IOError as e:
+            # Encode once up front, translating newlines as text mode would;
+            # an encoding failure then leaves any existing file untouched
+            if os.linesep != '\n':
+                content = content.replace('\n', os.linesep)
+            data = content.encode(encoding)
+        except UnicodeEncodeError as e:
             raise NFOAccessError(
-                f"Cannot write file: {str(e)}",
+                f"Cannot encode content with encoding {encoding}: {str(e)}",
                 file_path=str(file_path),
                 access_mode="write",
                 system_error=str(e)
             ) from e
-        except UnicodeEncodeError as e:
+        
+        self._write_file_bytes(data, file_path)
+    
+    def _write_file_bytes(
+        self,
+        data: Union[bytes, Sequence[bytes]],
+        file_path: Union[str, Path]
+    ) -> None:
+        """
+        Write already encoded content to a file with proper error handling.
+        
+        The bytes are handed to the file descriptor directly instead of going
+        through a buffered file object. Content may be given as a sequence of
+        chunks (e.g. a header and a body) to avoid joining them first.
+        
+        Args:
+            data: Encoded content to write, or its chunks in order
+            file_path: Path to write to
+            
+        Raises:
+            NFOAccessError: If file cannot be written
+        """
+        file_path = Path(file_path)
+        
+        try:
+            # Ensure parent directory exists
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            chunks = (data,) if isinstance(data, (bytes, bytearray, memoryview)) else data
+            
+            fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+            try:
+                for chunk in chunks:
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        
+        except OSError as e:
             raise NFOAccessError(
-                f"Cannot encode content with encoding {encoding}: {str(e)}",
+                f"Cannot write file: {str(e)}",
                 file_path=str(file_path),
                 access_mode="write",
                 system_error=str(e)
@@ -199,6 +285,54 @@ class BaseNFOWriter(ABC):
         
         return original_path
     
+    @contextmanager
+    def _open_replacement(
+        self,
+        file_path: Path,
+        mode: str,
+        **open_kwargs
+    ) -> Iterator[IO]:
+        """
+        Open a temporary file that replaces file_path once fully written.
+        
+        Content written incrementally therefore never leaves the target
+        truncated: if writing fails, the temporary file is removed and any
+        existing file is left untouched. A replaced file keeps its
+        permissions, as it would when opened for writing.
+        
+        Args:
+            file_path: Path to write to
+            mode: Write mode for open() ('w' or 'wb')
+            **open_kwargs: Further open() arguments, e.g. encoding
+            
+        Yields:
+            File object for the new content
+        """
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        while True:
+            temp_path = file_path.with_name(f'.{file_path.name}.{os.urandom(4).hex()}.tmp')
+            try:
+                fd = os.open(temp_path, _CREATE_FLAGS, 0o666)
+                break
+            except FileExistsError:
+                continue
+        
+        try:
+            with os.fdopen(fd, mode, **open_kwargs) as f:
+                yield f
+            try:
+                shutil.copymode(file_path, temp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+    
     def _preserve_file_metadata(self, source_path: Path, target_path: Path) -> None:
         """
         Preserve file metadata (permissions, timestamps) from source to target.
@@ -207,13 +341,10 @@ class BaseNFOWriter(ABC):
             source_path: Source file path
             target_path: Target file path
         """
-        import os
-        import shutil
-        
         try:
-            if source_path.exists() and target_path.exists():
-                # Copy file metadata (timestamps, permissions)
-                shutil.copystat(source_path, target_path)
+            # Copy file metadata (timestamps, permissions); a missing file
+            # raises here instead of being stat'ed twice beforehand
+            shutil.copystat(source_path, target_path)
         except Exception:
             # Silently fail if metadata preservation fails
             # This is not critical for the core functionality
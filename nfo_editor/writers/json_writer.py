@@ -8,14 +8,96 @@ data integrity and readability.
 Author: NFO Editor Team
 """
 
+import codecs
 import json
-from typing import Union, Optional, Dict, Any, List
+import os
+import re
+from json.encoder import encode_basestring, encode_basestring_ascii
+from enum import Enum
+from itertools import islice
+from typing import Union, Optional, Dict, Any, List, Set, Tuple
 from pathlib import Path
 
 from .base import BaseNFOWriter
+from ._json_fast import get_jit_analyze_structure, disable_jit_analyze_structure
 from ..parsers.base import NFOData
 from ..utils.exceptions import NFOFormatError, NFOAccessError
 
+# Estimated output size from which write() streams the stdlib encoder
+_STREAM_MIN_SIZE = 4 * 1024 * 1024
+
+# Write buffer used while streaming encoder output
+_STREAM_BUFFER_SIZE = 1024 * 1024
+
+# Encoder chunks joined into each write while streaming
+_STREAM_BATCH_CHUNKS = 4096
+
+# Prefer orjson's C encoder for the layouts it can reproduce exactly
+try:
+    import orjson
+    FAST_JSON_ENCODER = "orjson"
+except ImportError:
+    orjson = None
+    FAST_JSON_ENCODER = None
+
+
+# Exponent of a float as orjson may write it (1e-7, 1e16, 1.5e+300)
+_FLOAT_EXPONENT_RE = re.compile(rb'\de[-+]?\d')
+
+
+def _has_unmatched_float(data: Any) -> bool:
+    """
+    Check whether data contains floats orjson writes unlike json.dumps.
+    
+    The stdlib encoder writes NaN and infinities as NaN/Infinity, while
+    orjson writes null. Floats in exponent notation may be spelled
+    differently too (1e-07 vs 1e-7, and 1e+16 vs 1e16 in some orjson
+    versions), so the fast path must not be used for any of these.
+    
+    Args:
+        data: JSON-ready data to inspect
+        
+    Returns:
+        True if any float in data is not finite or uses an exponent
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float) and (
+            value - value != 0 or 'e' in float.__repr__(value)
+        ):
+            return True
+    return False
+
+
+# Output size above which validation statistics use the Numba scanner
+_JIT_ANALYZE_MIN_SIZE = 1_048_576
+
+# Metadata keys that make the writer wrap data with a metadata section
+_RELEVANT_METADATA_KEYS = frozenset({
+    'original_structure', 'detected_structure', 'format_type',
+    'creation_date', 'last_modified', 'source_file'
+})
+
+# Metadata keys copied into that section
+_INCLUDED_METADATA_KEYS = frozenset({
+    'original_structure', 'detected_structure', 'format_type',
+    'total_keys', 'max_depth', 'creation_date', 'last_modified'
+})
+
+# Number of flat-document templates kept per writer
+_FLAT_TEMPLATE_CACHE_SIZE = 128
+
+# Value types a flat-document template can encode
+_FLAT_VALUE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Leaf types json.loads can return
+_JSON_NATIVE_TYPES = (str, int, float, bool, type(None))
+
 
 class JSONNFOWriter(BaseNFOWriter):
     """
@@ -60,6 +142,12 @@ class JSONNFOWriter(BaseNFOWriter):
         self.sort_keys = sort_keys
         self.ensure_ascii = ensure_ascii
         self.separators = separators
+        
+        # Stdlib encoders by (indent, sort_keys, ensure_ascii, separators)
+        self._encoder_cache: Dict[Tuple[Any, ...], json.JSONEncoder] = {}
+        
+        # Flat-document templates by (options, keys); None if not flat
+        self._flat_template_cache: Dict[Tuple[Any, ...], Optional[Tuple[Any, ...]]] = {}
     
     def can_write(self, nfo_data: NFOData) -> bool:
         """
@@ -107,11 +195,31 @@ class JSONNFOWriter(BaseNFOWriter):
             backup_path = self._create_backup(output_path)
         
         try:
-            # Generate JSON content
-            json_content = self._generate_json_content(nfo_data)
-            
-            # Write to file
-            self._write_file_content(json_content, output_path, nfo_data.encoding)
+            if self._should_stream(nfo_data):
+                # Encode straight into the file so the output is never held whole
+                self._stream_json_content(nfo_data, output_path)
+            else:
+                options = self._json_options()
+                data_to_write = self._build_json_document(nfo_data)
+                encoded = self._dumps_fast_bytes(data_to_write, options)
+                
+                # orjson output is UTF-8 with '\n' newlines already, so it can
+                # be written as is instead of being decoded and re-encoded
+                if (
+                    encoded is not None
+                    and os.linesep == '\n'
+                    and codecs.lookup(nfo_data.encoding).name == 'utf-8'
+                ):
+                    self._write_file_bytes(encoded, output_path)
+                else:
+                    # Generate JSON content
+                    if encoded is not None:
+                        json_content = encoded.decode('utf-8')
+                    else:
+                        json_content = self._dumps_stdlib(nfo_data, data_to_write, options)
+                    
+                    # Write to file
+                    self._write_file_content(json_content, output_path, nfo_data.encoding)
             
             # Preserve file metadata if original file existed
             if backup_path:
@@ -127,70 +235,371 @@ class JSONNFOWriter(BaseNFOWriter):
                 system_error=str(e)
             ) from e
     
-    def _generate_json_content(self, nfo_data: NFOData) -> str:
+    def _generate_json_content(
+        self,
+        nfo_data: NFOData,
+        options: Optional[Tuple[Any, ...]] = None
+    ) -> str:
         """
         Generate JSON content from NFO data.
         
         Args:
             nfo_data: NFOData object to convert
+            options: Formatting options from _json_options() (defaults to
+                the writer's current settings)
+                
+        Returns:
+            JSON content as string
+        """
+        if options is None:
+            options = self._json_options()
+        
+        data_to_write = self._build_json_document(nfo_data)
+        
+        json_str = self._dumps_fast(data_to_write, options)
+        if json_str is not None:
+            return json_str
+        
+        return self._dumps_stdlib(nfo_data, data_to_write, options)
+    
+    def _dumps_stdlib(
+        self,
+        nfo_data: NFOData,
+        data_to_write: Any,
+        options: Tuple[Any, ...]
+    ) -> str:
+        """
+        Serialize a JSON document with the stdlib encoder.
+        
+        Args:
+            nfo_data: NFOData object the document was built from
+            data_to_write: Document from _build_json_document()
+            options: Formatting options from _json_options()
             
         Returns:
             JSON content as string
+            
+        Raises:
+            NFOFormatError: If the document cannot be serialized
+        """
+        try:
+            # Indented output of flat documents is assembled from a per-schema
+            # template; the stdlib only has a C encoder for compact output
+            if options[0] is not None and type(data_to_write) is dict:
+                json_str = self._dumps_flat(data_to_write, options)
+                if json_str is not None:
+                    return json_str
+            
+            # Generate JSON string
+            return self._get_encoder(options).encode(data_to_write)
+        
+        except (TypeError, ValueError) as e:
+            raise NFOFormatError(
+                f"Failed to serialize data to JSON: {str(e)}",
+                file_path=str(nfo_data.file_path),
+                detected_format="JSON"
+            ) from e
+    
+    def _dumps_flat(self, data: Dict[str, Any], options: Tuple[Any, ...]) -> Optional[str]:
+        """
+        Serialize a dict of scalar values the way the stdlib encoder would.
+        
+        Key strings, separators and indentation are encoded once per key set
+        and option set, so only the values are encoded per call.
+        
+        Args:
+            data: Document to serialize
+            options: Formatting options from _json_options()
+            
+        Returns:
+            JSON content as string, or None if data is not a flat document
+        """
+        template = self._get_flat_template(data, options)
+        if template is None:
+            return None
+        
+        prefixes, sorted_keys, closing, encode_string = template
+        values = data.values() if sorted_keys is None else [data[key] for key in sorted_keys]
+        
+        # Same value handling and order of checks as json.encoder
+        parts = []
+        append = parts.append
+        for prefix, value in zip(prefixes, values):
+            append(prefix)
+            if isinstance(value, str):
+                append(encode_string(value))
+            elif value is None:
+                append('null')
+            elif value is True:
+                append('true')
+            elif value is False:
+                append('false')
+            elif isinstance(value, int):
+                append(int.__repr__(value))
+            elif isinstance(value, float):
+                if value - value == 0:
+                    append(float.__repr__(value))
+                elif value != value:
+                    append('NaN')
+                else:
+                    append('Infinity' if value > 0 else '-Infinity')
+            else:
+                return None
+        append(closing)
+        
+        return ''.join(parts)
+    
+    def _get_flat_template(
+        self,
+        data: Dict[str, Any],
+        options: Tuple[Any, ...]
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Get the output template for a flat document's keys, building it on first use.
+        
+        Args:
+            data: Document to serialize
+            options: Formatting options from _json_options()
+            
+        Returns:
+            Tuple of (key prefixes, key order or None, closing text, string
+            encoder), or None if documents with these keys are not flat
+        """
+        keys = tuple(data)
+        cache_key = (options, keys)
+        cache = self._flat_template_cache
+        
+        try:
+            return cache[cache_key]
+        except KeyError:
+            pass
+        
+        template = None
+        if (
+            keys
+            and all(type(key) is str for key in keys)
+            and all(type(value) in _FLAT_VALUE_TYPES for value in data.values())
+        ):
+            indent, sort_keys, ensure_ascii, separators = options
+            if not isinstance(indent, str):
+                indent = ' ' * indent
+            item_separator, key_separator = separators or (',', ': ')
+            encode_string = encode_basestring_ascii if ensure_ascii else encode_basestring
+            
+            ordered_keys = sorted(keys) if sort_keys else keys
+            newline_indent = '\n' + indent
+            prefixes = [
+                item_separator + newline_indent + encode_string(key) + key_separator
+                for key in ordered_keys
+            ]
+            prefixes[0] = '{' + newline_indent + encode_string(ordered_keys[0]) + key_separator
+            template = (prefixes, ordered_keys if sort_keys else None, '\n}', encode_string)
+        
+        cache[cache_key] = template
+        while len(cache) > _FLAT_TEMPLATE_CACHE_SIZE:
+            cache.pop(next(iter(cache)), None)
+        
+        return template
+    
+    def _build_json_document(self, nfo_data: NFOData) -> Any:
+        """
+        Build the value to serialize for NFO data.
+        
+        Args:
+            nfo_data: NFOData object to convert
+            
+        Returns:
+            The data, wrapped together with relevant metadata if there is any
         """
-        # Prepare data for JSON serialization
-        data_to_write = self._prepare_data_for_json(nfo_data.data)
+        # Non-JSON types are converted lazily by the encoder's default hook
+        data_to_write = nfo_data.data
+        metadata = nfo_data.metadata
         
         # Add metadata if it contains useful information
-        if nfo_data.metadata and self._should_include_metadata(nfo_data.metadata):
+        if metadata and self._should_include_metadata(metadata):
             data_to_write = {
                 'data': data_to_write,
-                'metadata': self._filter_metadata(nfo_data.metadata)
+                'metadata': self._filter_metadata(metadata)
             }
         
+        return data_to_write
+    
+    def _should_stream(self, nfo_data: NFOData) -> bool:
+        """
+        Decide whether write() should stream the encoder output to the file.
+        
+        dumps followed by a single write is faster, so streaming is only used
+        for large data that orjson cannot handle. The size of the source file
+        serves as a cheap estimate of the output size.
+        
+        Args:
+            nfo_data: NFOData object to be written
+            
+        Returns:
+            True if the output should be streamed
+        """
+        if self._orjson_option(self._json_options()) is not None:
+            return False
+        
         try:
-            # Generate JSON string
-            json_str = json.dumps(
-                data_to_write,
-                indent=self.indent,
-                sort_keys=self.sort_keys,
-                ensure_ascii=self.ensure_ascii,
-                separators=self.separators,
+            return nfo_data.file_path.stat().st_size >= _STREAM_MIN_SIZE
+        except OSError:
+            return False
+    
+    def _stream_json_content(self, nfo_data: NFOData, output_path: Path) -> None:
+        """
+        Encode NFO data as JSON directly into a file.
+        
+        The stdlib encoder's chunks are joined in batches and go through a
+        large write buffer, so peak memory stays bounded without a write()
+        call per chunk. They are written to a temporary file that replaces
+        the target only once encoding has succeeded.
+        
+        Args:
+            nfo_data: NFOData object to write
+            output_path: Path to write to
+            
+        Raises:
+            NFOFormatError: If the data cannot be serialized
+        """
+        encoder = self._get_encoder(self._json_options())
+        
+        with self._open_replacement(
+            output_path, 'w', encoding=nfo_data.encoding, buffering=_STREAM_BUFFER_SIZE
+        ) as f:
+            try:
+                chunks = encoder.iterencode(self._build_json_document(nfo_data))
+                while True:
+                    batch = ''.join(islice(chunks, _STREAM_BATCH_CHUNKS))
+                    if not batch:
+                        break
+                    f.write(batch)
+            except (TypeError, ValueError) as e:
+                raise NFOFormatError(
+                    f"Failed to serialize data to JSON: {str(e)}",
+                    file_path=str(nfo_data.file_path),
+                    detected_format="JSON"
+                ) from e
+    
+    def _json_options(self) -> Tuple[Any, ...]:
+        """
+        Get the writer's current formatting options.
+        
+        Returns:
+            Tuple of (indent, sort_keys, ensure_ascii, separators)
+        """
+        return self.indent, self.sort_keys, self.ensure_ascii, self.separators
+    
+    def _get_encoder(self, options: Tuple[Any, ...]) -> json.JSONEncoder:
+        """
+        Get a stdlib encoder for the given options, creating it on first use.
+        
+        Encoders keep no state between encode() calls, so one instance per
+        option set can be shared by all calls and threads.
+        
+        Args:
+            options: Formatting options from _json_options()
+            
+        Returns:
+            Configured JSONEncoder
+        """
+        encoder = self._encoder_cache.get(options)
+        if encoder is None:
+            indent, sort_keys, ensure_ascii, separators = options
+            encoder = json.JSONEncoder(
+                indent=indent,
+                sort_keys=sort_keys,
+                ensure_ascii=ensure_ascii,
+                separators=separators,
                 default=self._json_serializer
             )
+            self._encoder_cache[options] = encoder
+        return encoder
+    
+    def _orjson_option(self, options: Tuple[Any, ...]) -> Optional[int]:
+        """
+        Get the orjson option flags reproducing the given json.dumps settings.
+        
+        orjson only supports 2-space indentation or fully compact output and
+        never escapes non-ASCII text.
+        
+        Args:
+            options: Formatting options from _json_options()
             
-            return json_str
+        Returns:
+            orjson option flags, or None if orjson cannot be used
+        """
+        indent, sort_keys, ensure_ascii, separators = options
+        if orjson is None or ensure_ascii:
+            return None
+        
+        if indent == 2 and separators in (None, (',', ': ')):
+            option = orjson.OPT_INDENT_2
+        elif indent is None and separators == (',', ':'):
+            option = 0
+        else:
+            return None
+        
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        
+        # Route dataclasses and datetimes to the default hook like json.dumps
+        return option | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def _dumps_fast(self, data: Any, options: Tuple[Any, ...]) -> Optional[str]:
+        """
+        Serialize data with orjson when it matches json.dumps output.
+        
+        Args:
+            data: JSON-ready data to serialize
+            options: Formatting options from _json_options()
             
-        except (TypeError, ValueError) as e:
-            raise NFOFormatError(
-                f"Failed to serialize data to JSON: {str(e)}",
-                file_path=str(nfo_data.file_path),
-                detected_format="JSON"
-            ) from e
+        Returns:
+            JSON content as string, or None to use json.dumps instead
+        """
+        encoded = self._dumps_fast_bytes(data, options)
+        return encoded.decode('utf-8') if encoded is not None else None
     
-    def _prepare_data_for_json(self, data: Any) -> Any:
+    def _dumps_fast_bytes(self, data: Any, options: Tuple[Any, ...]) -> Optional[bytes]:
         """
-        Prepare data for JSON serialization by handling non-serializable types.
+        Serialize data to UTF-8 with orjson when it matches json.dumps output.
+        
+        Settings orjson cannot reproduce, data it refuses, such as
+        non-string keys, and floats it spells differently are left to the
+        stdlib encoder, so the output is byte for byte that of json.dumps.
         
         Args:
-            data: Data to prepare
+            data: JSON-ready data to serialize
+            options: Formatting options from _json_options()
             
         Returns:
-            JSON-serializable data
-        """
-        if isinstance(data, dict):
-            return {key: self._prepare_data_for_json(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._prepare_data_for_json(item) for item in data]
-        elif isinstance(data, (str, int, float, bool)) or data is None:
-            return data
-        else:
-            # Convert other types to string
-            return str(data)
+            UTF-8 encoded JSON content, or None to use json.dumps instead
+        """
+        option = self._orjson_option(options)
+        if option is None:
+            return None
+        
+        try:
+            encoded = orjson.dumps(data, default=self._json_serializer, option=option)
+        except orjson.JSONEncodeError:
+            return None  # Big integers, surrogates, non-string keys, ...
+        
+        # NaN and infinities come out as null and exponents may be spelled
+        # differently; only look for such floats if the output has either
+        if (
+            b'null' in encoded or _FLOAT_EXPONENT_RE.search(encoded)
+        ) and _has_unmatched_float(data):
+            return None
+        
+        return encoded
     
     def _json_serializer(self, obj: Any) -> Any:
         """
         Custom JSON serializer for non-standard types.
         
+        Called by the encoder for every value it cannot serialize natively,
+        so the data never needs a separate conversion pass.
+        
         Args:
             obj: Object to serialize
             
@@ -201,6 +610,16 @@ class JSONNFOWriter(BaseNFOWriter):
         if isinstance(obj, Path):
             return str(obj)
         
+        # Handle binary and collection types
+        if isinstance(obj, (bytes, bytearray)):
+            return obj.decode('utf-8', 'replace')
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+        
+        # Enums as their value, as orjson writes them
+        if isinstance(obj, Enum):
+            return obj.value
+        
         # Handle other non-serializable types
         return str(obj)
     
@@ -215,12 +634,7 @@ class JSONNFOWriter(BaseNFOWriter):
             True if metadata should be included
         """
         # Include metadata if it contains user-relevant information
-        relevant_keys = {
-            'original_structure', 'detected_structure', 'format_type',
-            'creation_date', 'last_modified', 'source_file'
-        }
-        
-        return any(key in metadata for key in relevant_keys)
+        return not _RELEVANT_METADATA_KEYS.isdisjoint(metadata.keys())
     
     def _filter_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -232,19 +646,11 @@ class JSONNFOWriter(BaseNFOWriter):
         Returns:
             Filtered metadata
         """
-        filtered = {}
-        
-        # Include only user-relevant metadata
-        include_keys = {
-            'original_structure', 'detected_structure', 'format_type',
-            'total_keys', 'max_depth', 'creation_date', 'last_modified'
+        # Include only user-relevant metadata, keeping the original key order
+        return {
+            key: value for key, value in metadata.items()
+            if key in _INCLUDED_METADATA_KEYS
         }
-        
-        for key, value in metadata.items():
-            if key in include_keys:
-                filtered[key] = self._prepare_data_for_json(value)
-        
-        return filtered
     
     def update_json_fields(
         self,
@@ -263,8 +669,11 @@ class JSONNFOWriter(BaseNFOWriter):
         Returns:
             Updated JSON content as string
         """
-        # Create updated data
-        updated_data = self._deep_update_dict(nfo_data.data.copy(), field_updates)
+        # Create updated data; only containers on updated paths are copied,
+        # so the original nested dicts are never modified
+        updated_data = self._deep_update_dict(
+            dict(nfo_data.data), field_updates, copy_on_write=True
+        )
         
         # Create new NFOData object with updates
         updated_nfo = NFOData(
@@ -278,78 +687,148 @@ class JSONNFOWriter(BaseNFOWriter):
         
         return self._generate_json_content(updated_nfo)
     
-    def _deep_update_dict(self, base_dict: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    def _deep_update_dict(
+        self,
+        base_dict: Dict[str, Any],
+        updates: Dict[str, Any],
+        copy_on_write: bool = False
+    ) -> Dict[str, Any]:
         """
         Deeply update a dictionary with new values.
         
         Args:
             base_dict: Base dictionary to update
             updates: Updates to apply
-            
+            copy_on_write: Copy nested dicts before modifying them instead of
+                updating them in place (base_dict itself is always updated)
+                
         Returns:
             Updated dictionary
         """
+        # Consecutive updates under the same parent (e.g. "movie.title",
+        # "movie.year") reuse the container found for the previous one
+        cached_path = None
+        cached_parent = None
+        owned = {id(base_dict)} if copy_on_write else None
+        
         for key, value in updates.items():
-            if '.' in key:
-                # Handle nested field updates (e.g., "movie.title")
-                self._set_nested_field(base_dict, key, value)
-            else:
+            # Top-level keys skip building the rpartition tuple
+            if '.' not in key:
                 base_dict[key] = value
+                
+                # Replacing a top-level value may detach the cached container
+                if cached_path is not None and (
+                    cached_path == key or cached_path.startswith(key + '.')
+                ):
+                    cached_path = None
+                continue
+            
+            # Handle nested field updates (e.g., "movie.title")
+            parent_path, _, field_name = key.rpartition('.')
+            if parent_path != cached_path:
+                cached_parent = self._get_nested_parent(base_dict, parent_path, owned)
+                cached_path = parent_path
+            cached_parent[field_name] = value
         
         return base_dict
     
-    def _set_nested_field(self, data: Dict[str, Any], field_path: str, value: Any) -> None:
+    def _get_nested_parent(
+        self,
+        data: Dict[str, Any],
+        parent_path: str,
+        owned: Optional[Set[int]] = None
+    ) -> Dict[str, Any]:
         """
-        Set a nested field value using dot notation.
+        Get the container at a dot-separated path, creating missing levels.
         
         Args:
-            data: Dictionary to update
-            field_path: Dot-separated field path
-            value: Value to set
+            data: Dictionary to navigate
+            parent_path: Dot-separated path of the container
+            owned: If given, ids of dicts that may be modified in place; other
+                dicts along the path are replaced by copies (data must be owned)
+                
+        Returns:
+            Container at parent_path
         """
-        keys = field_path.split('.')
         current = data
         
         # Navigate to the parent of the target field
-        for key in keys[:-1]:
+        for key in parent_path.split('.'):
             if key not in current:
                 current[key] = {}
+                if owned is not None:
+                    owned.add(id(current[key]))
+            elif owned is not None and type(current[key]) is dict and id(current[key]) not in owned:
+                current[key] = dict(current[key])
+                owned.add(id(current[key]))
             current = current[key]
         
-        # Set the final value
-        current[keys[-1]] = value
+        return current
     
-    def validate_json_output(self, json_content: str) -> Dict[str, Any]:
+    def validate_json_output(
+        self,
+        json_content: str,
+        *,
+        source_data: Any = None
+    ) -> Dict[str, Any]:
         """
         Validate generated JSON content.
         
         Args:
             json_content: JSON content to validate
-            
+            source_data: Data json_content was generated from, if known; its
+                structure is analyzed directly instead of re-parsing the
+                content, unless it holds values the encoder had to convert
+                
         Returns:
             Dictionary with validation results
         """
+        # str.isascii() is O(1), so ASCII output is measured without encoding
+        if json_content.isascii():
+            size_bytes = len(json_content)
+        else:
+            size_bytes = len(json_content.encode('utf-8'))
+        
         validation_result = {
             'is_valid': False,
             'errors': [],
             'warnings': [],
-            'size_bytes': len(json_content.encode('utf-8')),
+            'size_bytes': size_bytes,
             'line_count': json_content.count('\n') + 1,
             'structure_info': {}
         }
         
         try:
-            # Try to parse JSON
-            parsed_data = json.loads(json_content)
+            # Plain JSON source data has the structure parsing the output
+            # would give
+            structure = None
+            if source_data is not None:
+                structure = self._analyze_structure(source_data, strict=True)
+            if structure is not None:
+                parsed_data = source_data
+            else:
+                # Try to parse JSON
+                parsed_data = json.loads(json_content)
             validation_result['is_valid'] = True
             
-            # Analyze structure
+            # Analyze structure; megabyte-scale output is scanned as text by
+            # the compiled analyzer when numba is installed
+            analyze_structure = (
+                get_jit_analyze_structure()
+                if structure is None and validation_result['size_bytes'] > _JIT_ANALYZE_MIN_SIZE
+                else None
+            )
+            if analyze_structure is not None:
+                try:
+                    structure = analyze_structure(json_content)
+                except Exception:
+                    disable_jit_analyze_structure()
+            if structure is None:
+                structure = self._analyze_structure(parsed_data)
+            
             validation_result['structure_info'] = {
                 'type': type(parsed_data).__name__,
-                'total_keys': self._count_json_keys(parsed_data),
-                'max_depth': self._calculate_json_depth(parsed_data),
-                'has_arrays': self._contains_json_arrays(parsed_data),
-                'empty_values': self._count_json_empty_values(parsed_data)
+                **structure
             }
             
             # Check for potential issues
@@ -369,59 +848,78 @@ class JSONNFOWriter(BaseNFOWriter):
         
         return validation_result
     
-    def _count_json_keys(self, data: Any) -> int:
-        """Count total keys in JSON structure."""
-        if isinstance(data, dict):
-            count = len(data)
-            for value in data.values():
-                count += self._count_json_keys(value)
-            return count
-        elif isinstance(data, list):
-            return sum(self._count_json_keys(item) for item in data)
-        return 0
-    
-    def _calculate_json_depth(self, data: Any, current_depth: int = 0) -> int:
-        """Calculate maximum depth of JSON structure."""
-        if isinstance(data, dict):
-            if not data:
-                return current_depth
-            return max(
-                self._calculate_json_depth(value, current_depth + 1)
-                for value in data.values()
-            )
-        elif isinstance(data, list):
-            if not data:
-                return current_depth
-            return max(
-                self._calculate_json_depth(item, current_depth + 1)
-                for item in data
-            )
-        return current_depth
-    
-    def _contains_json_arrays(self, data: Any) -> bool:
-        """Check if JSON structure contains arrays."""
-        if isinstance(data, list):
-            return True
-        elif isinstance(data, dict):
-            return any(self._contains_json_arrays(value) for value in data.values())
-        return False
-    
-    def _count_json_empty_values(self, data: Any) -> int:
-        """Count empty values in JSON structure."""
-        count = 0
-        if isinstance(data, dict):
-            for value in data.values():
-                if value is None or value == "" or value == [] or value == {}:
-                    count += 1
-                else:
-                    count += self._count_json_empty_values(value)
-        elif isinstance(data, list):
-            for item in data:
-                if item is None or item == "" or item == [] or item == {}:
-                    count += 1
-                else:
-                    count += self._count_json_empty_values(item)
-        return count
+    def _analyze_structure(self, data: Any, strict: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Analyze a JSON structure in a single iterative traversal.
+        
+        Args:
+            data: Parsed JSON data, as returned by json.loads (containers
+                below the root are recognised by exact type)
+            strict: Give up on data json.loads could not have returned, such
+                as tuples, non-string keys or other types the encoder converts
+                
+        Returns:
+            Dictionary with total_keys, max_depth, has_arrays and
+            empty_values, or None if strict and data is not plain JSON data
+        """
+        if strict and type(data) not in (dict, list, *_JSON_NATIVE_TYPES):
+            return None
+        
+        total_keys = 0
+        max_depth = 0
+        has_arrays = isinstance(data, list)
+        empty_values = 0
+        
+        # Explicit stack instead of recursion: only non-empty containers are
+        # pushed, and leaves are settled at their parent
+        stack = [(data, 0)] if isinstance(data, (dict, list)) and data else []
+        pop = stack.pop
+        push = stack.append
+        
+        while stack:
+            node, depth = pop()
+            
+            if isinstance(node, dict):
+                total_keys += len(node)
+                children = node.values()
+                if strict and not all(type(key) is str for key in node):
+                    return None
+            else:
+                children = node
+            
+            child_depth = depth + 1
+            for child in children:
+                # One type() lookup dispatches every child; json.loads only
+                # produces plain dicts and lists
+                child_type = type(child)
+                if child_type is dict:
+                    if child:
+                        push((child, child_depth))
+                        continue
+                    empty_values += 1
+                elif child_type is list:
+                    has_arrays = True
+                    if child:
+                        push((child, child_depth))
+                        continue
+                    empty_values += 1
+                # Empty containers are settled above by truthiness; for json.loads
+                # output this equality is cheaper than a type check plus `not`
+                elif child is None or child == "":
+                    empty_values += 1
+                elif strict and not isinstance(child, _JSON_NATIVE_TYPES):
+                    return None
+                
+                # Leaf or empty container
+                if child_depth > max_depth:
+                    max_depth = child_depth
+        
+        return {
+            'total_keys': total_keys,
+            'max_depth': max_depth,
+            'has_arrays': has_arrays,
+            'empty_values': empty_values
+        }
     
     def create_compact_json(self, nfo_data: NFOData) -> str:
         """
@@ -433,19 +931,9 @@ class JSONNFOWriter(BaseNFOWriter):
         Returns:
             Compact JSON string
         """
-        # Temporarily override formatting settings
-        original_indent = self.indent
-        original_separators = self.separators
-        
-        self.indent = None
-        self.separators = (',', ':')
-        
-        try:
-            return self._generate_json_content(nfo_data)
-        finally:
-            # Restore original settings
-            self.indent = original_indent
-            self.separators = original_separators
+        # Override formatting per call, leaving the writer's settings alone
+        options = (None, self.sort_keys, self.ensure_ascii, (',', ':'))
+        return self._generate_json_content(nfo_data, options)
     
     def create_pretty_json(self, nfo_data: NFOData, indent: int = 4) -> str:
         """
@@ -458,12 +946,6 @@ class JSONNFOWriter(BaseNFOWriter):
         Returns:
             Pretty-formatted JSON string
         """
-        # Temporarily override indent setting
-        original_indent = self.indent
-        self.indent = indent
-        
-        try:
-            return self._generate_json_content(nfo_data)
-        finally:
-            # Restore original setting
-            self.indent = original_indent
+        # Override indentation per call, leaving the writer's settings alone
+        options = (indent, self.sort_keys, self.ensure_ascii, self.separators)
+        return self._generate_json_content(nfo_data, options)
@@ -8,8 +8,11 @@ and structured layouts.
 Author: NFO Editor Team
 """
 
-from typing import Union, Optional, Dict, Any, List
+from functools import lru_cache
+from operator import itemgetter
+from typing import Union, Optional, Dict, Any, Callable, Iterable, List, Sequence, Set, Tuple
 from pathlib import Path
+import re
 import textwrap
 
 from .base import BaseNFOWriter
@@ -17,6 +20,79 @@ from ..parsers.base import NFOData
 from ..utils.exceptions import NFOFormatError, NFOAccessError
 
 
+# Whitespace TextWrapper breaks lines at or drops; text without any is
+# returned unchanged
+_WRAP_BREAK_RE = re.compile(r'\s')
+
+# Value types that are formatted as simple values; an exact type lookup
+# lets them skip the list/dict isinstance checks
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Formatters for simple values by exact type; other types use str()
+_VALUE_FORMATTERS: Dict[type, Callable[[Any], str]] = {
+    str: lambda value: value,
+    type(None): lambda value: "",
+    bool: lambda value: "Yes" if value else "No",
+    int: str,
+    float: str,
+}
+
+# Fields create_summary_text looks for first, in priority order (lowercase)
+_SUMMARY_PRIORITY_FIELDS = (
+    'title', 'name', 'plot', 'summary', 'description',
+    'year', 'genre', 'rating', 'runtime', 'director',
+    'artist', 'album', 'track'
+)
+
+# Dictionaries with fewer fields are sorted directly; larger ones reuse the
+# cached sort order of their key sequence
+_SORTED_ORDER_MIN_FIELDS = 8
+
+# Maximum number of key sequences whose sort order is kept per writer
+_SORTED_ORDER_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=4096)
+def _format_field_name_cached(name: str) -> str:
+    """
+    Format a non-empty field name for display, memoized across calls and files.
+    
+    Args:
+        name: Raw field name
+        
+    Returns:
+        Formatted field name
+    """
+    # Convert underscores to spaces and capitalize
+    formatted = name.replace('_', ' ')
+    
+    # Capitalize words
+    return ' '.join(word.capitalize() for word in formatted.split())
+
+
+@lru_cache(maxsize=256)
+def _make_section_header(clean_name: str, style: str) -> str:
+    """
+    Build a section header line, memoized across calls and files.
+    
+    Args:
+        clean_name: Section name already formatted for display
+        style: Section header style ("brackets", "equals" or "dashes")
+        
+    Returns:
+        Formatted section header
+    """
+    if style == "brackets":
+        return f"[{clean_name}]"
+    elif style == "equals":
+        return f"=== {clean_name} ==="
+    elif style == "dashes":
+        return f"--- {clean_name} ---"
+    else:
+        # Default to brackets
+        return f"[{clean_name}]"
+
+
 class TextNFOWriter(BaseNFOWriter):
     """
     Writer for plain text NFO files.
@@ -38,6 +114,11 @@ class TextNFOWriter(BaseNFOWriter):
     format_name = "Text"
     default_extension = ".nfo"
     
+    __slots__ = (
+        'preserve_formatting', 'delimiter', 'section_header_style', 'line_width',
+        'indent_size', 'sort_fields', '_wrapper_cache', '_sorted_order_cache'
+    )
+    
     def __init__(
         self,
         preserve_formatting: bool = True,
@@ -64,6 +145,12 @@ class TextNFOWriter(BaseNFOWriter):
         self.line_width = line_width
         self.indent_size = indent_size
         self.sort_fields = sort_fields
+        
+        # TextWrappers by (line_width, subsequent_indent)
+        self._wrapper_cache: Dict[Tuple[int, str], textwrap.TextWrapper] = {}
+        
+        # Item getters producing key-sorted items, by key sequence
+        self._sorted_order_cache: Dict[Tuple[Any, ...], Callable[[List[Any]], Any]] = {}
     
     def can_write(self, nfo_data: NFOData) -> bool:
         """
@@ -162,6 +249,8 @@ class TextNFOWriter(BaseNFOWriter):
         # Consider data sectioned if it has nested dictionaries
         # or if metadata indicates original structure was sectioned
         for value in data.values():
+            if type(value) in _SCALAR_TYPES:
+                continue
             if isinstance(value, dict):
                 return True
         
@@ -190,18 +279,19 @@ class TextNFOWriter(BaseNFOWriter):
         # Process sections
         sections = data.items()
         if self.sort_fields:
-            sections = sorted(sections)
+            sections = self._sorted_items(data)
         
+        # Fields are formatted straight into lines, without per-field lists
+        indent_str = " " * self.indent_size
         for section_name, section_data in sections:
             if isinstance(section_data, dict):
                 # Section with structured data
                 lines.append(self._format_section_header(section_name))
-                lines.extend(self._format_section_content(section_data))
+                self._format_section_content_into(lines, section_data, indent_str)
                 lines.append("")  # Empty line after section
             else:
                 # Simple key-value pair
-                formatted_line = self._format_field(section_name, section_data)
-                lines.extend(formatted_line)
+                self._format_field_into(lines, section_name, section_data)
         
         # Remove trailing empty lines
         while lines and not lines[-1].strip():
@@ -232,11 +322,9 @@ class TextNFOWriter(BaseNFOWriter):
         # Process fields
         fields = data.items()
         if self.sort_fields:
-            fields = sorted(fields)
+            fields = self._sorted_items(data)
         
-        for key, value in fields:
-            formatted_lines = self._format_field(key, value)
-            lines.extend(formatted_lines)
+        self._format_fields_into(lines, fields)
         
         # Remove trailing empty lines
         while lines and not lines[-1].strip():
@@ -244,6 +332,36 @@ class TextNFOWriter(BaseNFOWriter):
         
         return "\n".join(lines)
     
+    def _sorted_items(self, data: Dict[str, Any]) -> Sequence[Tuple[str, Any]]:
+        """
+        Get the items of a dictionary sorted by key.
+        
+        Documents sharing a schema have the same key sequence, so its sort
+        order is computed once and then applied with a C-level item getter.
+        
+        Args:
+            data: Dictionary to sort
+            
+        Returns:
+            (key, value) pairs in key order
+        """
+        items = list(data.items())
+        if len(items) < _SORTED_ORDER_MIN_FIELDS:
+            return sorted(items)
+        
+        keys = tuple(data)
+        cache = self._sorted_order_cache
+        getter = cache.get(keys)
+        if getter is None:
+            getter = itemgetter(*sorted(range(len(keys)), key=keys.__getitem__))
+            cache[keys] = getter
+            
+            # Evict the oldest key sequences once the cache is full
+            while len(cache) > _SORTED_ORDER_CACHE_SIZE:
+                cache.pop(next(iter(cache)), None)
+        
+        return getter(items)
+    
     def _format_section_header(self, section_name: str) -> str:
         """
         Format a section header according to the configured style.
@@ -256,15 +374,7 @@ class TextNFOWriter(BaseNFOWriter):
         """
         clean_name = self._format_field_name(section_name)
         
-        if self.section_header_style == "brackets":
-            return f"[{clean_name}]"
-        elif self.section_header_style == "equals":
-            return f"=== {clean_name} ==="
-        elif self.section_header_style == "dashes":
-            return f"--- {clean_name} ---"
-        else:
-            # Default to brackets
-            return f"[{clean_name}]"
+        return _make_section_header(clean_name, self.section_header_style)
     
     def _format_section_content(self, section_data: Dict[str, Any]) -> List[str]:
         """
@@ -277,16 +387,64 @@ class TextNFOWriter(BaseNFOWriter):
             List of formatted lines
         """
         lines = []
+        self._format_section_content_into(lines, section_data)
+        return lines
+    
+    def _format_section_content_into(
+        self,
+        lines: List[str],
+        section_data: Dict[str, Any],
+        indent_str: Optional[str] = None
+    ) -> None:
+        """
+        Append the formatted content of a section to a list of lines.
         
+        Args:
+            lines: List to append formatted lines to
+            section_data: Section data dictionary
+            indent_str: Field indentation, if already built by the caller
+        """
         fields = section_data.items()
         if self.sort_fields:
-            fields = sorted(fields)
+            fields = self._sorted_items(section_data)
         
-        for key, value in fields:
-            formatted_lines = self._format_field(key, value, indent=True)
-            lines.extend(formatted_lines)
+        if indent_str is None:
+            indent_str = " " * self.indent_size
+        self._format_fields_into(lines, fields, indent_str)
+    
+    def _format_fields_into(
+        self,
+        lines: List[str],
+        fields: Iterable[Tuple[str, Any]],
+        indent_str: str = ""
+    ) -> None:
+        """
+        Append the formatted lines of several fields to a list of lines.
         
-        return lines
+        Simple values are the common case in NFO data (flat documents and
+        sections of strings and numbers), so they are formatted inline here;
+        lists, dicts and other types go through _format_field_into.
+        
+        Args:
+            lines: List to append formatted lines to
+            fields: (key, value) pairs to format
+            indent_str: Indentation of the field lines
+        """
+        delimiter = self.delimiter
+        line_width = self.line_width
+        format_name = self._format_field_name
+        
+        for key, value in fields:
+            formatter = _VALUE_FORMATTERS.get(type(value))
+            if formatter is None:
+                self._format_field_into(lines, key, value, indent_str)
+                continue
+            
+            line = f"{indent_str}{format_name(key)}{delimiter}{formatter(value)}"
+            if line_width <= 0 or len(line) <= line_width:
+                lines.append(line)
+            else:
+                self._append_wrapped(lines, line)
     
     def _format_field(self, key: str, value: Any, indent: bool = False) -> List[str]:
         """
@@ -301,38 +459,85 @@ class TextNFOWriter(BaseNFOWriter):
             List of formatted lines for this field
         """
         lines = []
+        self._format_field_into(lines, key, value, " " * self.indent_size if indent else "")
+        return lines
+    
+    def _format_field_into(
+        self,
+        lines: List[str],
+        key: str,
+        value: Any,
+        indent_str: str = "",
+        prefix: str = ""
+    ) -> None:
+        """
+        Append the formatted lines of a single field to a list of lines.
+        
+        Args:
+            lines: List to append formatted lines to
+            key: Field name
+            value: Field value
+            indent_str: Indentation of the field's own lines
+            prefix: Text put before every line after wrapping (used for
+                nested dictionaries)
+        """
         formatted_key = self._format_field_name(key)
-        indent_str = " " * self.indent_size if indent else ""
         
-        if isinstance(value, list):
+        if type(value) in _SCALAR_TYPES or not isinstance(value, (list, dict)):
+            # Handle simple values; lines that already fit are appended
+            # without going through the wrapping helpers
+            formatted_value = self._format_field_value(value)
+            line = f"{indent_str}{formatted_key}{self.delimiter}{formatted_value}"
+            line_width = self.line_width
+            if line_width <= 0 or len(line) <= line_width:
+                lines.append(prefix + line)
+            else:
+                self._append_wrapped(lines, line, prefix)
+        
+        elif isinstance(value, list):
             # Handle list values
             if len(value) == 1:
                 # Single item list - format as simple value
                 formatted_value = self._format_field_value(value[0])
                 line = f"{indent_str}{formatted_key}{self.delimiter}{formatted_value}"
-                lines.extend(self._wrap_line(line))
+                self._append_wrapped(lines, line, prefix)
             else:
                 # Multiple items - format as multi-line
-                lines.append(f"{indent_str}{formatted_key}:")
+                lines.append(f"{prefix}{indent_str}{formatted_key}:")
                 for item in value:
                     formatted_item = self._format_field_value(item)
                     item_line = f"{indent_str}  - {formatted_item}"
-                    lines.extend(self._wrap_line(item_line))
+                    self._append_wrapped(lines, item_line, prefix)
         
-        elif isinstance(value, dict):
-            # Handle nested dictionary
-            lines.append(f"{indent_str}{formatted_key}:")
+        else:
+            # Handle nested dictionary; its fields are indented and shifted
+            # by two more spaces
+            lines.append(f"{prefix}{indent_str}{formatted_key}:")
+            sub_indent = " " * self.indent_size
+            sub_prefix = prefix + "  "
             for sub_key, sub_value in value.items():
-                sub_lines = self._format_field(sub_key, sub_value, indent=True)
-                lines.extend([f"  {line}" for line in sub_lines])
+                self._format_field_into(lines, sub_key, sub_value, sub_indent, sub_prefix)
+    
+    def _append_wrapped(self, lines: List[str], line: str, prefix: str = "") -> None:
+        """
+        Wrap a line and append the result to a list of lines.
         
+        Args:
+            lines: List to append to
+            line: Line to wrap
+            prefix: Text put before every wrapped line
+        """
+        # Wrapping disabled or nothing to wrap: no _wrap_line call or
+        # one-item list per line
+        line_width = self.line_width
+        if line_width <= 0 or len(line) <= line_width:
+            lines.append(prefix + line)
+            return
+        
+        if prefix:
+            lines.extend([prefix + wrapped for wrapped in self._wrap_line(line)])
         else:
-            # Handle simple values
-            formatted_value = self._format_field_value(value)
-            line = f"{indent_str}{formatted_key}{self.delimiter}{formatted_value}"
             lines.extend(self._wrap_line(line))
-        
-        return lines
     
     def _format_field_name(self, name: str) -> str:
         """
@@ -347,13 +552,10 @@ class TextNFOWriter(BaseNFOWriter):
         if not name:
             return "Unknown"
         
-        # Convert underscores to spaces and capitalize
-        formatted = name.replace('_', ' ')
-        
-        # Capitalize words
-        formatted = ' '.join(word.capitalize() for word in formatted.split())
-        
-        return formatted
+        # Field names repeat across sections and files, so the per-word
+        # capitalization is memoized; str.title() is not used because it
+        # also capitalizes after apostrophes and digits ("It'S", "2Nd")
+        return _format_field_name_cached(name)
     
     def _format_field_value(self, value: Any) -> str:
         """
@@ -365,15 +567,13 @@ class TextNFOWriter(BaseNFOWriter):
         Returns:
             Formatted field value string
         """
-        if value is None:
-            return ""
-        elif isinstance(value, bool):
-            return "Yes" if value else "No"
-        elif isinstance(value, (list, dict)):
-            # These should be handled separately, but just in case
-            return str(value)
-        else:
-            return str(value)
+        formatter = _VALUE_FORMATTERS.get(type(value))
+        if formatter is not None:
+            return formatter(value)
+        
+        # Lists, dicts and other types should be handled separately, but
+        # just in case
+        return str(value)
     
     def _wrap_line(self, line: str) -> List[str]:
         """
@@ -393,18 +593,46 @@ class TextNFOWriter(BaseNFOWriter):
             key_part, value_part = line.split(self.delimiter, 1)
             key_length = len(key_part) + len(self.delimiter)
             
+            # Unbroken values (base64 art, URLs, hashes) would come back
+            # unchanged; skip running TextWrapper's regexes over them
+            if _WRAP_BREAK_RE.search(value_part) is None:
+                return [line]
+            
             # Wrap the value part with proper indentation
-            wrapped_value = textwrap.fill(
-                value_part,
-                width=self.line_width,
-                initial_indent="",
-                subsequent_indent=" " * key_length
-            )
+            wrapped_value = self._get_wrapper(" " * key_length).fill(value_part)
             
             return [key_part + self.delimiter + wrapped_value]
+        elif _WRAP_BREAK_RE.search(line) is None:
+            return [line]
         else:
             # No delimiter found, wrap normally
-            return textwrap.wrap(line, width=self.line_width)
+            return self._get_wrapper("").wrap(line)
+    
+    def _get_wrapper(self, subsequent_indent: str) -> textwrap.TextWrapper:
+        """
+        Get a TextWrapper for the current line width, creating it on first use.
+        
+        Words are only broken at whitespace: hyphenated titles and long
+        values such as URLs are kept whole, which also lets TextWrapper use
+        its simpler word-splitting regex.
+        
+        Args:
+            subsequent_indent: Indentation of continuation lines
+            
+        Returns:
+            Configured TextWrapper
+        """
+        key = (self.line_width, subsequent_indent)
+        wrapper = self._wrapper_cache.get(key)
+        if wrapper is None:
+            wrapper = textwrap.TextWrapper(
+                width=self.line_width,
+                subsequent_indent=subsequent_indent,
+                break_long_words=False,
+                break_on_hyphens=False
+            )
+            self._wrapper_cache[key] = wrapper
+        return wrapper
     
     def _generate_header(self, metadata: Dict[str, Any]) -> List[str]:
         """
@@ -447,10 +675,12 @@ class TextNFOWriter(BaseNFOWriter):
         Returns:
             Updated text content as string
         """
-        # Update data
+        # Update data; nested dicts are copied only along the updated paths,
+        # so the original data is left untouched and other branches are shared
         updated_data = nfo_data.data.copy()
+        owned = {id(updated_data)}
         for field_path, new_value in field_updates.items():
-            self._set_nested_field(updated_data, field_path, new_value)
+            self._set_nested_field(updated_data, field_path, new_value, owned)
         
         # Create updated NFOData object
         updated_nfo = NFOData(
@@ -464,7 +694,13 @@ class TextNFOWriter(BaseNFOWriter):
         
         return self._generate_text_content(updated_nfo)
     
-    def _set_nested_field(self, data: Dict[str, Any], field_path: str, value: Any) -> None:
+    def _set_nested_field(
+        self,
+        data: Dict[str, Any],
+        field_path: str,
+        value: Any,
+        owned: Optional[Set[int]] = None
+    ) -> None:
         """
         Set a nested field value using dot notation.
         
@@ -472,6 +708,8 @@ class TextNFOWriter(BaseNFOWriter):
             data: Dictionary to update
             field_path: Dot-separated field path
             value: Value to set
+            owned: If given, ids of dicts that may be modified in place; other
+                dicts along the path are replaced by copies (data must be owned)
         """
         keys = field_path.split('.')
         current = data
@@ -480,9 +718,16 @@ class TextNFOWriter(BaseNFOWriter):
         for key in keys[:-1]:
             if key not in current:
                 current[key] = {}
+                if owned is not None:
+                    owned.add(id(current[key]))
             elif not isinstance(current[key], dict):
                 # Convert non-dict values to dict
                 current[key] = {'value': current[key]}
+                if owned is not None:
+                    owned.add(id(current[key]))
+            elif owned is not None and id(current[key]) not in owned:
+                current[key] = current[key].copy()
+                owned.add(id(current[key]))
             current = current[key]
         
         # Set the final value
@@ -499,33 +744,40 @@ class TextNFOWriter(BaseNFOWriter):
         Returns:
             Summary text content
         """
-        # Priority fields for summary
-        priority_fields = [
-            'title', 'name', 'plot', 'summary', 'description',
-            'year', 'genre', 'rating', 'runtime', 'director',
-            'artist', 'album', 'track'
-        ]
-        
         summary_data = {}
         
         # Extract priority fields
         flat_data = self._flatten_data(nfo_data.data)
         
-        for priority_field in priority_fields:
-            for key, value in flat_data.items():
-                if priority_field.lower() in key.lower():
-                    summary_data[key] = value
+        # Find the first key matching each priority field in one pass over
+        # the data, lowering every key once
+        first_matches = {}
+        remaining = list(_SUMMARY_PRIORITY_FIELDS)
+        for key in flat_data:
+            lowered_key = key.lower()
+            matched = [field for field in remaining if field in lowered_key]
+            if matched:
+                for field in matched:
+                    first_matches[field] = key
+                remaining = [field for field in remaining if field not in first_matches]
+                if not remaining:
                     break
+        
+        for priority_field in _SUMMARY_PRIORITY_FIELDS:
+            key = first_matches.get(priority_field)
+            if key is not None:
+                summary_data[key] = flat_data[key]
             
             if len(summary_data) >= max_fields:
                 break
         
         # Fill remaining slots with any other fields
-        for key, value in flat_data.items():
-            if key not in summary_data:
-                summary_data[key] = value
-                if len(summary_data) >= max_fields:
-                    break
+        if len(summary_data) < max_fields:
+            for key, value in flat_data.items():
+                if key not in summary_data:
+                    summary_data[key] = value
+                    if len(summary_data) >= max_fields:
+                        break
         
         # Create summary NFOData object
         summary_nfo = NFOData(
@@ -551,12 +803,19 @@ class TextNFOWriter(BaseNFOWriter):
         """
         flattened = {}
         
-        for key, value in data.items():
-            new_key = f"{prefix}.{key}" if prefix else key
-            
-            if isinstance(value, dict):
-                flattened.update(self._flatten_data(value, new_key))
-            else:
+        # Depth-first with a stack of item iterators, so keys keep their
+        # document order and every level writes into the same dictionary
+        stack = [(prefix, iter(data.items()))]
+        while stack:
+            current_prefix, items = stack[-1]
+            for key, value in items:
+                new_key = f"{current_prefix}.{key}" if current_prefix else key
+                
+                if isinstance(value, dict):
+                    stack.append((new_key, iter(value.items())))
+                    break
                 flattened[new_key] = value
+            else:
+                stack.pop()
         
         return flattened
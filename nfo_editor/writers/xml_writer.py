@@ -8,15 +8,186 @@ based on configuration options.
 Author: NFO Editor Team
 """
 
+import codecs
+import os
+import re
+import sys
 import xml.etree.ElementTree as ET
-from typing import Union, Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Union, Optional, Dict, Any, List, Tuple, BinaryIO, FrozenSet
 from pathlib import Path
-import xml.dom.minidom as minidom
 
 from .base import BaseNFOWriter
 from ..parsers.base import NFOData
 from ..utils.exceptions import NFOFormatError, NFOAccessError
 
+# Characters XML 1.0 does not allow; they are dropped from text and attributes
+_XML_INVALID_CHARS = (
+    [chr(c) for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)]
+    + [chr(c) for c in range(0xD800, 0xE000)]
+    + ['\ufffe', '\uffff']
+)
+
+# Escapes for element text and attribute values, as libxml2 writes them
+_XML_TEXT_ESCAPES = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '\r': '&#13;',
+    **dict.fromkeys(_XML_INVALID_CHARS)
+})
+_XML_ATTRIBUTE_ESCAPES = {
+    **_XML_TEXT_ESCAPES,
+    **str.maketrans({'"': '&quot;', '\t': '&#9;', '\n': '&#10;'})
+}
+
+# Finds any character the escape tables above change; most values have none
+# and are used as is
+_XML_TEXT_SPECIAL_RE = re.compile('[&<>\r\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+_XML_ATTRIBUTE_SPECIAL_RE = re.compile('[&<>"\x00-\x1f\ud800-\udfff\ufffe\uffff]')
+
+# Kinds of data keys, as returned by _classify_key
+_KEY_CHILD = 0
+_KEY_ATTRIBUTE = 1
+_KEY_TEXT = 2
+
+# Added to the kind of child and attribute keys in {uri}local form
+_KEY_QUALIFIED = 4
+
+# Namespace bound to the 'xml' prefix, which is never declared
+_XML_NAMESPACE = 'http://www.w3.org/XML/1998/namespace'
+
+# Source file size from which write() streams the XML parts into the output
+# file instead of joining them into one string first
+_STREAM_MIN_SIZE = 4 * 1024 * 1024
+
+# Write buffer used while streaming XML output
+_STREAM_BUFFER_SIZE = 1024 * 1024
+
+# Number of XML parts collected before a streaming builder writes them out
+_STREAM_FLUSH_PARTS = 8192
+
+
+@lru_cache(maxsize=4096)
+def _classify_key(key: str) -> int:
+    """
+    Classify a data key, memoized across calls and files.
+    
+    Args:
+        key: Key of a dictionary converted to XML
+        
+    Returns:
+        _KEY_ATTRIBUTE for '@' keys, _KEY_TEXT for '#text', else _KEY_CHILD;
+        _KEY_QUALIFIED is added for names in {uri}local form
+    """
+    if key.startswith('@'):
+        return _KEY_ATTRIBUTE | _KEY_QUALIFIED if key.startswith('@{') else _KEY_ATTRIBUTE
+    if key == '#text':
+        return _KEY_TEXT
+    return _KEY_CHILD | _KEY_QUALIFIED if key.startswith('{') else _KEY_CHILD
+
+
+@lru_cache(maxsize=1024)
+def _split_field_path(field_path: str) -> Tuple[str, ...]:
+    """
+    Split a dot-separated field path, memoized across calls.
+    
+    Args:
+        field_path: Dot-separated path to a field
+        
+    Returns:
+        Path components
+    """
+    return tuple(field_path.split('.'))
+
+
+def _escape_xml_text(text: str) -> str:
+    """
+    Escape element text for XML output.
+    
+    Args:
+        text: Text to escape
+        
+    Returns:
+        Escaped text, without characters XML 1.0 does not allow
+    """
+    if _XML_TEXT_SPECIAL_RE.search(text) is None:
+        return text
+    return text.translate(_XML_TEXT_ESCAPES)
+
+
+def _escape_xml_attribute(value: str) -> str:
+    """
+    Escape an attribute value for a double-quoted XML attribute.
+    
+    Args:
+        value: Attribute value to escape
+        
+    Returns:
+        Escaped value, without characters XML 1.0 does not allow
+    """
+    if _XML_ATTRIBUTE_SPECIAL_RE.search(value) is None:
+        return value
+    return value.translate(_XML_ATTRIBUTE_ESCAPES)
+
+
+class _StringXMLBuilder:
+    """
+    Collects XML output as a list of string parts.
+    
+    Element writers append fully formatted parts to ``parts`` directly
+    rather than calling a method per start tag, text and end tag. Without
+    a file the parts are joined once by getvalue(); with a file they are
+    encoded and written out in batches as the document is generated.
+    """
+    
+    __slots__ = ('parts', 'flush_size', 'prefixes', '_file')
+    
+    def __init__(self, file: Optional[BinaryIO] = None):
+        """
+        Initialize the builder.
+        
+        Args:
+            file: Binary file to stream UTF-8 output into, or None to
+                collect the whole document
+        """
+        self.parts: List[str] = []
+        self.flush_size = _STREAM_FLUSH_PARTS if file is not None else sys.maxsize
+        # Prefix used for each namespace URI in the document
+        self.prefixes: Dict[str, str] = {_XML_NAMESPACE: 'xml'}
+        self._file = file
+    
+    def prefix_for(self, uri: str) -> str:
+        """
+        Get the prefix for a namespace URI, assigning the next free nsN.
+        
+        Args:
+            uri: Namespace URI
+            
+        Returns:
+            Namespace prefix
+        """
+        prefix = self.prefixes.get(uri)
+        if prefix is None:
+            used = set(self.prefixes.values())
+            number = len(self.prefixes) - 1
+            while f'ns{number}' in used:
+                number += 1
+            prefix = self.prefixes[uri] = f'ns{number}'
+        return prefix
+    
+    def flush(self) -> None:
+        """Write the collected parts to the file, if any, and clear them."""
+        if self._file is not None and self.parts:
+            self._file.write(''.join(self.parts).encode('utf-8'))
+            self.parts.clear()
+    
+    def getvalue(self) -> str:
+        """
+        Get the collected XML content.
+        
+        Returns:
+            XML content as string
+        """
+        return ''.join(self.parts)
+
 
 class XMLNFOWriter(BaseNFOWriter):
     """
@@ -108,11 +279,15 @@ class XMLNFOWriter(BaseNFOWriter):
             backup_path = self._create_backup(output_path)
         
         try:
-            # Generate XML content
-            xml_content = self._generate_xml_content(nfo_data)
-            
-            # Write to file
-            self._write_file_content(xml_content, output_path, nfo_data.encoding)
+            if self._can_write_serializer_bytes(nfo_data) and self._should_stream(nfo_data):
+                # Write the XML into the file as it is generated
+                self._stream_xml_content(nfo_data, output_path)
+            else:
+                # Generate XML content
+                xml_content = self._generate_xml_content(nfo_data)
+                
+                # Write to file
+                self._write_file_content(xml_content, output_path, nfo_data.encoding)
             
             # Preserve file metadata if original file existed
             if backup_path:
@@ -139,6 +314,23 @@ class XMLNFOWriter(BaseNFOWriter):
         Returns:
             XML content as string
         """
+        builder = _StringXMLBuilder()
+        self._build_xml(nfo_data, builder)
+        return builder.getvalue()
+    
+    def _build_xml(self, nfo_data: NFOData, builder: '_StringXMLBuilder') -> None:
+        """
+        Write the XML for NFO data into a string builder.
+        
+        The XML text is written directly, with values escaped as they are
+        appended, instead of building an element tree and serializing it.
+        The layout matches what ElementTree.indent() and serialization of
+        the equivalent tree produce.
+        
+        Args:
+            nfo_data: NFOData object to convert
+            builder: Builder receiving the XML parts
+        """
         # Determine root element name
         root_name = self.root_element
         if nfo_data.metadata.get('root_element'):
@@ -146,109 +338,294 @@ class XMLNFOWriter(BaseNFOWriter):
         elif nfo_data.format_type == "xml" and 'root_element' in nfo_data.metadata:
             root_name = nfo_data.metadata['root_element']
         
-        # Create XML structure
-        root = ET.Element(root_name)
-        
-        # Add XML namespaces if they were preserved
+        # Add XML namespaces if they were preserved, as root attributes
+        # written ahead of any '@' keys in the data
         namespaces = nfo_data.metadata.get('xml_namespaces', {})
+        attributes = {
+            ('xmlns' if prefix == 'default' else f'xmlns:{prefix}'): uri
+            for prefix, uri in namespaces.items()
+        }
+        
+        # {uri}local names of those namespaces use their declared prefixes
         for prefix, uri in namespaces.items():
-            if prefix == 'default':
-                root.set('xmlns', uri)
-            else:
-                root.set(f'xmlns:{prefix}', uri)
+            if prefix != 'default':
+                builder.prefixes.setdefault(uri, prefix)
+        scope = frozenset(builder.prefixes)
+        
+        # Add XML declaration if requested
+        if self.xml_declaration:
+            builder.parts.append(self._xml_declaration())
         
         # Convert data dictionary to XML elements
-        self._dict_to_xml(nfo_data.data, root)
+        indent = '\n' if self.pretty_print else ''
+        self._dict_to_xml(nfo_data.data, root_name, builder, indent, attributes, scope)
+    
+    def _can_write_serializer_bytes(self, nfo_data: NFOData) -> bool:
+        """
+        Check whether XML output can be encoded as UTF-8 and written as is.
         
-        # Generate XML string
-        xml_str = ET.tostring(root, encoding='unicode', method='xml')
+        That output is byte for byte what _write_file_content would write
+        when the target encoding is UTF-8 and newlines need no translation.
         
-        # Add XML declaration if requested
-        if self.xml_declaration:
-            declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>\n'
-            xml_str = declaration + xml_str
+        Args:
+            nfo_data: NFOData object to be written
+            
+        Returns:
+            True if encoded output can go straight to the file
+        """
+        return os.linesep == '\n' and codecs.lookup(nfo_data.encoding).name == 'utf-8'
+    
+    def _should_stream(self, nfo_data: NFOData) -> bool:
+        """
+        Decide whether write() should stream the XML into the file.
         
-        # Pretty print if requested
-        if self.pretty_print:
-            xml_str = self._pretty_print_xml(xml_str)
+        Building the XML string and writing it at once is faster, so streaming
+        is only used for large files. The size of the source file serves as a
+        cheap estimate of the output size.
         
-        return xml_str
+        Args:
+            nfo_data: NFOData object to be written
+            
+        Returns:
+            True if the output should be streamed
+        """
+        try:
+            return nfo_data.file_path.stat().st_size >= _STREAM_MIN_SIZE
+        except OSError:
+            return False
     
-    def _dict_to_xml(self, data: Dict[str, Any], parent: ET.Element) -> None:
+    def _stream_xml_content(self, nfo_data: NFOData, output_path: Path) -> None:
         """
-        Convert dictionary data to XML elements.
+        Write the XML for NFO data as UTF-8 directly into a file.
+        
+        Parts are encoded and written through a large write buffer in
+        batches while the XML is generated, so neither the XML string nor
+        its encoded bytes are ever held in memory. They are written to a
+        temporary file that replaces the target only once the XML is
+        complete.
+        
+        Args:
+            nfo_data: NFOData object to convert
+            output_path: Path to write to
+        """
+        with self._open_replacement(output_path, 'wb', buffering=_STREAM_BUFFER_SIZE) as f:
+            builder = _StringXMLBuilder(f)
+            self._build_xml(nfo_data, builder)
+            builder.flush()
+    
+    def _dict_to_xml(
+        self,
+        data: Dict[str, Any],
+        tag: str,
+        builder: '_StringXMLBuilder',
+        indent: str,
+        attributes: Optional[Dict[str, str]] = None,
+        scope: FrozenSet[str] = frozenset()
+    ) -> None:
+        """
+        Append the XML for an element built from dictionary data.
+        
+        '@' keys become attributes and '#text' the element text; all other
+        keys become child elements. With pretty printing, whitespace-only
+        text of an element with children is replaced by indentation, as
+        ElementTree.indent() does.
         
         Args:
             data: Dictionary data to convert
-            parent: Parent XML element to add children to
+            tag: Element name
+            builder: Builder receiving the XML parts
+            indent: Newline and indentation before the closing tag of a
+                pretty printed element with children ('' if not pretty)
+            attributes: Attributes preceding those in data (e.g. namespaces)
+            scope: Namespace URIs declared by the element's ancestors
         """
+        parts = builder.parts
+        if attributes is None:
+            attributes = {}
+        text = None
+        children = []
+        qualified = tag.startswith('{')
+        
         for key, value in data.items():
-            if key.startswith('@'):
+            kind = _classify_key(key)
+            if not kind:
+                # Handle child elements
+                self._create_child_element(key, value, children)
+            elif kind == _KEY_ATTRIBUTE:
                 # Handle attributes
                 attr_name = key[1:]  # Remove @ prefix
-                parent.set(attr_name, str(value))
-            elif key == '#text':
+                attributes[attr_name] = str(value)
+            elif kind == _KEY_TEXT:
                 # Handle element text content
-                parent.text = str(value)
+                text = str(value) or None
             else:
-                # Handle child elements
-                self._create_child_element(key, value, parent)
+                # Names in {uri}local form are given prefixes below
+                qualified = True
+                if kind & _KEY_ATTRIBUTE:
+                    attributes[key[1:]] = str(value)
+                else:
+                    self._create_child_element(key, value, children)
+        
+        if qualified:
+            tag, attributes, children, scope = self._qualify_names(
+                tag, attributes, children, builder, scope
+            )
+        
+        start = f'<{tag}'
+        if attributes:
+            start += ''.join([
+                f' {name}="{_escape_xml_attribute(value)}"'
+                for name, value in attributes.items()
+            ])
+        
+        if not children:
+            if text is None:
+                parts.append(f'{start}/>')
+            else:
+                parts.append(f'{start}>{_escape_xml_text(text)}</{tag}>')
+            return
+        
+        child_indent = indent + '  ' if self.pretty_print else ''
+        
+        if text is None or (child_indent and not text.strip()):
+            parts.append(f'{start}>')
+            separator = child_indent
+        else:
+            # Mixed content: the first child follows the text directly
+            parts.append(f'{start}>{_escape_xml_text(text)}')
+            separator = ''
+        
+        for key, node in children:
+            if node is None:
+                parts.append(f'{separator}<{key}/>')
+            elif type(node) is str:
+                parts.append(f'{separator}<{key}>{_escape_xml_text(node)}</{key}>')
+            else:
+                if separator:
+                    parts.append(separator)
+                self._dict_to_xml(node, key, builder, child_indent, None, scope)
+            separator = child_indent
+        
+        parts.append(f'{indent}</{tag}>')
+        
+        if len(parts) >= builder.flush_size:
+            builder.flush()
+    
+    def _qualify_names(
+        self,
+        tag: str,
+        attributes: Dict[str, str],
+        children: List[Tuple[str, Union[Dict[str, Any], str, None]]],
+        builder: '_StringXMLBuilder',
+        scope: FrozenSet[str]
+    ) -> Tuple[str, Dict[str, str], List[Tuple[str, Union[Dict[str, Any], str, None]]], FrozenSet[str]]:
+        """
+        Replace the {uri}local names of an element and its children with
+        prefixed names, as ElementTree serialization does.
+        
+        Namespaces not declared by an ancestor are declared on the element,
+        ahead of its other attributes, which puts them in scope for all of
+        its descendants.
+        
+        Args:
+            tag: Element name
+            attributes: Attributes of the element
+            children: (name, content) pairs of the child elements
+            builder: Builder holding the document's namespace prefixes
+            scope: Namespace URIs declared by the element's ancestors
+            
+        Returns:
+            Tuple of the element name, attributes and children with prefixed
+            names, and the namespace URIs in scope for the children
+        """
+        declarations: Dict[str, str] = {}
+        
+        def qualify(name: str) -> str:
+            if not name.startswith('{'):
+                return name
+            uri, _, local = name[1:].partition('}')
+            prefix = builder.prefix_for(uri)
+            if uri not in scope:
+                declarations[f'xmlns:{prefix}'] = uri
+            return f'{prefix}:{local}'
+        
+        tag = qualify(tag)
+        attributes = {qualify(name): value for name, value in attributes.items()}
+        children = [(qualify(key), node) for key, node in children]
+        
+        if declarations:
+            attributes = {**declarations, **attributes}
+            scope = scope.union(declarations.values())
+        return tag, attributes, children, scope
     
-    def _create_child_element(self, key: str, value: Any, parent: ET.Element) -> None:
+    def _create_child_element(
+        self,
+        key: str,
+        value: Any,
+        children: List[Tuple[str, Union[Dict[str, Any], str, None]]]
+    ) -> None:
         """
-        Create child XML elements from key-value pairs.
+        Collect child XML elements from key-value pairs.
         
         Args:
             key: Element name
             value: Element value or nested data
-            parent: Parent XML element
+            children: List of (name, content) pairs to append to, where
+                content is a dictionary, the element text, or None for an
+                empty element
         """
         if isinstance(value, dict):
             # Nested dictionary - create element with children
-            child = ET.SubElement(parent, key)
-            self._dict_to_xml(value, child)
+            children.append((key, value))
             
         elif isinstance(value, list):
             # List of values - create multiple elements with same name
             for item in value:
-                child = ET.SubElement(parent, key)
                 if isinstance(item, dict):
-                    self._dict_to_xml(item, child)
+                    children.append((key, item))
                 else:
-                    child.text = str(item)
+                    children.append((key, str(item) or None))
                     
         else:
-            # Simple value - create element with text content
-            child = ET.SubElement(parent, key)
-            child.text = str(value)
+            # Simple value - create element with text content; empty text
+            # makes an empty element
+            children.append((key, str(value) or None))
     
-    def _pretty_print_xml(self, xml_str: str) -> str:
+    def _serialize_xml(self, root: ET.Element) -> str:
         """
-        Pretty print XML with proper indentation.
+        Serialize an XML tree with the configured indentation and declaration.
+        
+        Indentation is added to the tree itself with ET.indent(), so the XML
+        is serialized once instead of being re-parsed into a DOM to pretty
+        print it.
         
         Args:
-            xml_str: Raw XML string
+            root: Root XML element
             
         Returns:
-            Pretty formatted XML string
+            XML content as string
         """
-        try:
-            # Parse and pretty print using minidom
-            dom = minidom.parseString(xml_str)
-            pretty_xml = dom.toprettyxml(indent="  ", encoding=None)
-            
-            # Remove extra blank lines and the extra XML declaration
-            lines = [line for line in pretty_xml.split('\n') if line.strip()]
-            
-            # Remove the minidom XML declaration if we're adding our own
-            if self.xml_declaration and lines and lines[0].startswith('<?xml'):
-                lines = lines[1:]
-            
-            return '\n'.join(lines)
-            
-        except Exception:
-            # If pretty printing fails, return original
-            return xml_str
+        # Pretty print if requested
+        if self.pretty_print:
+            ET.indent(root, space="  ")
+        
+        # Generate XML string
+        xml_str = ET.tostring(root, encoding='unicode', method='xml')
+        
+        # Add XML declaration if requested
+        if self.xml_declaration:
+            xml_str = self._xml_declaration() + xml_str
+        
+        return xml_str
+    
+    def _xml_declaration(self) -> str:
+        """
+        Get the XML declaration line for the configured encoding.
+        
+        Returns:
+            XML declaration followed by a newline
+        """
+        return f'<?xml version="1.0" encoding="{self.encoding}"?>\n'
     
     def update_existing_xml(
         self, 
@@ -283,25 +660,16 @@ class XMLNFOWriter(BaseNFOWriter):
         
         # Try to update existing XML structure
         try:
-            # Read original XML file
-            original_content = self._read_original_xml(nfo_data.file_path)
-            root = ET.fromstring(original_content)
+            # Parse original XML file
+            root = self._parse_original_xml(nfo_data.file_path)
             
-            # Update fields in XML tree
+            # Update fields in XML tree, resolving each shared path prefix once
+            resolved = {}
             for field_path, new_value in field_updates.items():
-                self._update_xml_field(root, field_path, new_value)
+                self._update_xml_field(root, field_path, new_value, resolved)
             
             # Generate updated XML
-            xml_str = ET.tostring(root, encoding='unicode', method='xml')
-            
-            if self.xml_declaration:
-                declaration = f'<?xml version="1.0" encoding="{self.encoding}"?>\n'
-                xml_str = declaration + xml_str
-            
-            if self.pretty_print:
-                xml_str = self._pretty_print_xml(xml_str)
-            
-            return xml_str
+            return self._serialize_xml(root)
             
         except Exception:
             # Fall back to regenerating entire XML
@@ -314,25 +682,36 @@ class XMLNFOWriter(BaseNFOWriter):
             )
             return self._generate_xml_content(updated_data)
     
-    def _read_original_xml(self, file_path: Path) -> str:
+    def _parse_original_xml(self, file_path: Path) -> ET.Element:
         """
-        Read original XML file content.
+        Parse the original XML file into an element tree.
+        
+        The file is parsed straight from its bytes, which feeds it to the
+        parser in chunks and honors its encoding declaration, so the content
+        is never decoded or held as one string next to the tree. Files that
+        do not parse that way (e.g. Latin-1 text without a declaration) are
+        parsed again as Latin-1.
         
         Args:
             file_path: Path to XML file
             
         Returns:
-            XML content as string
+            Root XML element
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except UnicodeDecodeError:
+            return ET.parse(file_path).getroot()
+        except ET.ParseError:
             # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                return f.read()
+            parser = ET.XMLParser(encoding='iso-8859-1')
+            return ET.parse(file_path, parser).getroot()
     
-    def _update_xml_field(self, root: ET.Element, field_path: str, new_value: Any) -> None:
+    def _update_xml_field(
+        self,
+        root: ET.Element,
+        field_path: str,
+        new_value: Any,
+        resolved: Optional[Dict[Tuple[str, ...], ET.Element]] = None
+    ) -> None:
         """
         Update a specific field in XML tree.
         
@@ -340,28 +719,29 @@ class XMLNFOWriter(BaseNFOWriter):
             root: Root XML element
             field_path: Dot-separated path to field (e.g., "movie.title")
             new_value: New value to set
+            resolved: Optional cache of elements by path, shared by updates
+                of the same tree so common prefixes are only looked up once
         """
-        path_parts = field_path.split('.')
+        if resolved is None:
+            resolved = {}
+        path_parts = _split_field_path(field_path)
         current = root
         
-        # Navigate to the target element
-        for part in path_parts[:-1]:
-            found = current.find(part)
-            if found is not None:
-                current = found
-            else:
-                # Create missing intermediate elements
-                current = ET.SubElement(current, part)
-        
-        # Update or create the final element
-        final_element_name = path_parts[-1]
-        target = current.find(final_element_name)
+        # Navigate to the target element, then update or create it. find()
+        # returns the first matching child, which elements appended later
+        # never replace, so a resolved path stays valid for the whole tree
+        for end in range(1, len(path_parts) + 1):
+            prefix = path_parts[:end]
+            found = resolved.get(prefix)
+            if found is None:
+                found = current.find(prefix[-1])
+                if found is None:
+                    # Create missing elements
+                    found = ET.SubElement(current, prefix[-1])
+                resolved[prefix] = found
+            current = found
         
-        if target is not None:
-            target.text = str(new_value)
-        else:
-            new_element = ET.SubElement(current, final_element_name)
-            new_element.text = str(new_value)
+        current.text = str(new_value)
     
     def validate_xml_output(self, xml_content: str) -> Dict[str, Any]:
         """
@@ -388,16 +768,23 @@ class XMLNFOWriter(BaseNFOWriter):
             # Try to parse XML
             root = ET.fromstring(xml_content)
             validation_result['is_valid'] = True
-            validation_result['element_count'] = len(list(root.iter()))
+            
+            # Count elements and empty elements in one walk of the tree
+            element_count = 0
+            empty_count = 0
+            for elem in root.iter():
+                element_count += 1
+                if not elem.text and not elem.tail and not elem.attrib and not len(elem):
+                    empty_count += 1
+            validation_result['element_count'] = element_count
             
             # Check for common issues
             if not root.tag:
                 validation_result['warnings'].append("Root element has no tag name")
             
             # Check for empty elements
-            empty_elements = [elem for elem in root.iter() if not elem.text and not elem.tail and not elem.attrib and not list(elem)]
-            if empty_elements:
-                validation_result['warnings'].append(f"Found {len(empty_elements)} empty elements")
+            if empty_count:
+                validation_result['warnings'].append(f"Found {empty_count} empty elements")
             
         except ET.ParseError as e:
             validation_result['errors'].append(f"XML parsing error: {str(e)}")
@@ -11,6 +11,7 @@ Author: NFO Editor Team
 import unittest
 import tempfile
 import json
+import pickle
 from pathlib import Path
 import sys
 
@@ -94,6 +95,18 @@ class TestNFOData(unittest.TestCase):
         self.assertIn('nested.field2', all_fields)
         self.assertEqual(all_fields['title'], 'Test Movie')
         self.assertEqual(all_fields['nested.field1'], 'value1')
+    
+    def test_direct_data_changes(self):
+        """Test field access reflects changes made directly to data."""
+        self.nfo_data.get_all_fields()
+        self.nfo_data.data['title'] = 'Changed'
+        self.nfo_data.data['nested']['field1'] = 'changed'
+        self.assertEqual(self.nfo_data.get_field('title'), 'Changed')
+        self.assertEqual(self.nfo_data.get_field('nested.field1'), 'changed')
+        
+        self.nfo_data.data = {'other': 1}
+        self.assertFalse(self.nfo_data.has_field('title'))
+        self.assertEqual(self.nfo_data.get_all_fields(), {'other': 1})
 
 
 class TestParsers(unittest.TestCase):
@@ -123,6 +136,23 @@ class TestParsers(unittest.TestCase):
             
             Path(f.name).unlink()  # Clean up
     
+    def test_xml_parser_structure(self):
+        """Test XML conversion of repeated, attributed and wrapper elements."""
+        parser = XMLNFOParser()
+        self.assertEqual(
+            parser._assemble_value('', {}, {'streamdetails': {'codec': 'h264'}}),
+            {'codec': 'h264'}
+        )
+        self.assertEqual(
+            parser._assemble_value('', {}, {'a': {'b': 1}, 'c': 2}),
+            {'a': {'b': 1}, 'c': 2}
+        )
+        self.assertEqual(
+            parser._assemble_value(' 8.5 ', {'max': '10'}, {'votes': 100}),
+            {'#text': 8.5, '@max': 10, 'votes': 100}
+        )
+        self.assertEqual(parser._assemble_value(None, {}, {}), {})
+    
     def test_json_parser(self):
         """Test JSON parser with sample data."""
         json_data = {
@@ -146,6 +176,30 @@ class TestParsers(unittest.TestCase):
             
             Path(f.name).unlink()  # Clean up
     
+    def test_json_parser_comments(self):
+        """Test JSON parser with comments in relaxed mode."""
+        parser = JSONNFOParser()
+        content = '''{
+    // Line comment
+    "title": "Test // Movie", /* block
+    comment */ "url": "http://example.com/*path*/",
+    "year": 2024 // trailing
+}'''
+        data = parser._parse_json_content(content)
+        self.assertEqual(data['title'], 'Test // Movie')
+        self.assertEqual(data['url'], 'http://example.com/*path*/')
+        self.assertEqual(data['year'], 2024)
+
+    def test_json_parser_utf16(self):
+        """Test JSON parser accepts UTF-16 files with a byte order mark."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'movie.nfo'
+            path.write_bytes('{"title": "Café", "year": 2024}'.encode('utf-16'))
+
+            parser = JSONNFOParser()
+            self.assertTrue(parser.can_parse(path))
+            self.assertEqual(parser.parse(path).data, {'title': 'Café', 'year': 2024})
+
     def test_text_parser(self):
         """Test text parser with sample data."""
         text_content = '''Title: Test Movie
@@ -168,6 +222,243 @@ Plot: A test movie for demonstrating the NFO editor library.'''
             
             Path(f.name).unlink()  # Clean up
 
+    def test_text_parser_ini_defaults(self):
+        """Test [DEFAULT] options are merged into sections as configparser does."""
+        content = (
+            '[DEFAULT]\nsource = web\nquality = hd\n\n'
+            '[Movie]\nTitle = Test Movie\nquality = 4k\n\n'
+            '[Audio]\ncodec = aac\n'
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'movie.nfo'
+            path.write_text(content)
+
+            nfo_data = TextNFOParser().parse(path)
+            self.assertEqual(nfo_data.data, {
+                'movie': {'title': 'Test Movie', 'quality': '4k', 'source': 'web'},
+                'audio': {'codec': 'aac', 'source': 'web', 'quality': 'hd'}
+            })
+
+    def test_text_parser_extensions(self):
+        """Test text parser extension check is case-insensitive."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            content = 'Title: Test Movie\nYear: 2024'
+
+            (temp_dir / 'movie.NFO').write_text(content)
+            (temp_dir / 'movie.json').write_text(content)
+
+            parser = TextNFOParser()
+            self.assertTrue(parser.can_parse(temp_dir / 'movie.NFO'))
+            self.assertFalse(parser.can_parse(temp_dir / 'movie.json'))
+
+    def test_xml_parser_extensions(self):
+        """Test XML parser extension check is case-insensitive."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            content = '<movie><title>Test Movie</title></movie>'
+
+            (temp_dir / 'movie.XML').write_text(content)
+            (temp_dir / 'movie.txt').write_text(content)
+
+            parser = XMLNFOParser()
+            self.assertEqual(parser._supported_ext_set, frozenset({'.xml', '.nfo'}))
+            self.assertTrue(parser.can_parse(temp_dir / 'movie.XML'))
+            self.assertFalse(parser.can_parse(temp_dir / 'movie.txt'))
+
+
+class TestExceptions(unittest.TestCase):
+    """Test NFO exception behaviour."""
+    
+    def test_exception_pickling(self):
+        """Test exception attributes survive pickling."""
+        error = NFOParseError(
+            "Invalid XML", file_path='/test/movie.nfo',
+            format_attempted='XML', parse_details='line 1', extra='context'
+        )
+        restored = pickle.loads(pickle.dumps(error))
+        
+        self.assertIsInstance(restored, NFOParseError)
+        self.assertEqual(str(restored), str(error))
+        self.assertEqual(restored.format_attempted, 'XML')
+        self.assertEqual(restored.parse_details, 'line 1')
+        self.assertEqual(restored.details, {'extra': 'context'})
+
+
+class TestWriters(unittest.TestCase):
+    """Test NFO writer functionality."""
+    
+    def test_json_update_fields(self):
+        """Test JSON field updates leave the original data untouched."""
+        nfo_data = NFOData(
+            file_path=Path('movie.json'), format_type='json',
+            data={'movie': {'title': 'Old', 'year': 2020}, 'rating': 7}
+        )
+        content = JSONNFOWriter().update_json_fields(
+            nfo_data, {'movie.title': 'New', 'movie.genre.main': 'Drama'}
+        )
+        
+        self.assertEqual(json.loads(content)['movie'], {
+            'title': 'New', 'year': 2020, 'genre': {'main': 'Drama'}
+        })
+        self.assertEqual(nfo_data.data['movie'], {'title': 'Old', 'year': 2020})
+    
+    def test_text_summary_max_fields(self):
+        """Test summaries filled by priority fields stop at max_fields."""
+        nfo_data = NFOData(
+            file_path=Path('movie.nfo'), format_type='text',
+            data={'title': 'Movie', 'year': 2020, 'genre': 'Drama', 'other': 'x'}
+        )
+        summary = TextNFOWriter().create_summary_text(nfo_data, max_fields=2)
+        
+        self.assertEqual(summary.splitlines(), ['Title: Movie', 'Year: 2020'])
+    
+    def test_xml_pretty_output(self):
+        """Test pretty-printed XML keeps the configured declaration."""
+        nfo_data = NFOData(
+            file_path=Path('movie.nfo'), format_type='xml',
+            data={'title': 'Movie', 'actor': {'name': 'A'}}
+        )
+        content = XMLNFOWriter(root_element='movie')._generate_xml_content(nfo_data)
+        
+        self.assertEqual(content.splitlines(), [
+            '<?xml version="1.0" encoding="utf-8"?>',
+            '<movie>',
+            '  <title>Movie</title>',
+            '  <actor>',
+            '    <name>A</name>',
+            '  </actor>',
+            '</movie>'
+        ])
+        
+        content = XMLNFOWriter(xml_declaration=False)._generate_xml_content(nfo_data)
+        self.assertTrue(content.startswith('<nfo>'))
+    
+    def test_xml_escaped_output(self):
+        """Test XML text and attributes are escaped and invalid characters dropped."""
+        nfo_data = NFOData(
+            file_path=Path('movie.nfo'), format_type='xml',
+            data={'title': 'Tom & Jerry <1>\x01', 'id': {'@type': 'a"b', '#text': 'tt1'}, 'tag': ''}
+        )
+        writer = XMLNFOWriter(xml_declaration=False, pretty_print=False)
+        content = writer._generate_xml_content(nfo_data)
+        
+        self.assertEqual(
+            content,
+            '<nfo><title>Tom &amp; Jerry &lt;1&gt;</title><id type="a&quot;b">tt1</id><tag/></nfo>'
+        )
+
+    def test_xml_namespaced_round_trip(self):
+        """Test namespaced XML is written with prefixes and parses back the same."""
+        xml_content = (
+            '<movie xmlns="http://kodi.tv/nfo" xmlns:x="http://example.com/x">'
+            '<title>Movie</title><x:extra x:id="5">Value</x:extra></movie>'
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = Path(temp_dir) / 'movie.nfo'
+            source.write_text(xml_content, encoding='utf-8')
+
+            for preserve_namespaces in (False, True):
+                parser = XMLNFOParser(preserve_namespaces=preserve_namespaces)
+                nfo_data = parser.parse(source)
+                output = XMLNFOWriter().write(
+                    nfo_data, Path(temp_dir) / 'out.nfo', create_backup=False
+                )
+                written = parser.parse(output)
+
+                self.assertEqual(written.data, nfo_data.data)
+                self.assertEqual(written.metadata['root_element'], '{http://kodi.tv/nfo}movie')
+
+    def test_write_many_threaded(self):
+        """Test writing several files through the thread pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            items = [
+                (NFOData(file_path=Path(temp_dir) / f'{i}.nfo', format_type='text',
+                         data={'title': f'Movie {i}'}), None)
+                for i in range(3)
+            ]
+            paths = TextNFOWriter().write_many_threaded(items, create_backup=False)
+            
+            self.assertEqual(paths, [Path(temp_dir) / f'{i}.nfo' for i in range(3)])
+            for i, path in enumerate(paths):
+                self.assertIn(f'Title: Movie {i}', path.read_text(encoding='utf-8'))
+    
+    def test_json_stream_failure_keeps_file(self):
+        """Test a failed streamed JSON write leaves the existing file untouched."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / 'movie.json'
+            target.write_text('{"title": "Original"}', encoding='utf-8')
+            nfo_data = NFOData(
+                file_path=target, format_type='json',
+                data={'title': 'New', 'cast': {'b': 1, 2: 'mixed key types'}}
+            )
+
+            with self.assertRaises(NFOFormatError):
+                JSONNFOWriter(sort_keys=True)._stream_json_content(nfo_data, target)
+
+            self.assertEqual(target.read_text(encoding='utf-8'), '{"title": "Original"}')
+            self.assertEqual([path.name for path in Path(temp_dir).iterdir()], ['movie.json'])
+
+    def test_json_flat_document(self):
+        """Test flat documents are written exactly as json.dumps would."""
+        data = {'title': 'Café', 'year': 2020, 'rating': 7.5, 'seen': True, 'tag': None}
+        nfo_data = NFOData(file_path=Path('movie.json'), format_type='json', data=data)
+        writer = JSONNFOWriter(indent=4, sort_keys=True, ensure_ascii=True)
+        
+        for _ in range(2):
+            self.assertEqual(
+                writer._generate_json_content(nfo_data),
+                json.dumps(data, indent=4, sort_keys=True, ensure_ascii=True)
+            )
+
+    def test_json_exponent_floats(self):
+        """Test floats in exponent notation are spelled as json.dumps does."""
+        data = {'big': 1e16, 'huge': 1.5e300, 'tiny': 1e-7, 'rating': [7.5, 2e-05]}
+        nfo_data = NFOData(file_path=Path('movie.json'), format_type='json', data=data)
+
+        for writer, kwargs in (
+            (JSONNFOWriter(), {'indent': 2}),
+            (JSONNFOWriter(indent=None, separators=(',', ':')), {'separators': (',', ':')})
+        ):
+            self.assertEqual(
+                writer._generate_json_content(nfo_data),
+                json.dumps(data, ensure_ascii=False, **kwargs)
+            )
+
+    def test_json_validate_output(self):
+        """Test JSON validation structure statistics."""
+        data = {
+            'title': '', 'year': 0, 'plot': None,
+            'cast': [{'name': 'A', 'roles': []}], 'tags': {}
+        }
+        content = json.dumps(data)
+        result = JSONNFOWriter().validate_json_output(content)
+        
+        self.assertTrue(result['is_valid'])
+        self.assertEqual(result['structure_info'], {
+            'type': 'dict', 'total_keys': 7, 'max_depth': 3,
+            'has_arrays': True, 'empty_values': 4
+        })
+        self.assertIn("Contains empty values", result['warnings'])
+        self.assertEqual(
+            JSONNFOWriter().validate_json_output(content, source_data=data), result
+        )
+        
+        # Brackets inside strings are not arrays
+        result = JSONNFOWriter().validate_json_output('{"title": "[1080p]"}')
+        self.assertFalse(result['structure_info']['has_arrays'])
+    
+    def test_text_update_fields(self):
+        """Test text field updates leave the original nested data untouched."""
+        nfo_data = NFOData(
+            file_path=Path('movie.nfo'), format_type='text',
+            data={'movie': {'title': 'Old', 'year': 2020}, 'other': {'note': 'x'}}
+        )
+        content = TextNFOWriter().update_text_fields(nfo_data, {'movie.title': 'New'})
+        
+        self.assertIn('Title: New', content)
+        self.assertEqual(nfo_data.data['movie'], {'title': 'Old', 'year': 2020})
+
 
 class TestFormatDetection(unittest.TestCase):
     """Test format detection functionality."""
@@ -228,6 +519,34 @@ class TestScanning(unittest.TestCase):
             self.assertGreater(result.total_files_scanned, 0)
             self.assertEqual(result.directories_scanned, 1)
 
+    def test_scanner_pattern_and_excludes(self):
+        """Test glob filtering and exclude patterns."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+
+            (temp_dir / 'Movie1.NFO').write_text('Title: Movie 1')
+            (temp_dir / 'show.nfo').write_text('Title: Show')
+            (temp_dir / 'notes.txt').write_text('not an nfo')
+            (temp_dir / 'old.nfo.bak').write_text('Title: Old')
+            (temp_dir / '.git').mkdir()
+            (temp_dir / '.git' / 'hidden.nfo').write_text('Title: Hidden')
+
+            scanner = NFOScanner()
+            result = scanner.scan_directories(temp_dir)
+            self.assertEqual(
+                sorted(p.name for p in result.nfo_files), ['Movie1.NFO', 'show.nfo']
+            )
+            self.assertEqual(result.directories_scanned, 1)
+
+            result = scanner.scan_directories(temp_dir, pattern='movie*')
+            self.assertEqual([p.name for p in result.nfo_files], ['Movie1.NFO'])
+
+            # Settings changed after construction apply to the next scan
+            scanner.exclude_patterns.add('show.nfo')
+            scanner.default_extensions = {'nfo', '.txt'}
+            result = scanner.scan_directories(temp_dir)
+            self.assertEqual([p.name for p in result.nfo_files], ['notes.txt'])
+
 
 class TestConvenienceFunctions(unittest.TestCase):
     """Test convenience functions."""